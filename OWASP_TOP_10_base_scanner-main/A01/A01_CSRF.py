@@ -1,11 +1,12 @@
 # csrf_scanner_class.py
 import requests
-from bs4 import BeautifulSoup
 import re
 from http.cookies import SimpleCookie
 import json, csv, os
 from datetime import datetime
 
+from add_in.html_document import ParsedDocument, parse_document, get_cached_document
+
 # --- 설정 (환경에 맞게 수정) ---
 
 OUTPUT_DIR = "./csrf_reports"
@@ -74,18 +75,20 @@ class CSRFScanner:
 
     # ---------- HTML analysis ----------
     def analyze_html_for_tokens(self, html_text):
-        """ HTML 내에서 CSRF 토큰 후보 추출 """
-        soup = BeautifulSoup(html_text or "", 'html.parser')
+        """ HTML 내에서 CSRF 토큰 후보 추출 (html_text: HTML 문자열 또는 ParsedDocument) """
+        if isinstance(html_text, ParsedDocument):
+            document = html_text
+        else:
+            document = parse_document(html_text or "")
         details = {"forms": [], "meta": [], "js": []}
         found_tokens = []
 
         # form 분석
-        forms = soup.find_all('form')
-        for f in forms:
-            method = (f.get('method') or 'GET').strip().upper()
-            action = f.get('action') or ''
+        for f in document.forms:
+            method = (f["attrs"].get('method') or 'GET').strip().upper()
+            action = f["attrs"].get('action') or ''
             tokens = []
-            for inp in f.find_all('input'):
+            for inp in f["inputs"]:
                 name = (inp.get('name') or '').lower()
                 id_ = (inp.get('id') or '').lower()
                 classes = ' '.join(inp.get('class') or []).lower()
@@ -98,8 +101,7 @@ class CSRFScanner:
             details["forms"].append({"method": method, "action": action, "tokens": tokens})
 
         # meta 태그
-        metas = soup.find_all('meta')
-        for m in metas:
+        for m in document.metas:
             mname = (m.get('name') or '').lower()
             content = m.get('content') or ''
             if 'csrf' in mname or 'token' in mname:
@@ -108,11 +110,7 @@ class CSRFScanner:
                     found_tokens.append(content)
 
         # inline JS heuristic
-        scripts = soup.find_all('script')
-        for s in scripts:
-            text = s.string or s.get_text() or ''
-            if not text.strip():
-                continue
+        for text in document.scripts:
             for pat in JS_TOKEN_PATTERNS:
                 for m in re.finditer(pat, text, flags=re.IGNORECASE):
                     # 가장 마지막 group을 토큰 후보로 취함
@@ -169,12 +167,7 @@ class CSRFScanner:
     # ---------- 대상 감사 (메인) ----------
     def audit_targets(self, base_url, obj_list):
         results = []
-        # 메인 페이지 한 번 미리 조회 (공통 토큰 가능성)
-        main_html = ""
-        if base_url:
-            resp = self._safe_get(base_url)
-            if resp is not None:
-                main_html = resp.text
+        main_document = None  # 메인 페이지 (공통 토큰 가능성), 필요할 때 한 번만 조회
 
         for obj in obj_list:
             if isinstance(obj, dict):
@@ -190,10 +183,19 @@ class CSRFScanner:
             else:
                 full_url = (base_url.rstrip('/') + '/' + path.lstrip('/')) if base_url else path
 
-            # HTML 분석
-            resp = self._safe_get(full_url)
-            html = resp.text if resp is not None else ""
-            analysis = self.analyze_html_for_tokens(html or main_html)
+            # HTML 분석 (크롤러가 파싱해 둔 문서가 있으면 다시 요청/파싱하지 않음)
+            document = get_cached_document(path)
+            if document is None:
+                resp = self._safe_get(full_url)
+                html = resp.text if resp is not None else ""
+                if html:
+                    document = parse_document(html)
+                else:
+                    if main_document is None:
+                        main_resp = self._safe_get(base_url) if base_url else None
+                        main_document = parse_document(main_resp.text if main_resp is not None else "")
+                    document = main_document
+            analysis = self.analyze_html_for_tokens(document)
 
             # header 분석
             header_info = self.analyze_headers(header)
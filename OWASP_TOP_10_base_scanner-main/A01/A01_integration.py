@@ -7,6 +7,7 @@ import os
 
 from A01.A01_CSRF import CSRFScanner
 from add_in.crawl2 import start_crawl2
+from add_in.check_registry import register_checks, check
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 USER_INFO_PATH = os.path.join(PROJECT_ROOT, "etc", "user_info.json")
@@ -15,12 +16,14 @@ def user_info():
     with open(USER_INFO_PATH, "r") as f:
         return json.load(f)
 
+@register_checks()
 class BrokenAccessControl:
     """A01 Broken Access Control 통합 검사 클래스"""
 
     def __init__(self):
         pass
 
+    @check("A01-01", "CSRF 검사", inputs=("obj_list", "config"), cost="medium", kind="network", priority="high")
     def csrf_run(self, obj_list, config):
         """A01-01: CSRF 보호 검사"""
         scanner = CSRFScanner()
@@ -1,4 +1,5 @@
 import re
+import bisect
 import datetime
 import ipaddress
 import logging
@@ -6,6 +7,11 @@ import json
 import os
 import pymysql
 
+from add_in.sast_index import ruleset_version
+from add_in.sast_pool import analyze_sources, SAST_WORKERS
+from add_in.source_lexer import comment_spans, comment_spans_bytes, LEXER_VERSION, LINE_BREAK
+from add_in.mmap_scan import map_file, LineIndex, in_spans
+
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 LOG_PATH = os.path.join(PROJECT_ROOT, "logs", "A02_check_cryptographic.log")
 
@@ -39,16 +45,16 @@ logging.basicConfig(
 #         exit(-1)
 
 class CheckCryptographic:
-    HASH_PATTERNS = {
-        'md5': r"\bmd5\s*\(",
-        'sha1': r"\bsha1\s*\(",
-        'md4': r"\bmd4\s*\(",
-        'md2': r"\bmd2\s*\(",
-        'crc32': r"\bcrc32\s*\(",
-        'des': r"\bdes\s*\(",
-        'rc4': r"\brc4\s*\("
-    }
-    def __init__(self):
+    # 검사할 약한 해시/암호 함수 이름 (결과 순서), 이름(...) 호출 형태만 찾음
+    HASH_NAMES = ['md5', 'sha1', 'md4', 'md2', 'crc32', 'des', 'rc4']
+    # 모든 함수 이름을 하나로 합친 정규식 \b(이름|...)\s*\(, 그룹 1 = 해시 이름
+    # (이름마다 패턴을 named group으로 합치는 것보다 정규식 엔진이 약 5배 빠르게 건너뜀)
+    HASH_REGEX = re.compile(r"\b(" + "|".join(map(re.escape, HASH_NAMES)) + r")\s*\(", re.IGNORECASE)
+    HASH_REGEX_BYTES = re.compile(HASH_REGEX.pattern.encode(), re.IGNORECASE)  # 큰 파일(mmap) 검사용
+
+    def __init__(self, index=None, workers=SAST_WORKERS):
+        self.index = index  # SastIndex (None이면 모든 파일을 매번 검사)
+        self.workers = workers  # 정적 분석 프로세스 수 (1이면 현재 프로세스에서 검사)
         self.KEYWORD_FILE = os.path.join(PROJECT_ROOT, "etc", "A02_crytogaphic_keywords.txt")
         self.all_found_vulnerabilities = set()  # 중복 제거를 위해 set 사용
 
@@ -77,47 +83,96 @@ class CheckCryptographic:
 
 
     def find_hash_in_code(self, code: str, filename) -> list[dict]:
-        """코드 내에서 해시 패턴을 찾아 반환하는 함수"""
+        """
+        코드 내에서 해시 패턴을 찾아 반환하는 함수
+        - 합친 정규식으로 파일을 한 번만 검사하고, 주석 안의 결과는 제외
+        - 줄 번호는 결과가 있을 때만 줄 시작 위치 목록(bisect)으로 계산
+        """
+
+        found = {}  # 해시 이름 → 줄 번호 목록
+        line_texts = {}  # 줄 번호 → 줄 내용 (결과가 있는 줄만)
+        comments = None
+        line_starts = None
+
+        for match in self.HASH_REGEX.finditer(code):
+            position = match.start()
+
+            # 주석 안이면 건너뛰기 (주석 위치는 처음 결과가 나왔을 때 파일 언어 기준으로 계산)
+            if comments is None:
+                comments = comment_spans(code, filename)
+                comment_starts = [start for start, _ in comments]
+            if in_spans(comments, comment_starts, position):
+                continue
+
+            if line_starts is None:
+                line_starts = [0] + [m.end() for m in LINE_BREAK.finditer(code)]
+            line_num = bisect.bisect_right(line_starts, position)
+
+            line_nums = found.setdefault(match.group(1).lower(), [])
+            if not line_nums or line_nums[-1] != line_num:
+                line_nums.append(line_num)
+            if line_num not in line_texts:
+                end = line_starts[line_num] if line_num < len(line_starts) else len(code)
+                line_texts[line_num] = code[line_starts[line_num - 1]:end].strip()
+
+        return self.hash_results(found, line_texts, filename)
+
+    def find_hash_in_file(self, path) -> list[dict]:
+        """
+        큰 파일용: 파일을 읽지 않고 mmap 위에서 바이트 정규식으로 해시 패턴 검사
+        줄 번호와 줄 내용은 결과가 나온 위치만 계산 (메모리는 결과 수에 비례)
+        """
+        found = {}
+        line_texts = {}
+
+        with map_file(path) as buffer:
+            if buffer is None:
+                return []
+
+            lines = LineIndex(buffer)
+            comments = None
 
+            for match in self.HASH_REGEX_BYTES.finditer(buffer):
+                position = match.start()
+
+                if comments is None:
+                    comments = comment_spans_bytes(buffer, path)
+                    comment_starts = [start for start, _ in comments]
+                if in_spans(comments, comment_starts, position):
+                    continue
+
+                line_num, line_start = lines.locate(position)
+
+                line_nums = found.setdefault(match.group(1).decode().lower(), [])
+                if not line_nums or line_nums[-1] != line_num:
+                    line_nums.append(line_num)
+                if line_num not in line_texts:
+                    line = buffer[line_start:lines.line_end(position)[0]]
+                    line_texts[line_num] = line.decode("utf-8", errors="ignore").strip()
+
+        return self.hash_results(found, line_texts, path)
+
+    def hash_results(self, found, line_texts, filename):
+        """해시 이름별 줄 번호 → 결과 목록 (HASH_NAMES 순서)"""
         vulnerability_hash = []  # 초기화
 
-        for hash_name, pattern in self.HASH_PATTERNS.items():
-            line_nums = []
-            if re.search(pattern, code, re.IGNORECASE):
-                self.all_found_vulnerabilities.add(hash_name)  # 전체 리스트에 추가
-                print(f"\n🔴 Found vulnerable hash '{hash_name}' in file: {filename}")
-
-                    # 각 줄을 검사해서 정확한 위치 찾기 (주석 제외)
-                for line_num, line in enumerate(code.splitlines(), 1):
-                        # 주석 처리된 줄 건너뛰기
-                        stripped_line = line.strip()
-                        if (stripped_line.startswith('//') or 
-                            stripped_line.startswith('#') or 
-                            stripped_line.startswith('/*') or
-                            stripped_line.startswith('*') or
-                            stripped_line.startswith('<!--')):
-                            continue
-                        
-                        # 여러 줄 주석 내부인지 확인 (/* ... */ 블록)
-                        if '/*' in line and '*/' in line:
-                            before_comment = line.split('/*')[0]
-                            after_comment = line.split('*/')[-1] if '*/' in line else ''
-                            line_to_check = before_comment + after_comment
-                        else:
-                            line_to_check = line
-                        
-                        if re.search(pattern, line_to_check, re.IGNORECASE):
-                            print(f"  📍 Line {line_num}: {line.strip()}")
-                            line_nums.append(line_num)
-
-                vulnerability_hash.append(
-                    {
-                        "filename": filename,
-                        "hash": hash_name,
-                        "pattern": pattern,
-                        "lines": line_nums
-                    }
-                )
+        for hash_name in self.HASH_NAMES:
+            line_nums = found.get(hash_name)
+            if not line_nums:
+                continue
+
+            self.all_found_vulnerabilities.add(hash_name)  # 전체 리스트에 추가
+            print(f"\n🔴 Found vulnerable hash '{hash_name}' in file: {filename}")
+            for line_num in line_nums:
+                print(f"  📍 Line {line_num}: {line_texts[line_num]}")
+
+            vulnerability_hash.append(
+                {
+                    "filename": filename,
+                    "hash": hash_name,
+                    "lines": line_nums
+                }
+            )
 
         return vulnerability_hash
 
@@ -131,12 +186,16 @@ class CheckCryptographic:
         """파일에서 해시 패턴을 찾아 반환하는 함수"""
         print("scan_file_for_hashes")
         vulnerability_files = []  # 초기화 
-        
-        for source in source_files:
-            code = source.get("content", "")
-            filename = source.get("path", "Unknown file")
 
-            vulnerability_files.extend(self.find_hash_in_code(code, filename))
+        # 변경되지 않은 파일은 인덱스 결과 사용, 파일이 많으면 프로세스 풀로 나눠서 검사
+        all_found = analyze_sources(source_files, find_hashes, self.index, "A02_check_cryptographic",
+                                    ruleset_version([self.HASH_REGEX.pattern, LEXER_VERSION]), self.workers,
+                                    analyze_large=find_hashes_in_file)
+
+        for found in all_found:
+            for item in found:
+                self.all_found_vulnerabilities.add(item["hash"])
+            vulnerability_files.extend(found)
 
         return vulnerability_files
 
@@ -277,6 +336,16 @@ class CheckCryptographic:
         # conn.close()
 
 
+def find_hashes(code, filename):
+    """파일 1개 해시 패턴 검사 (정적 분석 작업 프로세스에서 호출)"""
+    return CheckCryptographic(workers=1).find_hash_in_code(code, filename or "Unknown file")
+
+
+def find_hashes_in_file(path):
+    """큰 파일 1개 해시 패턴 검사 (mmap)"""
+    return CheckCryptographic(workers=1).find_hash_in_file(path)
+
+
 if __name__ == "__main__":
 
     obj = CheckCryptographic()
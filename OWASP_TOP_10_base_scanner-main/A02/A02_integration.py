@@ -7,6 +7,9 @@ import os
 
 from A02.A02_check_cryptographic import CheckCryptographic
 from A02.A02_check_https import ProtocolHandler
+from add_in.data_management import load_source_files
+from add_in.sast_pool import SAST_WORKERS
+from add_in.check_registry import register_checks, check
 
 # 프로젝트 루트 경로 설정
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -16,22 +19,28 @@ def load_data():
     """manage_data.json에서 프로젝트 파일들 로드"""
     try:
         with open(MANAGE_DATA, "r", encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
+        data["source_files"] = load_source_files(data.get("source_files", []))
+        return data
     except FileNotFoundError:
         print("⚠️ manage_data.json이 없습니다. main_test.py를 먼저 실행하세요.")
         return {"source_files": []}
 
+@register_checks(options=("index", "workers"))
 class CryptographicFailures:
     """A02 Cryptographic Failures 통합 검사 클래스"""
 
-    def __init__(self):
-        pass
+    def __init__(self, index=None, workers=SAST_WORKERS):
+        self.index = index  # 정적 분석 인덱스 (add_in.sast_index.SastIndex)
+        self.workers = workers  # 정적 분석 프로세스 수
 
+    @check("A02-01", "취약한 암호화 알고리즘 검사", inputs=("source_files",), cost="medium", kind="static", priority="high")
     def check_cryptographic_run(self, source_files):
         """A02-01: 취약한 암호화 알고리즘 검사"""
-        checker = CheckCryptographic()
+        checker = CheckCryptographic(index=self.index, workers=self.workers)
         return checker.run(source_files)
 
+    @check("A02-02", "HTTPS 보안 검사", inputs=("web_url",), cost="light", kind="network")
     def check_https_run(self, url):
         """A02-02: HTTPS 보안 검사"""
         checker = ProtocolHandler()
@@ -1,7 +1,14 @@
-import re
+import threading
+
+from A03.A03_rule_engine import RuleEngine
+from add_in.sast_index import ruleset_version
+from add_in.sast_pool import analyze_sources, SAST_WORKERS
+from add_in.source_lexer import LEXER_VERSION
 
 class InjectionPatterns:
-    def __init__(self):
+    def __init__(self, index=None, workers=SAST_WORKERS):
+        self.index = index  # SastIndex (None이면 모든 파일을 매번 검사)
+        self.workers = workers  # 정적 분석 프로세스 수 (1이면 현재 프로세스에서 검사)
 
         self.sql_patterns = [
             # Python SQL Injection patterns
@@ -90,6 +97,33 @@ class InjectionPatterns:
             r'(Runtime\.getRuntime\(\)\.exec)\s*\(\s*.*[+`]',
             r'(ProcessBuilder)\s*\(\s*.*[+`]'
         ]
+
+        # 사전 필터 키워드: 각 묶음의 패턴이 걸리는 줄에는 이 중 하나가 반드시 포함됨 (대소문자 무시)
+        self.sql_keywords = [
+            'select', 'insert', 'update', 'delete', 'drop', 'create',
+            'execute', 'query', 'sql', 'knex.raw', '.where', '.having', '.orderby'
+        ]
+
+        self.xss_keywords = [
+            'innerhtml', 'outerhtml', 'insertadjacenthtml', 'insertadjacenttext', 'document.write',
+            '.html', '.append', '.prepend', '.after', '.before',
+            'bypasssecuritytrusthtml', 'setattribute', '.on'
+        ]
+
+        self.command_keywords = [
+            'system', 'subprocess.', 'exec', 'eval', 'passthru', 'os.popen', 'os.spawn',
+            'function', 'settimeout', 'setinterval', 'child_process.spawn',
+            'fetch', 'xmlhttprequest', 'processbuilder'
+        ]
+
+        self.rule_families = {
+            "sqli": (self.sql_patterns, self.sql_keywords),
+            "xss": (self.xss_patterns, self.xss_keywords),
+            "command": (self.command_patterns, self.command_keywords),
+        }
+        self.engine = RuleEngine(self.rule_families)
+        self._scanned = None  # (source_files, 묶음별 결과) - 세 검사가 같은 결과 공유
+        self._scan_lock = threading.Lock()  # 세 검사가 동시에 실행되어도 검사는 한 번만
     
     def parse_scan_results(self, vulnerabilities):
         
@@ -110,45 +144,54 @@ class InjectionPatterns:
 
     def sqli_run(self, source_files):
 
-        result = self.swordsman(source_files, self.sql_patterns)
+        result = self.scan_all(source_files)["sqli"]
 
         return self.parse_scan_results(result)
 
     def xss_run(self, source_files):
 
-        result = self.swordsman(source_files, self.xss_patterns)
+        result = self.scan_all(source_files)["xss"]
 
         return self.parse_scan_results(result)
 
 
     def command_injection_run(self, source_files):
 
-        result = self.swordsman(source_files, self.command_patterns)
+        result = self.scan_all(source_files)["command"]
 
         return self.parse_scan_results(result)
 
+    def scan_all(self, source_files):
+        """
+        SQLi/XSS/Command Injection 규칙을 파일당 한 번에 검사
+        같은 source_files로 다시 호출하면 (sqli_run → xss_run → ...) 저장된 결과 재사용
+        동시에 호출되면 먼저 들어온 검사가 끝날 때까지 기다렸다가 그 결과 사용
+        """
+        with self._scan_lock:
+            if self._scanned is not None and self._scanned[0] is source_files:
+                return self._scanned[1]
+
+            results = self.run_engine(source_files, self.engine, self.rule_families)
+            self._scanned = (source_files, results)
+            return results
+
+    def run_engine(self, source_files, engine, families):
+        results = {name: [] for name in families}
+
+        # 변경되지 않은 파일은 인덱스 결과 사용, 파일이 많으면 프로세스 풀로 나눠서 검사
+        all_found = analyze_sources(source_files, engine.scan, self.index, "A03_Injection",
+                                    ruleset_version([families, LEXER_VERSION]), self.workers,
+                                    analyze_large=engine.scan_file)
+
+        for found in all_found:
+            for name in results:
+                results[name].extend(found.get(name, []))
+
+        return results
+
     def swordsman(self, source_files, patterns = None): #패턴 검사
-        vulnerabilities = list()
-
-        for source in source_files:
-            code = source["content"].splitlines()
-            for line_num, line in enumerate(code, 1):
-                if line.strip().startswith(("//", "#", "/*", "*", "*/")):
-                    continue
-                path = source["path"]
-                for pattern in patterns:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        vulnerabilities.append(
-                            {
-                                "path": path,
-                                "line": str(line_num),
-                                "pattern" : pattern
-                            }
-                        )
-                        # self.num+=1
-                        break  # 한 줄에 여러 패턴이 걸려도 한 번만 기록
-        
-        return vulnerabilities
+        families = {"custom": (patterns or [], None)}
+        return self.run_engine(source_files, RuleEngine(families), families)["custom"]
     
 
 if __name__ == "__main__":
@@ -12,33 +12,71 @@ def load_data():
     """manage_data.json에서 프로젝트 파일들 로드"""
     try:
         with open(MANAGE_DATA, "r", encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
+        data["source_files"] = load_source_files(data.get("source_files", []))
+        return data
     except FileNotFoundError:
         print("⚠️ manage_data.json이 없습니다. main_test.py를 먼저 실행하세요.")
         return {"source_files": []}
 
 
 from A03.A03_Injection import InjectionPatterns
+from A03.A03_xss import start_xss
+from A03.A03_sqli import start_sqli
+from add_in.data_management import load_source_files
+from add_in.sast_pool import SAST_WORKERS
+from add_in.check_registry import register_checks, check
 
 
+@register_checks(options=("index", "workers"))
 class Injection:
     """A03 Injection 통합 검사 클래스"""
 
-    def __init__(self):
-        self.checker = InjectionPatterns()
+    def __init__(self, index=None, workers=SAST_WORKERS):
+        self.checker = InjectionPatterns(index=index, workers=workers)
 
+    @check("A03-01", "XSS 취약점 검사", inputs=("source_files",), cost="medium", kind="static", priority="high")
     def xss_run(self, source_files):
         """A03-01: XSS 취약점 검사"""
         return self.checker.xss_run(source_files)
 
+    @check("A03-02", "SQL Injection 취약점 검사", inputs=("source_files",), cost="medium", kind="static", priority="high")
     def sqli_run(self, source_files):
         """A03-02: SQL Injection 검사"""
         return self.checker.sqli_run(source_files)
 
+    @check("A03-03", "Command Injection 취약점 검사", inputs=("source_files",), cost="medium", kind="static", priority="high")
     def command_injection_run(self, source_files):
         """A03-03: Command Injection 검사"""
         return self.checker.command_injection_run(source_files)
 
+    @check("A03-04", "XSS 동적 검사", inputs=("obj_list", "cancel_event", "on_progress"), cost="heavy", kind="network")
+    def xss_dynamic_run(self, obj_list, cancel_event=None, on_progress=None):
+        """A03-04: 크롤링한 폼에 페이로드를 넣어 브라우저에서 실행되는지 확인"""
+        details = []
+        for result in start_xss(obj_list, cancel_event=cancel_event, on_progress=on_progress):
+            details.append({
+                "url": result["url"],
+                "method": result["method"],
+                "issue": f"XSS 페이로드 실행 ({result['field']} 필드, {result['context']})",
+                "payload": result["data"].get(result["field"]),
+            })
+        return details
+
+    @check("A03-05", "SQL Injection 동적 검사", inputs=("obj_list", "cancel_event", "on_progress"), cost="heavy", kind="network")
+    def sqli_dynamic_run(self, obj_list, cancel_event=None, on_progress=None):
+        """A03-05: 크롤링한 폼에 SQLi 페이로드를 보내 오류/지연 응답 확인"""
+        details = []
+        for result in start_sqli(obj_list, cancel_event=cancel_event, on_progress=on_progress):
+            details.append({
+                "url": result["url"],
+                "method": result["method"],
+                "issue": ", ".join(result["findings"]),
+                "data": result["data"],
+                "duration": result["duration"],
+            })
+        return details
+
     def run_all(self, source_files):
         """모든 A03 검사 실행"""
         results = {
@@ -0,0 +1,107 @@
+import re
+
+from add_in.data_management import SourceFile
+from add_in.mmap_scan import map_file, LineIndex, cut_spans
+from add_in.source_lexer import strip_comments, comment_spans_bytes
+
+
+class RuleEngine:
+    """
+    여러 규칙 묶음(SQLi/XSS/Command Injection)을 파일당 한 번에 검사하는 패턴 엔진
+    - 모든 패턴은 생성 시 한 번만 컴파일
+    - 키워드 사전 필터: 묶음의 필수 키워드가 하나도 없는 줄은 정규식 검사 생략
+    - 묶음의 패턴을 하나로 합친 정규식으로 먼저 검사하고, 걸린 줄만 패턴을 순서대로 검사해서
+      기존과 같이 "처음 걸린 패턴 1개"를 기록
+    - 주석은 파일 언어에 맞게 미리 지운 뒤 검사 (여러 줄 주석 포함, 줄 번호는 그대로)
+    - 큰 파일은 scan_file로 mmap 위에서 키워드가 있는 줄만 꺼내서 검사
+    """
+
+    def __init__(self, families):
+        """families: {묶음 이름: (패턴 목록, 필수 키워드 목록 또는 None)}"""
+        self.families = []
+        all_keywords = []
+        unfiltered = False
+        for name, (patterns, keywords) in families.items():
+            compiled = [(pattern, re.compile(pattern, re.IGNORECASE)) for pattern in patterns]
+            combined = re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+            # 키워드가 없으면 모든 줄을 검사
+            prefilter = None
+            if keywords:
+                prefilter = re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+                all_keywords.extend(keywords)
+            else:
+                unfiltered = True
+
+            self.families.append((name, prefilter, combined, compiled))
+
+        # mmap 검사용: 모든 묶음 키워드를 합친 바이트 정규식 (키워드 없는 묶음이 있으면 사용 안 함)
+        self.keywords_bytes = None
+        if all_keywords and not unfiltered:
+            self.keywords_bytes = re.compile(
+                b"|".join(re.escape(keyword.encode()) for keyword in all_keywords), re.IGNORECASE
+            )
+
+    def scan(self, content, path):
+        """파일 1개 검사 → {묶음 이름: [{"path", "line", "pattern"}, ...]}"""
+        results = {name: [] for name, _, _, _ in self.families}
+
+        for line_num, line in enumerate(strip_comments(content, path).splitlines(), 1):
+            self.scan_line(line, line_num, path, results)
+
+        return results
+
+    def scan_file(self, path):
+        """
+        큰 파일 1개 검사 (파일을 읽지 않고 mmap 위에서 검사, 결과는 scan과 같은 형식)
+        키워드가 나온 줄만 꺼내서 주석을 지우고 검사하며, 줄 번호는 그 줄까지만 계산
+        """
+        if self.keywords_bytes is None:
+            return self.scan(SourceFile(path, None).content, path)
+
+        results = {name: [] for name, _, _, _ in self.families}
+
+        with map_file(path) as buffer:
+            if buffer is None:
+                return results
+
+            lines = LineIndex(buffer)
+            comments = None
+            position = 0
+
+            while True:
+                match = self.keywords_bytes.search(buffer, position)
+                if not match:
+                    break
+
+                if comments is None:
+                    comments = comment_spans_bytes(buffer, path)
+                    comment_starts = [start for start, _ in comments]
+
+                line_num, line_start = lines.locate(match.start())
+                line_end, next_line = lines.line_end(match.start())
+                line = cut_spans(buffer, line_start, line_end, comments, comment_starts)
+                self.scan_line(line.decode("utf-8", errors="ignore"), line_num, path, results)
+
+                position = next_line
+
+        return results
+
+    def scan_line(self, line, line_num, path, results):
+        """줄 1개를 모든 묶음으로 검사해서 results에 추가"""
+        for name, prefilter, combined, compiled in self.families:
+            if prefilter is not None and not prefilter.search(line):
+                continue
+            if not combined.search(line):
+                continue
+
+            for pattern, regex in compiled:
+                if regex.search(line):
+                    results[name].append(
+                        {
+                            "path": path,
+                            "line": str(line_num),
+                            "pattern": pattern
+                        }
+                    )
+                    break  # 한 줄에 여러 패턴이 걸려도 한 번만 기록
@@ -1,113 +1,250 @@
 # 3중 for문 개선 -> formdata를 웹 페이지에서 수집해서 동적으로 적용해야함
-import requests
+import aiohttp
+import asyncio
+import re
+import statistics
+import threading
 import time
 import os
+from urllib.parse import urlparse
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 PAYLOAD_FILE = os.path.join(PROJECT_ROOT, "etc", "A03_sqli_payload.txt")  # SQLi 페이로드 파일 경로
 
-success_results = []
+SQLI_WORKERS = 10   # 동시에 보내는 요청 수
+SQLI_PER_HOST = 4   # 호스트 1개에 동시에 보내는 요청 수
+SQLI_TIMEOUT = 15   # 요청 1개 최대 대기(초), 재검사 지연(SQLI_SLEEP * 2)보다 길어야 함
+
+# time-based 검사
+SQLI_SLEEP = 2          # 페이로드의 SLEEP(n) / pg_sleep(n) / WAITFOR DELAY 지연을 이 값(초)으로 바꿔 사용
+BASELINE_SAMPLES = 5    # 엔드포인트별 기준 응답 시간 측정 요청 수 (워밍업 1회는 제외)
+BASELINE_SPREAD = 4     # 기준 편차(MAD)의 몇 배 이상 느려야 지연으로 보는지
+SLEEP_MIN_RATIO = 0.8   # 기준보다 최소 sleep * 이 비율만큼 느려야 지연
+RETEST_MIN_RATIO = 1.5  # 재검사(sleep 2배)의 지연이 처음 지연의 이 배수 이상이어야 확정
+
+SLEEP_CALL = re.compile(r"((?:pg_)?sleep\s*\(\s*)\d+(?:\.\d+)?", re.IGNORECASE)
+WAITFOR_DELAY = re.compile(r"(waitfor\s+delay\s+'\d+:\d+:)\d+", re.IGNORECASE)
 
 def read_lines_file():
     with open(PAYLOAD_FILE, "r") as file:
         return file.read().splitlines()
 
-def is_time_based(duration):
-    print(duration)
-    return duration >= 5
-
-# 수정된 요청 함수: 한 endpoint에 대해 한 번 요청만 함
-def send_request(full_url, data, method):
-    try:
-        print(f"[+] 요청 URL: {full_url}")
-        start = time.time()
-        if method.upper() == "POST":
-            response = requests.post(full_url, data=data)
+def with_sleep(payload, seconds):
+    """페이로드의 지연 값을 seconds로 바꿈, 반환: (페이로드, 지연 값이 있었는지)"""
+    payload, calls = SLEEP_CALL.subn(lambda m: f"{m.group(1)}{seconds:g}", payload)
+    payload, delays = WAITFOR_DELAY.subn(lambda m: f"{m.group(1)}{max(1, round(seconds))}", payload)
+    return payload, bool(calls or delays)
+
+def fill_form(inputs, value):
+    """payload 필드(payload 또는 빈 값)에 value를 넣은 요청 데이터"""
+    data = {}
+    for key, val in inputs.items():
+        if val == 'payload' or val == '':
+            data[key] = value
         else:
-            response = requests.get(full_url, params=data)
-        end = time.time()
-        duration = end - start
-        return response, duration
-    except requests.RequestException as e:
-        print(f"[!] 요청 실패: {e}, {method}, {data}")
-        return None, None
+            data[key] = val
+    return data
+
+def measure_baseline(durations):
+    """응답 시간 목록 → (중앙값, 편차(중앙값 절대 편차))"""
+    median = statistics.median(durations)
+    spread = statistics.median(abs(d - median) for d in durations)
+    return median, spread
+
+def is_time_based(duration, baseline=None, sleep=SQLI_SLEEP):
+    """기준 응답 시간보다 sleep 지연 이상, 평소 편차보다 크게 느리면 True (기준이 없으면 0초 기준)"""
+    median, spread = baseline or (0.0, 0.0)
+    return duration - median >= max(BASELINE_SPREAD * spread, sleep * SLEEP_MIN_RATIO)
+
+def analyze_response(path, status, text, delay=None):
+    """응답 1개에서 SQLi 징후 목록 (delay: SqliProber.check_delay에서 확인한 time-based 징후)"""
+    findings = []
+    lowered = text.lower()
+    if "sql" in lowered or "syntax" in lowered:
+        findings.append(f"⚠️ SQL 오류 메시지 발견 (Error-based)")
+    if delay:
+        findings.append(delay)
+    if status == 500:
+        findings.append(f"⚠️ 서버 500 에러")
+    if ("Welcome" in text or "Dashboard" in text) and "login" in path:
+        findings.append(f"✅ 로그인 우회 또는 결과 조작 가능성")
+    return findings
+
+
+class SqliProber:
+    """
+    폼 × 페이로드 요청을 하나의 aiohttp 세션(연결 풀)에서 동시에 보냄
+    - workers: 전체 동시 요청 수 (연결 풀 크기와 같음), per_host: 호스트별 동시 요청 수
+    - 응답 시간은 전체/호스트 슬롯을 얻은 뒤부터 측정하므로 대기열에서 기다린 시간은 포함되지 않음
+      (연결 풀 크기 = workers라서 슬롯을 얻으면 연결도 바로 사용 가능)
+    - 요청마다 timeout초 제한, 제한을 넘긴 요청은 timeout초 지연으로 기록
+    - time-based: 엔드포인트마다 정상 값 요청으로 기준 응답 시간(중앙값, 편차)을 먼저 재고
+      기준보다 느린 응답은 정상 요청 + sleep 2배 페이로드로 다시 확인 (동시 요청 부하로 인한 오탐 제거)
+    - cancel_event: set()되면 아직 보내지 않은 페이로드/재검사 요청은 보내지 않음 (검사 실행기의 시간 초과)
+    - on_progress(progress): 폼 1개의 페이로드가 모두 끝날 때마다 진행 상황 dict 전달
+      (forms / done / probes / found / cancelled)
+    """
+
+    def __init__(self, workers=SQLI_WORKERS, per_host=SQLI_PER_HOST, timeout=SQLI_TIMEOUT, sleep=SQLI_SLEEP,
+                 cancel_event=None, on_progress=None):
+        self.workers = workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self.sleep = sleep
+        self.cancel_event = cancel_event or threading.Event()
+        self.on_progress = on_progress
+        self.progress = {"forms": 0, "done": 0, "probes": 0, "found": 0, "cancelled": False}
+        self.slots = None
+        self.host_slots = {}  # 호스트 → Semaphore(per_host)
+        self.baselines = {}   # (action, method) → 기준 응답 시간 측정 Task
+
+    def _host_slot(self, url):
+        host = urlparse(url).netloc
+        if host not in self.host_slots:
+            self.host_slots[host] = asyncio.Semaphore(self.per_host)
+        return self.host_slots[host]
+
+    async def send_request(self, session, full_url, data, method):
+        """반환: (상태 코드, 본문, 응답 시간) / 요청 실패면 None"""
+        async with self._host_slot(full_url), self.slots:
+            start = time.perf_counter()
+            try:
+                if method.upper() == "POST":
+                    response = await session.post(full_url, data=data)
+                else:
+                    response = await session.get(full_url, params=data)
+                async with response:
+                    text = await response.text(errors="replace")
+                return response.status, text, time.perf_counter() - start
+            except asyncio.TimeoutError:
+                return None, "", self.timeout
+            except (aiohttp.ClientError, ValueError) as e:
+                print(f"[!] 요청 실패: {e}, {method}, {data}")
+                return None
+
+    async def baseline(self, session, formdata):
+        """엔드포인트의 기준 응답 시간 (같은 엔드포인트의 페이로드들이 측정 1번을 함께 기다림)"""
+        key = (formdata['action'], formdata['method'].upper())
+        if key not in self.baselines:
+            self.baselines[key] = asyncio.ensure_future(self._measure_baseline(session, formdata))
+        return await self.baselines[key]
+
+    async def _measure_baseline(self, session, formdata):
+        data = fill_form(formdata['inputs'], "1")
+        durations = []
+        for i in range(BASELINE_SAMPLES + 1):
+            response = await self.send_request(session, formdata['action'], data, formdata['method'])
+            if response is None or response[0] is None:
+                return None  # 정상 요청도 실패/시간 초과면 기준 없음
+            if i > 0:  # 첫 요청은 워밍업 (연결 생성, 서버 캐시)
+                durations.append(response[2])
+        return measure_baseline(durations)
+
+    async def check_delay(self, session, formdata, payload, duration, baseline):
+        """
+        지연된 응답을 다시 확인해서 time-based 징후 문자열 반환 (오탐이면 None)
+        - 정상 요청도 느려졌으면 서버 부하로 판단
+        - 페이로드에 지연 값이 있으면 2배로 늘려서 지연도 늘어나는지 확인, 없으면 같은 페이로드로 재현 확인
+        - 처음 요청이 timeout초 제한에 걸렸으면 재검사도 제한에 걸릴 때 확정 (둘 다 timeout초로 기록되어 비율 비교 불가)
+        """
+        if not is_time_based(duration, baseline, self.sleep) or self.cancel_event.is_set():
+            return None
+
+        action, method = formdata['action'], formdata['method']
+        control = await self.send_request(session, action, fill_form(formdata['inputs'], "1"), method)
+        if control is None or is_time_based(control[2], baseline, self.sleep):
+            return None
+
+        retest_payload, scaled = with_sleep(payload, self.sleep * 2)
+        retest = await self.send_request(session, action, fill_form(formdata['inputs'], retest_payload), method)
+        if retest is None or not is_time_based(retest[2], baseline, self.sleep):
+            return None
+
+        median = baseline[0] if baseline else 0.0
+        capped = duration >= self.timeout and retest[0] is None  # 처음/재검사 모두 시간 초과 (status None)
+        if scaled and not capped and retest[2] - median < (duration - median) * RETEST_MIN_RATIO:
+            return None
+        limit = " 이상, 시간 초과" if capped else ""
+        return f"⏱️ 응답 지연 {round(duration,2)}초{limit} (기준 {median:.2f}초, 재검사 {retest[2]:.2f}초, Time-based)"
+
+    async def probe(self, session, path, formdata, payload):
+        method = formdata['method']
+        data = fill_form(formdata['inputs'], payload)
+
+        # 기준 측정이 끝난 뒤에 페이로드 전송 (지연 페이로드가 기준 측정을 느리게 하지 않도록)
+        baseline = await self.baseline(session, formdata)
+        if self.cancel_event.is_set():
+            return None
+        response = await self.send_request(session, formdata['action'], data, method)
+        self.progress["probes"] += 1
+        if response is None:
+            return None
+        status, text, duration = response
+        delay = await self.check_delay(session, formdata, payload, duration, baseline)
+        findings = analyze_response(path, status, text, delay)
+        if not findings:
+            return None
+        return {
+            "url": path,
+            "data": data,
+            "method": method,
+            "duration": round(duration, 2),
+            "findings": findings
+        }
+
+    async def probe_form(self, session, path, formdata, payloads):
+        """폼 1개에 모든 페이로드를 동시에 보내고 진행 상황 갱신 (이벤트 루프 스레드 하나에서만 실행)"""
+        results = await asyncio.gather(*[self.probe(session, path, formdata, payload) for payload in payloads])
+        results = [result for result in results if result is not None]
+        self.progress["found"] += len(results)
+        self.progress["done"] += 1
+        self.progress["cancelled"] = self.cancel_event.is_set()
+        if self.on_progress:
+            self.on_progress(dict(self.progress))
+        return results
+
+    async def run(self, targets, payloads):
+        """targets: [(페이지 경로, formdata)] → 징후가 있는 요청 결과 목록 (폼/페이로드 순서)"""
+        self.slots = asyncio.Semaphore(self.workers)
+        self.host_slots = {}
+        self.baselines = {}
+        self.progress = {"forms": len(targets), "done": 0, "probes": 0, "found": 0, "cancelled": False}
+        payloads = [with_sleep(payload, self.sleep)[0] for payload in payloads]
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.workers, ssl=False),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as session:
+            results = await asyncio.gather(*[
+                self.probe_form(session, path, formdata, payloads)
+                for path, formdata in targets
+            ])
+        return [result for form_results in results for result in form_results]
+
 
 # 메인 테스트 함수
-def start_sqli(obj_list):
-    # print(f"[*] SQLi 테스트 시작: {url}\n")
-    # url = "http://172.16.100.180"
-    # login_path = "/index.php?controller=authentication&back=my-account"
-    # login_data = {
-    #     "email":"jhjh@naver.com",
-    #     "passwd":"jjhjjh",
-    #     "SubmitLogin":"Authentication"
-    # }
-    
-    # login_path = ""
-    # login_data = {}
-    
-    # url = "http://testphp.vulnweb.com"
-    # login_path = "/userinfo.php"
-    # login_data = {
-    #     "uname" : "test",
-    #     "pass" : "test"
-    # }
-
-    # obj_list = start_crawl(url, login_path, login_data)
-    
+def start_sqli(obj_list, workers=SQLI_WORKERS, per_host=SQLI_PER_HOST, timeout=SQLI_TIMEOUT, sleep=SQLI_SLEEP,
+               cancel_event=None, on_progress=None):
+    """
+    SQL Injection 동적 검사
+    cancel_event: set()하면 남은 요청을 보내지 않음 (검사 실행기의 시간 초과)
+    on_progress: 진행 상황 콜백 (SqliProber 참고)
+    """
     payloads = read_lines_file() # 저장된 payload 저장
 
-    for obj in obj_list:
-        formlist = obj.formData #list 저장되어있음
-        path = obj.path
-        for formdata in formlist:  #form 태그별 안에 있는 input 태그와 method 저장장
-            method = formdata['method']
-            action = formdata['action']
-            inputs = formdata['inputs']
-
-            
-            # print(inputs.values())
-            if "payload" not in inputs.values():
-                # print(f"[!] {action}에 payload가 없습니다. 스킵합니다.")
-                continue
-            
-            for payload in payloads:
-                data = {}
-                for key, val in inputs.items():
-                    if val == 'payload' or val == '':
-                        data[key] = payload
-                    else:
-                        data[key] = val
-                
-                print("action : ", action)
-                response, duration = send_request(action, data, method)
-                
-
-                findings = []
-                if "sql" in response.text.lower() or "syntax" in response.text.lower():
-                    findings.append(f"⚠️ SQL 오류 메시지 발견 (Error-based)")
-                if is_time_based(duration):
-                    findings.append(f"⏱️ 응답 지연 {round(duration,2)}초 (Time-based)")
-                if response.status_code == 500:
-                    findings.append(f"⚠️ 서버 500 에러")
-                if ("Welcome" in response.text or "Dashboard" in response.text) and "login" in path:
-                    findings.append(f"✅ 로그인 우회 또는 결과 조작 가능성")
-
-                if findings:
-                    result = {
-                        "url": path,
-                        "data": data,
-                        "method" : method,
-                        "duration": round(duration, 2),
-                        "findings": findings
-                    }
-                    success_results.append(result)
-
-            print("-" * 50)
+    # form 태그별 안에 있는 input 태그와 method, payload를 넣을 필드가 있는 폼만
+    targets = [
+        (obj.path, formdata)
+        for obj in obj_list
+        for formdata in obj.formData
+        if "payload" in formdata['inputs'].values()
+    ]
+    print(f"[*] SQLi 테스트 시작: 폼 {len(targets)}개 × 페이로드 {len(payloads)}개")
+
+    prober = SqliProber(workers, per_host, timeout, sleep, cancel_event, on_progress)
+    success_results = asyncio.run(prober.run(targets, payloads))
 
     print("\n\n=== 테스트 결과 요약 ===")
     for idx, result in enumerate(success_results,1):
-        time.sleep(0.5)
         print("=" * 60)
         print(f"[#{idx}] SQL Injection 검사 결과")
         print(f"[URL     ] {result['url']}")
@@ -124,6 +261,7 @@ def start_sqli(obj_list):
 
         print("=" * 60)
         
+    os.makedirs("sqli", exist_ok=True)
     for idx2, result in enumerate(success_results, 1):
         filename = f"sqli/{idx2}.txt"
         with open(filename, 'w', encoding='utf-8') as file:
@@ -141,8 +279,10 @@ def start_sqli(obj_list):
             else:
                 file.write("[FINDINGS] 없음\n")
 
-            file.write("=" * 60 + "\n")         
-                        
+            file.write("=" * 60 + "\n")
+
+    return success_results
+
 
 # def test_sqli():    
 #     from crawl import start_crawl
@@ -1,130 +1,150 @@
 #스레드를 통해 속도 향상
-# 스레드 : 각 엔드포인트별로 payload 를 삽입하여 XSS 공격을 시도하는 함수
+# 작업 스레드 : 반사 검사를 통과한 (폼, 필드)에 payload 를 삽입하여 XSS 공격을 시도
 
-import requests
 import threading
-
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import NoAlertPresentException
-import urllib.parse
-import time 
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
 from datetime import datetime
 from os import path, makedirs
+from urllib.parse import urlparse
+
+from A03.A03_xss_browser import XssBrowserPool
+from A03.A03_xss_reflect import find_reflecting_fields, build_form_data, order_payloads
 
 PROJECT_ROOT = path.dirname(path.dirname(path.abspath(__file__)))
 XSS_PAYLOAD_PATH = path.join(PROJECT_ROOT, "etc", "A03_xss_payload.txt")
-MAX_THREAD = 5
+MAX_THREAD = 5    # 브라우저 확인 작업 스레드 수
+XSS_PER_HOST = 3  # 호스트 1개에 동시에 보내는 요청 수
+XSS_MAX_PAYLOADS = 30  # 폼 1개에 시도할 페이로드 수 (브라우저 풀 재사용으로 5개 → 30개)
 
 
 def read_lines_file():
     with open(XSS_PAYLOAD_PATH, "r") as file:
         return file.read().splitlines()
 
-def check_alert(url, data, method):
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # 브라우저 창을 띄우지 않음
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(1)
-    try:
-        if method.upper() == 'GET':
-            full_url = url + "?" + urllib.parse.urlencode(data)
-            driver.get(full_url)
-        elif method.upper() == 'POST':
-            driver.get("about:blank")
-            script = """
-            var form = document.createElement('form');
-            form.method = 'POST';
-            form.action = arguments[0];
-            for (var key in arguments[1]) {
-                var input = document.createElement('input');
-                input.name = key;
-                input.value = arguments[1][key];
-                form.appendChild(input);
-            }
-            document.body.appendChild(form);
-            form.submit();
-            """
-            driver.execute_script(script, url, data)
-        time.sleep(2)
+class XssScan:
+    """
+    반사 후보를 정해진 수의 작업 스레드로 브라우저 확인 (후보 수와 상관없이 스레드는 workers개)
+    - 후보는 실행기의 작업 큐에 쌓이고 빈 스레드가 하나씩 가져감
+    - per_host: 같은 호스트에 동시에 보내는 확인 요청 수 (한 서버에 몰리지 않도록)
+    - cancel(): 대기 중인 후보는 버리고 실행 중인 후보는 다음 페이로드 전에 멈춤
+    - on_progress(progress): 후보 1개가 끝날 때마다 진행 상황 dict 전달
+      (candidates / done / probes / found / cancelled)
+    """
+
+    def __init__(self, payloads, browser_pool, workers=MAX_THREAD, per_host=XSS_PER_HOST,
+                 cancel_event=None, on_progress=None):
+        self.payloads = payloads
+        self.browser_pool = browser_pool
+        self.workers = workers
+        self.per_host = per_host
+        self.cancel_event = cancel_event or threading.Event()
+        self.on_progress = on_progress
+        self.results = []
+        self.progress = {"candidates": 0, "done": 0, "probes": 0, "found": 0, "cancelled": False}
+        self.lock = threading.Lock()
+        self.host_slots = {}  # 호스트 → Semaphore(per_host)
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self, candidates):
+        self.progress["candidates"] = len(candidates)
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="xss")
         try:
-            driver.switch_to.alert
-            driver.quit()
-            return True
-        except NoAlertPresentException:
-            driver.quit()
-            return False
-    except Exception:
-        driver.quit()
-        return False
-
-def scan_form_for_xss(path, formdata, payloads, success_results, semaphore, thread_id):
-    with semaphore:
+            futures = [executor.submit(self._scan, candidate) for candidate in candidates]
+            for future in as_completed(futures):
+                if self.cancel_event.is_set():
+                    break
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"[!] XSS 확인 실패: {e}")
+        finally:
+            cancelled = self.cancel_event.is_set()
+            # 취소되면 큐에 남은 후보는 시작하지 않음
+            executor.shutdown(wait=True, cancel_futures=cancelled)
+            self.progress["cancelled"] = cancelled
+        return self.results
+
+    def _host_slot(self, url):
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.host_slots:
+                self.host_slots[host] = threading.Semaphore(self.per_host)
+            return self.host_slots[host]
+
+    def _scan(self, candidate):
+        """반사 검사를 통과한 (폼, 필드, 위치) 후보 1개를 브라우저로 확인"""
+        formdata = candidate['formdata']
+        field = candidate['field']
         method = formdata['method']
         action = formdata['action']
-        inputs = formdata['inputs']
-
-        print(f"\n[+]{thread_id} {action}, {method} 에 대해 XSS 스캔을 시작합니다...")
-
-        for payload in payloads[:5]:
-            data = {}
-
-            if "payload" not in inputs.values():
-                # print(inputs)
-                break
+        host_slot = self._host_slot(action)
 
-            for key, val in inputs.items():
-                if val == 'payload' or val == '':
-                    data[key] = payload
-                else:
-                    data[key] = val
+        print(f"\n[+] {action}, {method} ({field}, {candidate['context']}) 에 대해 XSS 스캔을 시작합니다...")
 
-            try:
-                if check_alert(action, data, method):
-                    # print("xss!!!")
-                    # print("payload : ", payload)
-                    result = {
-                        "url": path,
+        found = None
+        try:
+            for payload in order_payloads(self.payloads, candidate['context']):
+                if self.cancel_event.is_set():
+                    break
+                data = build_form_data(formdata['inputs'], field, payload)
+                with host_slot:
+                    try:
+                        alert = self.browser_pool.check_alert(action, data, method)
+                    except TimeoutError:
+                        # 브라우저 풀이 확인을 취소했으므로 창이 뜨지 않은 것으로 보고 다음 페이로드로
+                        print(f"[!] XSS 확인 시간 초과: {action} ({field})")
+                        alert = False
+                self._count("probes")
+                if alert:
+                    found = {
+                        "url": candidate['path'],
                         "data": data,
-                        "method": method
+                        "method": method,
+                        "field": field,
+                        "context": candidate['context'],
                     }
-                    success_results.append(result)
                     break
-                else:
-                    # print(f"[-]{thread_id} 필드 '{path}, {data}'에서는 페이로드가 반영되지 않음.")
-                    continue
-            except requests.RequestException as e:
-                print(f"[!] 요청 실패: {e}, {method}, {data}")
-                exit(-1)
-
-def start_xss(obj_list):
-    success_results = []
-    payloads = read_lines_file()
+        finally:
+            # 확인 중 예외가 나도 진행 상황의 done은 올라가도록
+            with self.lock:
+                if found:
+                    self.results.append(found)
+                    self.progress["found"] += 1
+                self.progress["done"] += 1
+                progress = dict(self.progress)
+            if self.on_progress:
+                self.on_progress(progress)
+
+    def _count(self, key):
+        with self.lock:
+            self.progress[key] += 1
+
+def start_xss(obj_list, max_payloads=XSS_MAX_PAYLOADS, workers=MAX_THREAD, per_host=XSS_PER_HOST,
+              cancel_event=None, on_progress=None):
+    """
+    XSS 동적 검사 (반사 검사 → 브라우저 확인)
+    cancel_event: set()하면 남은 확인을 멈춤 (검사 실행기의 시간 초과/중지 버튼)
+    on_progress: 진행 상황 콜백 (XssScan 참고)
+    """
+    payloads = read_lines_file()[:max_payloads]
     now_str = datetime.now().strftime("%Y%m%d_%H%M%S")
     result_dir = f"xss/{now_str}"
     makedirs(result_dir, exist_ok=True)
 
-    threads = []
-    thread_id = 1
-    semaphore = threading.Semaphore(MAX_THREAD)  # 최대 5개 동시 실행
-
-    for idx1, obj in enumerate(obj_list, 1):
-        formlist = obj.formData
-        path = obj.path
-        
-        for formdata in formlist:
-            t = threading.Thread(
-                target=scan_form_for_xss,
-                args=(path, formdata, payloads, success_results, semaphore, thread_id)
-            )
-            t.start()
-            thread_id += 1
-            threads.append(t)
-
-    for t in threads:
-        t.join()
+    # 1단계: HTTP 반사 검사로 브라우저 확인이 필요한 필드만 추림
+    targets = [(obj.path, formdata) for obj in obj_list for formdata in obj.formData]
+    candidates = find_reflecting_fields(targets, per_host=per_host)
+    print(f"[*] XSS 반사 검사: 폼 {len(targets)}개 중 반사되는 필드 {len(candidates)}개")
+
+    # 2단계: 후보만 브라우저로 페이로드 실행 확인
+    browser_pool = XssBrowserPool()  # 모든 스레드가 같은 Chromium을 나눠 씀 (후보가 없으면 실행 안 함)
+    scan = XssScan(payloads, browser_pool, workers, per_host, cancel_event, on_progress)
+    try:
+        success_results = scan.run(candidates)
+    finally:
+        browser_pool.close()
 
     for idx2, result in enumerate(success_results, 1):
         filename = f"{result_dir}/{idx2}.txt"
@@ -133,8 +153,11 @@ def start_xss(obj_list):
             file.write(f"[#{idx2}] XSS 검사 결과\n")
             file.write(f"[URL     ] {result['url']}\n")
             file.write(f"[METHOD  ] {result['method']}\n")
+            file.write(f"[FIELD   ] {result['field']} ({result['context']})\n")
             file.write(f"[DATA    ] {result['data']}\n")
-            file.write("=" * 60 + "\n")       
+            file.write("=" * 60 + "\n")
+
+    return success_results
 
 
 # def test_xss():
@@ -0,0 +1,187 @@
+# XSS 확인용 브라우저 풀
+# Chromium을 검사 내내 띄워두고 페이로드마다 새 컨텍스트(쿠키/저장소가 분리된 빈 세션)만 만들어 사용
+# alert/confirm/prompt 창은 dialog 이벤트로 감지 (고정 대기 없이 창이 뜨는 즉시 결과 확정)
+#
+#     pool = XssBrowserPool()
+#     pool.start()
+#     pool.check_alert(action, data, method)   # 여러 스레드에서 동시에 호출 가능
+#     pool.close()
+
+import asyncio
+import concurrent.futures
+import itertools
+import threading
+from urllib.parse import urlencode
+
+from playwright.async_api import async_playwright
+
+from add_in.crawl2 import USER_AGENT, block_resources
+
+XSS_BROWSERS = 2              # 띄워둘 Chromium 수
+XSS_CONTEXTS_PER_BROWSER = 4  # 브라우저 1개에서 동시에 열 컨텍스트 수
+XSS_LOAD_TIMEOUT = 10         # 페이지 로드 최대 대기(초)
+XSS_DIALOG_GRACE = 0.5        # 로드 후 늦게 뜨는 창(onload, setTimeout 등) 대기(초)
+
+POST_FORM_SCRIPT = """
+([action, data]) => {
+    const form = document.createElement('form');
+    form.method = 'POST';
+    form.action = action;
+    for (const key in data) {
+        const input = document.createElement('input');
+        input.name = key;
+        input.value = data[key];
+        form.appendChild(input);
+    }
+    document.body.appendChild(form);
+    form.submit();
+}
+"""
+
+
+class XssBrowserPool:
+    """
+    페이로드 실행 여부(dialog)를 확인하는 Chromium 풀
+    - 전용 스레드의 이벤트 루프에서 브라우저를 실행하고, 검사 스레드는 check_alert()로 요청만 보냄
+    - 브라우저는 재사용하고 요청마다 새 컨텍스트를 열고 닫음 (이전 페이로드의 쿠키/스크립트 영향 없음)
+    - 동시에 열리는 컨텍스트 수는 browsers * contexts_per_browser로 제한
+    """
+
+    def __init__(self, browsers=XSS_BROWSERS, contexts_per_browser=XSS_CONTEXTS_PER_BROWSER,
+                 load_timeout=XSS_LOAD_TIMEOUT, dialog_grace=XSS_DIALOG_GRACE):
+        self.browsers = browsers
+        self.contexts_per_browser = contexts_per_browser
+        self.load_timeout = load_timeout
+        self.dialog_grace = dialog_grace
+        self.loop = None
+        self.thread = None
+        self.playwright = None
+        self.instances = []
+        self.next_browser = None
+        self.slots = None
+        self.stats = {"probes": 0, "alerts": 0, "errors": 0, "timeouts": 0}
+        self.lock = threading.Lock()
+
+    def start(self):
+        with self.lock:
+            if self.thread is None:
+                self._start()
+
+    def _start(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="xss-browser", daemon=True)
+        self.thread.start()
+        try:
+            self._call(self._launch())
+        except Exception:
+            self._stop()
+            raise
+        print(f"[✔] XSS 브라우저 풀 시작 (브라우저 {self.browsers}개, 동시 컨텍스트 {self.browsers * self.contexts_per_browser}개)")
+
+    def _call(self, coroutine, timeout=None):
+        """
+        브라우저 스레드에서 코루틴을 실행하고 결과를 기다림
+        timeout이 지나면 코루틴을 취소하고(컨텍스트 정리) concurrent.futures.TimeoutError 발생
+        """
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    async def _launch(self):
+        self.playwright = await async_playwright().start()
+        for _ in range(self.browsers):
+            self.instances.append(await self.playwright.chromium.launch(headless=True))
+        self.next_browser = itertools.cycle(self.instances)
+        self.slots = asyncio.Semaphore(self.browsers * self.contexts_per_browser)
+
+    def check_alert(self, url, data, method):
+        """
+        url에 data를 GET/POST로 보냈을 때 dialog 창이 뜨면 True
+        제한 시간 안에 끝나지 않으면 확인을 취소하고 concurrent.futures.TimeoutError 발생
+        """
+        self.start()
+        # 로드 제한 시간 + 대기 시간 + 컨텍스트 생성/종료 여유
+        try:
+            return self._call(self._probe(url, data, method), self.load_timeout * 3 + self.dialog_grace)
+        except concurrent.futures.TimeoutError:
+            with self.lock:  # 검사 스레드 여러 개가 동시에 올림 (다른 통계는 브라우저 스레드에서만 갱신)
+                self.stats["timeouts"] += 1
+            raise
+
+    async def _probe(self, url, data, method):
+        async with self.slots:
+            self.stats["probes"] += 1
+            context = await next(self.next_browser).new_context(user_agent=USER_AGENT, ignore_https_errors=True)
+            try:
+                await context.route("**/*", block_resources)
+                page = await context.new_page()
+                dialog = asyncio.get_running_loop().create_future()
+
+                async def on_dialog(event):
+                    if not dialog.done():
+                        dialog.set_result(event.message)
+                    await event.dismiss()
+
+                page.on("dialog", on_dialog)
+                navigation = asyncio.ensure_future(self._navigate(page, url, data, method))
+                try:
+                    # 창이 뜨면 로드를 기다리지 않고 바로 확정
+                    await asyncio.wait({navigation, dialog}, timeout=self.load_timeout,
+                                       return_when=asyncio.FIRST_COMPLETED)
+                    if not dialog.done():
+                        await asyncio.wait_for(asyncio.shield(dialog), self.dialog_grace)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    navigation.cancel()
+
+                if dialog.done():
+                    self.stats["alerts"] += 1
+                    return True
+                return False
+            except Exception:
+                self.stats["errors"] += 1
+                return False
+            finally:
+                await context.close()
+
+    async def _navigate(self, page, url, data, method):
+        timeout = self.load_timeout * 1000
+        try:
+            if method.upper() == "POST":
+                await page.goto("about:blank")
+                async with page.expect_navigation(wait_until="load", timeout=timeout):
+                    await page.evaluate(POST_FORM_SCRIPT, [url, data])
+            else:
+                separator = "&" if "?" in url else "?"
+                full_url = url + separator + urlencode(data) if data else url
+                await page.goto(full_url, wait_until="load", timeout=timeout)
+        except Exception:
+            pass  # 로드 실패/시간 초과여도 이미 뜬 창은 유효
+
+    def close(self):
+        with self.lock:
+            if self.thread is not None:
+                self._stop()
+
+    def _stop(self):
+        try:
+            self._call(self._shutdown(), self.load_timeout)
+        except Exception as e:
+            print(f"[!] XSS 브라우저 풀 종료 실패: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=self.load_timeout)
+        self.loop.close()
+        self.thread = None
+        self.loop = None
+
+    async def _shutdown(self):
+        for browser in self.instances:
+            await browser.close()
+        self.instances = []
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
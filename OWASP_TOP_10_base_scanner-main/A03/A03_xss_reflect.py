@@ -0,0 +1,164 @@
+# XSS 반사 사전 검사 (브라우저 확인 전 HTTP 단계)
+# 폼의 입력 필드마다 고유 마커 + 특수문자('"<>, 문자마다 구분자)를 보내고 응답에서 인코딩되지 않고 반사되는지 확인
+# 반사된 위치(HTML 본문, 태그 속성, script 블록)에서 탈출에 필요한 문자가 살아 있는 필드만
+# (폼, 필드, 위치) 후보로 브라우저 확인 단계에 넘김 → 반사되지 않는 폼은 브라우저를 띄우지 않음
+
+import asyncio
+import re
+import secrets
+
+import aiohttp
+
+from add_in.crawl2 import USER_AGENT
+
+REFLECT_WORKERS = 10   # 동시 HTTP 요청 수
+REFLECT_TIMEOUT = 10   # 요청 1개 최대 대기(초)
+REFLECT_PER_HOST = 3   # 호스트 1개에 동시에 보내는 요청 수
+PROBE_CHARS = "'\"<>"  # 마커 뒤에 붙여 인코딩 여부를 확인할 문자
+PROBE_SENTINEL = "zq"  # 특수문자마다 뒤에 붙이는 구분자 (문자가 제거/인코딩돼도 위치를 찾을 수 있도록)
+MAX_ENCODED_LEN = 12   # 특수문자 1개가 인코딩된 최대 길이 (&#x00027; 등), 더 멀면 구분자를 찾지 않음
+
+# 반사 위치별로 페이로드 실행에 필요한 문자 (하나라도 그대로 반사되면 후보)
+CONTEXT_BREAKOUT = {
+    "html": "<",          # 새 태그 삽입
+    "attribute": "'\"<",  # 속성 값 닫기 또는 태그 삽입
+    "script": "'\"<",     # 문자열 닫기 또는 </script>
+}
+
+SCRIPT_OPEN = re.compile(r"<script\b", re.IGNORECASE)
+SCRIPT_CLOSE = re.compile(r"</script\s*>", re.IGNORECASE)
+
+
+def payload_fields(inputs):
+    """페이로드를 넣을 입력 필드 (크롤러가 'payload' 또는 빈 값으로 표시한 필드)"""
+    if "payload" not in inputs.values():
+        return []
+    return [key for key, val in inputs.items() if val == "payload" or val == ""]
+
+
+def build_form_data(inputs, field, value):
+    """field에만 value를 넣은 요청 데이터 (다른 페이로드 필드는 무해한 값)"""
+    data = {}
+    for key, val in inputs.items():
+        if key == field:
+            data[key] = value
+        elif val == "payload" or val == "":
+            data[key] = "test"
+        else:
+            data[key] = val
+    return data
+
+
+def reflection_context(text, pos):
+    """text의 pos 위치가 script 블록 / 태그 속성 / HTML 본문 중 어디인지"""
+    before = text[:pos]
+    last_open = None
+    for last_open in SCRIPT_OPEN.finditer(before):
+        pass
+    if last_open is not None and not SCRIPT_CLOSE.search(before, last_open.end()):
+        # <script ...> 태그 안(속성)인지 본문인지 구분
+        if before.rfind(">") > last_open.start():
+            return "script"
+        return "attribute"
+    if before.rfind("<") > before.rfind(">"):
+        return "attribute"
+    return "html"
+
+
+def probe_value(marker):
+    """마커 + 특수문자마다 구분자를 붙인 검사 값 (예: xss1a2b'zq"zq<zq>zq)"""
+    return marker + "".join(c + PROBE_SENTINEL for c in PROBE_CHARS)
+
+
+def raw_probe_chars(text, pos):
+    """
+    마커 바로 뒤(pos)부터 특수문자와 구분자를 순서대로 맞춰 보고 그대로 반사된 특수문자 집합
+    구분자 사이가 보낸 문자와 같을 때만 인정 (제거됐으면 빈 문자열, 인코딩됐으면 &#39; 등이라 제외)
+    → 서버가 특수문자를 지워도 뒤에 오는 페이지 자체의 태그(</div>의 <)를 반사로 오인하지 않음
+    """
+    raw = set()
+    for c in PROBE_CHARS:
+        stop = text.find(PROBE_SENTINEL, pos, pos + MAX_ENCODED_LEN + len(PROBE_SENTINEL))
+        if stop == -1:
+            break  # 구분자까지 잘렸거나 변형됨
+        if text[pos:stop] == c:
+            raw.add(c)
+        pos = stop + len(PROBE_SENTINEL)
+    return raw
+
+
+def find_reflections(text, marker):
+    """응답에서 marker가 반사된 위치마다 (위치 종류, 그대로 반사된 특수문자 집합)"""
+    reflections = []
+    start = text.find(marker)
+    while start != -1:
+        end = start + len(marker)
+        reflections.append((reflection_context(text, start), raw_probe_chars(text, end)))
+        start = text.find(marker, end)
+    return reflections
+
+
+def exploitable_context(reflections):
+    """탈출 문자가 살아 있는 첫 반사 위치 (없으면 None)"""
+    for context, raw in reflections:
+        if raw & set(CONTEXT_BREAKOUT[context]):
+            return context
+    return None
+
+
+def order_payloads(payloads, context):
+    """반사 위치에서 먼저 시도할 페이로드를 앞으로 (속성: 따옴표로 시작, script: </script> 포함)"""
+    if context == "attribute":
+        preferred = [p for p in payloads if p[:1] in "'\""]
+    elif context == "script":
+        preferred = [p for p in payloads if "</script" in p.lower() or p[:1] in "'\";"]
+    else:
+        return list(payloads)
+    return preferred + [p for p in payloads if p not in preferred]
+
+
+async def probe_field(session, semaphore, target, field):
+    path, formdata = target
+    marker = "xss" + secrets.token_hex(4)
+    data = build_form_data(formdata["inputs"], field, probe_value(marker))
+    method = formdata["method"].upper()
+    async with semaphore:
+        try:
+            if method == "POST":
+                response = await session.post(formdata["action"], data=data)
+            else:
+                response = await session.get(formdata["action"], params=data)
+            async with response:
+                text = await response.text(errors="replace")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"[!] 반사 검사 요청 실패: {formdata['action']} ({field}) {e}")
+            return None
+
+    context = exploitable_context(find_reflections(text, marker))
+    if context is None:
+        return None
+    return {"path": path, "formdata": formdata, "field": field, "context": context}
+
+
+async def prefilter_forms(targets, workers=REFLECT_WORKERS, timeout=REFLECT_TIMEOUT, per_host=REFLECT_PER_HOST):
+    """
+    targets: [(페이지 경로, formdata)]
+    반환: 반사되는 후보 [{"path", "formdata", "field", "context"}]
+    """
+    semaphore = asyncio.Semaphore(workers)
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=workers, limit_per_host=per_host, ssl=False),
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        headers={"User-Agent": USER_AGENT},
+    ) as session:
+        tasks = [
+            probe_field(session, semaphore, target, field)
+            for target in targets
+            for field in payload_fields(target[1]["inputs"])
+        ]
+        results = await asyncio.gather(*tasks)
+    return [candidate for candidate in results if candidate is not None]
+
+
+def find_reflecting_fields(targets, workers=REFLECT_WORKERS, timeout=REFLECT_TIMEOUT, per_host=REFLECT_PER_HOST):
+    return asyncio.run(prefilter_forms(targets, workers, timeout, per_host))
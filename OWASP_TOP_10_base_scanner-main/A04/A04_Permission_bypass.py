@@ -6,10 +6,13 @@ import os
 import argparse
 import concurrent.futures
 import json
+import threading
 from datetime import datetime
 from tqdm import tqdm
 import urllib3
 
+from add_in.scan_profiles import scan_limit
+
 # SSL 인증서 검증 경고 및 Connection Pool 경고 비활성화
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 logging.getLogger("urllib3.connectionpool").setLevel(logging.ERROR)
@@ -23,7 +26,8 @@ def read_file():
 
 class PermissionBypassScanner:
 
-    def __init__(self, target_url: str, session: Optional[requests.Session] = None, verify_ssl: bool = False, timeout: int = 10, max_workers: int = 10):
+    def __init__(self, target_url: str, session: Optional[requests.Session] = None, verify_ssl: bool = False, timeout: int = 10, max_workers: int = 10,
+                 max_urls: Optional[int] = None, user_ids: int = 10, cancel_event: Optional[threading.Event] = None):
         self.logger = logging.getLogger(__name__)
 
         self.target_url = target_url.rstrip('/')
@@ -41,6 +45,9 @@ class PermissionBypassScanner:
         self.verify_ssl = verify_ssl
         self.timeout = timeout
         self.max_workers = max_workers
+        self.max_urls = max_urls  # 단어 목록 파일에서 사용할 최대 URL 수 (None이면 전체, 검사 프로필에서 제한)
+        self.user_ids = user_ids  # 사용자 ID 조작 검사에 사용할 ID 수 (1~N)
+        self.cancel_event = cancel_event or threading.Event()  # set()되면 남은 요청을 보내지 않음 (검사 실행기의 시간 초과)
         self.test_cookies = read_file().get("test_cookies", {})
         self.id_patterns = read_file().get("id_patterns", [])
         self.user_keywords = read_file().get("user_keywords", [])
@@ -50,6 +57,9 @@ class PermissionBypassScanner:
         # 결과 저장용(조재호가 추가함)
         self.details = []
 
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
     #조재호 수정버전
     def parse_scan_results(self, results):
         print(f"test parse_scan_results: {len(results)}개 결과 처리 중...")
@@ -121,6 +131,8 @@ class PermissionBypassScanner:
         num_batches = (total_urls + batch_size - 1) // batch_size  # 올림 나눗셈
 
         for batch_num in range(num_batches):
+            if self.cancelled():
+                break
             start_idx = batch_num * batch_size
             end_idx = min((batch_num + 1) * batch_size, total_urls)
             current_batch = protected_urls_with_lines[start_idx:end_idx]
@@ -130,6 +142,8 @@ class PermissionBypassScanner:
             # 병렬 처리를 위한 함수
             def check_url(url_info):
                 url, line_number = url_info
+                if self.cancelled():
+                    return None
                 full_url = urljoin(self.target_url, url)
                 try:
                     # 리다이렉트 허용 (로그인 페이지로 리다이렉트 되는지 확인)
@@ -198,6 +212,8 @@ class PermissionBypassScanner:
             test_cookies = self.test_cookies
             
             for cookie_name, cookie_value in test_cookies.items():
+                if self.cancelled():
+                    break
                 # 기존 쿠키 백업
                 old_value = self.session.cookies.get(cookie_name)
                 
@@ -246,6 +262,8 @@ class PermissionBypassScanner:
         num_batches = (total_urls + batch_size - 1) // batch_size  # 올림 나눗셈
 
         for batch_num in range(num_batches):
+            if self.cancelled():
+                break
             start_idx = batch_num * batch_size
             end_idx = min((batch_num + 1) * batch_size, total_urls)
             current_batch = admin_urls_with_lines[start_idx:end_idx]
@@ -255,6 +273,8 @@ class PermissionBypassScanner:
             # 병렬 처리를 위한 함수
             def check_url(url_info):
                 url, line_number = url_info
+                if self.cancelled():
+                    return None
                 full_url = urljoin(self.target_url, url)
                 try:
                     response = self.session.get(full_url, allow_redirects=True, verify=self.verify_ssl, timeout=self.timeout)
@@ -316,7 +336,7 @@ class PermissionBypassScanner:
                     if result:
                         results.append(result) 
                         
-            return results
+        return results
     
     #조재호 수정버전(user_endpoints 매개변수 추가) get_url_lists 함수에서 endpoint.txt 읽어서 전달하는데 기존 코드에는 리턴을 안함
     def check_user_id_manipulation(self,user_endpoints, user_id_range: range = range(1, 11)) -> List[Dict]:
@@ -360,6 +380,8 @@ class PermissionBypassScanner:
             # 병렬 처리를 위한 함수
             def check_url(url_info):
                 url, original_endpoint, pattern = url_info
+                if self.cancelled():
+                    return None
                 full_url = urljoin(self.target_url, url)
 
                 try:
@@ -409,6 +431,8 @@ class PermissionBypassScanner:
             num_batches = (total_urls + batch_size - 1) // batch_size
             
             for batch_num in range(num_batches):
+                if self.cancelled():
+                    break
                 start_idx = batch_num * batch_size
                 end_idx = min((batch_num + 1) * batch_size, total_urls)
                 current_batch = all_urls[start_idx:end_idx]
@@ -431,19 +455,19 @@ class PermissionBypassScanner:
 
 
     #조재호 수정버전
-    def get_url_lists(self, file_name: str) -> List[str]:
+    def get_url_lists(self, file_name: str, max_urls: Optional[int] = None) -> List[str]:
         urls_with_line_numbers = []
         count = 0
 
         try:
-            with open(f"../etc/{file_name}", 'r') as f:
+            with open(os.path.join(PATH_ROOT, "etc", file_name), 'r') as f:
                 for line_number, line in enumerate(f, 1):
                     line = line.strip()
                     if line and not line.startswith('#'):
                         urls_with_line_numbers.append((line, line_number))
                         count += 1
-                        # if max_urls and count >= max_urls:
-                        #     break
+                        if max_urls and count >= max_urls:
+                            break
             # with open(, "r") as f:
             #     return f.read().splitlines()
         except FileNotFoundError:
@@ -458,8 +482,8 @@ class PermissionBypassScanner:
         # details = []
 
         #기존코드에 endpoint_file 리턴이 없어서 주석
-        protected_urls = self.get_url_lists("A04_common.txt")
-        admin_urls = self.get_url_lists("A04_general.txt")
+        protected_urls = self.get_url_lists("A04_common.txt", self.max_urls)
+        admin_urls = self.get_url_lists("A04_general.txt", self.max_urls)
         endpoint_urls = self.get_url_lists("A04_endpoint.txt")
 
         # 1. 직접 접근
@@ -476,11 +500,13 @@ class PermissionBypassScanner:
 
         # 4. 사용자 ID 조작
         print(f"- 사용자 ID 조작 검사 시작")
-        results.extend(self.check_user_id_manipulation(user_endpoints=endpoint_urls))
+        results.extend(self.check_user_id_manipulation(user_endpoints=endpoint_urls, user_id_range=range(1, self.user_ids + 1)))
 
 
         details = self.parse_scan_results(results)
 
+        if self.cancelled():
+            print("Permission_bypass 검사 중단 (시간 초과): 중단 전까지 확인한 결과만 반환")
         print(f"Permission_bypass22 검사 완료: {len(results)}개 취약점 발견")
 
 
@@ -705,9 +731,14 @@ def read_file_with_lines(file_path, max_urls=None):
 #         print(f"결과 처리 중 오류 발생: {e}")
 #         return None
 
-def start_permission_bypass(config):
-    """main_test.py에서 호출되는 함수 - JSON 결과 반환"""
-    obj = PermissionBypassScanner(config.get("web_url"))
+def start_permission_bypass(config, cancel_event=None):
+    """main_test.py에서 호출되는 함수 - JSON 결과 반환 (cancel_event: set()되면 남은 요청을 멈춤)"""
+    obj = PermissionBypassScanner(
+        config.get("web_url"),
+        max_urls=scan_limit(config, "permission_bypass_urls"),
+        user_ids=scan_limit(config, "permission_bypass_user_ids", 10),
+        cancel_event=cancel_event,
+    )
     result = obj.run()
     # return check_permission_bypass(config.get("web_url"), timeout=3, max_workers=20, batch_size=1000)
     
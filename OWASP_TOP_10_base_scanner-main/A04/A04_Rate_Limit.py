@@ -4,6 +4,8 @@ import logging
 from urllib.parse import urljoin
 import json
 
+from add_in.scan_profiles import scan_limit
+
 
 
 logging.basicConfig(
@@ -133,6 +135,7 @@ async def start_rate_limit(obj_list, config):
     from datetime import datetime
     
     endpoints_tested = 0
+    max_requests = scan_limit(config, "rate_limit_requests", 3)  # 엔드포인트당 연속 요청 수 (검사 프로필)
 
     # 하나의 세션을 공유해서 사용
     async with aiohttp.ClientSession() as session:
@@ -152,7 +155,7 @@ async def start_rate_limit(obj_list, config):
                     headers = form['headers']
                     
                     # 병렬 실행을 위한 태스크 생성
-                    task = test_rate_limit_on_endpoint(session, target_url, method, headers, inputs)
+                    task = test_rate_limit_on_endpoint(session, target_url, method, headers, inputs, max_requests)
                     tasks.append(task)
                 else:
                     logging.debug(f"일반 엔드포인트 스킵: {target_url}")
@@ -12,25 +12,30 @@ sys.path.append(PROJECT_ROOT)
 from A04.A04_Rate_Limit import run as rate_limit_run
 from A04.A04_Insufficien_access_control import start_check_access_control
 from A04.A04_Permission_bypass import start_permission_bypass
+from add_in.check_registry import register_checks, check
 
 
+@register_checks()
 class InsecureDesign:
     """A04 Insecure Design 통합 검사 클래스"""
 
     def __init__(self):
         pass
 
+    @check("A04-01", "Rate Limiting 검사", inputs=("obj_list", "config"), cost="medium", kind="network", priority="low")
     def rate_limit_run(self, obj_list, config):
         """A04-01: Rate Limiting 검사"""
         return rate_limit_run(obj_list, config)
 
+    @check("A04-02", "접근 제어 취약점 검사", inputs=("web_directory",), cost="light", kind="static")
     def access_control_run(self, web_directory):
         """A04-02: 접근 제어 취약점 검사"""
         return start_check_access_control(web_directory)
 
-    def permission_bypass_run(self, config):
+    @check("A04-03", "권한 우회 취약점 검사", inputs=("config", "cancel_event"), cost="heavy", kind="network", priority="low")
+    def permission_bypass_run(self, config, cancel_event=None):
         """A04-03: 권한 우회 취약점 검사"""
-        return start_permission_bypass(config)
+        return start_permission_bypass(config, cancel_event)
 
     def run_all(self, obj_list, config):
         """모든 A04 검사 실행"""
@@ -3,6 +3,8 @@ from urllib.parse import urlparse
 import json
 import os
 
+from add_in.scan_profiles import scan_limit
+
 # 프로젝트 루트 기준 절대 경로 설정
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ETC_PATH = os.path.join(PROJECT_ROOT, "etc", "A05_port_config.json")
@@ -16,7 +18,11 @@ def load_user_info():
     with open(USER_INFO_PATH, "r") as f:
         return json.load(f)
 
-def scan_ports(host: str, start_port: int, end_port: int):
+def scan_ports(host: str, start_port: int, end_port: int, ports=None, cancel_event=None):
+    """
+    host의 start_port~end_port 포트 스캔 (ports를 지정하면 그 포트만 검사)
+    cancel_event: set()되면 남은 포트를 검사하지 않음 (검사 실행기의 시간 초과)
+    """
     # JSON에서 설정 로드
     config = load_port_config()
     PORT_SERVICE_MAP = {int(k): v for k, v in config["port_service_map"].items()}
@@ -36,9 +42,16 @@ def scan_ports(host: str, start_port: int, end_port: int):
         print(f"유효하지 않은 호스트: {e}")
         return []
 
-    print(f"[+] {host} ({ip}) 포트 스캔 시작: {start_port}~{end_port}")
+    if ports is None:
+        ports = range(start_port, end_port + 1)
+        print(f"[+] {host} ({ip}) 포트 스캔 시작: {start_port}~{end_port}")
+    else:
+        print(f"[+] {host} ({ip}) 포트 스캔 시작: {len(ports)}개 포트")
 
-    for port in range(start_port, end_port + 1):
+    for port in ports:
+        if cancel_event is not None and cancel_event.is_set():
+            print(f"[!] 시간 초과로 포트 스캔 중단 (포트 {port}부터 검사 안 함)")
+            break
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             timeout = config.get("scan_config", {}).get("timeout", 0.1)
             s.settimeout(timeout)
@@ -60,14 +73,25 @@ def scan_ports(host: str, start_port: int, end_port: int):
     return open_ports
 
 
-def start_port_security_scan(config):
+def start_port_security_scan(config, cancel_event=None):
     """details만 반환하는 포트 스캔 함수"""
     from datetime import datetime
     
     host = config.get("host")
     if not host:
         raise ValueError("호스트 정보가 설정되지 않았습니다")
-    open_ports = scan_ports(host, 1, 1024)
+
+    # 검사 프로필의 포트 범위 (port_scope가 known이면 A05_port_config.json에 있는 포트만)
+    port_config = load_port_config()
+    scan_config = port_config.get("scan_config", {})
+    start_port, end_port = scan_limit(
+        config, "port_range", [scan_config.get("default_start_port", 1), scan_config.get("default_end_port", 1024)]
+    )
+    ports = None
+    if scan_limit(config, "port_scope") == "known":
+        ports = sorted({int(port) for port in port_config["port_service_map"]} | set(port_config["risky_ports"]))
+
+    open_ports = scan_ports(host, start_port, end_port, ports, cancel_event)
     
     # details 생성
     details = []
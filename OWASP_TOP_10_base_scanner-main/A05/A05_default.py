@@ -5,6 +5,8 @@ import time
 import json
 import os
 
+from add_in.scan_profiles import scan_limit
+
 # 프로젝트 루트 기준 절대 경로 설정
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 USER_INFO_PATH = os.path.join(PROJECT_ROOT, "etc", "user_info.json")
@@ -99,8 +101,8 @@ def extract_form_fields(inputs):
 
     return form_data, hidden_fields
 
-def attempt_login(session, post_url, account, form_data, hidden_fields):
-    """단일 계정으로 로그인 시도"""
+def attempt_login(session, post_url, account, form_data, hidden_fields, delay=1.0):
+    """단일 계정으로 로그인 시도 (delay: 시도 후 대기 시간(초))"""
     payload = {}
     
     # 필수 필드 확인 후 추가
@@ -126,7 +128,7 @@ def attempt_login(session, post_url, account, form_data, hidden_fields):
 
     print(f" [*] 시도 중: {account['username']} / {account['password']}")
     response = session.post(post_url, data=payload, headers=headers, allow_redirects=True)
-    time.sleep(1.0)
+    time.sleep(delay)
 
     soup = BeautifulSoup(response.text, "html.parser")
     final_url = response.url.lower()
@@ -144,9 +146,14 @@ def attempt_login(session, post_url, account, form_data, hidden_fields):
     print(f" [+] 최종 URL: {response.url}\n")
     return True
 
-def run_brute_force_attack(login_form, login_url):
-    """브루트포스 공격 실행"""
+def run_brute_force_attack(login_form, login_url, max_accounts=None, delay=1.0, cancel_event=None):
+    """
+    브루트포스 공격 실행 (max_accounts: 시도할 최대 계정 수, None이면 전체)
+    cancel_event: set()되면 다음 계정을 시도하지 않음 (검사 실행기의 시간 초과)
+    """
     accounts = load_accounts()
+    if max_accounts:
+        accounts = accounts[:max_accounts]
     
     if not accounts:
         print(f"[!] 계정 파일이 비어있거나 존재하지 않습니다: {ACCOUNTS_FILE}")
@@ -169,12 +176,15 @@ def run_brute_force_attack(login_form, login_url):
     session = requests.Session()
     
     for account in accounts:
-        if attempt_login(session, post_url, account, form_data, hidden_fields):
+        if cancel_event is not None and cancel_event.is_set():
+            print(" [!] 시간 초과로 브루트포스 중단")
+            break
+        if attempt_login(session, post_url, account, form_data, hidden_fields, delay):
             return True, account  # 성공한 계정 정보 반환
     
     return False, None
 
-def start_brute_force_scan(config):
+def start_brute_force_scan(config, cancel_event=None):
     """details만 반환하는 브루트포스 공격 함수"""
     from datetime import datetime
     
@@ -188,7 +198,13 @@ def start_brute_force_scan(config):
         return []
     
     # 브루트포스 공격 실행
-    success, found_account = run_brute_force_attack(login_form, login_url)
+    success, found_account = run_brute_force_attack(
+        login_form,
+        login_url,
+        max_accounts=scan_limit(config, "default_accounts"),
+        delay=scan_limit(config, "default_account_delay", 1.0),
+        cancel_event=cancel_event,
+    )
     
     # details 생성
     details = []
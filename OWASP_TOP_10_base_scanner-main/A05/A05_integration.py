@@ -12,25 +12,30 @@ sys.path.append(PROJECT_ROOT)
 from A05.A05_check_vulnerable import check_vulnerable_headers
 from A05.A05_Port_Security import start_port_security_scan
 from A05.A05_default import start_brute_force_scan
+from add_in.check_registry import register_checks, check
 
 
+@register_checks()
 class SecurityMisconfiguration:
     """A05 보안 설정 오류 통합 검사 클래스"""
 
     def __init__(self):
         pass
 
+    @check("A05-01", "취약한 HTTP 헤더 검사", inputs=("obj_list",), cost="medium", kind="network")
     def check_vulnerable_run(self, obj_list):
         """A05-01: 취약한 HTTP 헤더 검사"""
         return check_vulnerable_headers(obj_list)
 
-    def port_security_run(self, config):
+    @check("A05-02", "포트 보안 스캔", inputs=("config", "cancel_event"), cost="heavy", kind="network", priority="low")
+    def port_security_run(self, config, cancel_event=None):
         """A05-02: 포트 보안 검사"""
-        return start_port_security_scan(config)
+        return start_port_security_scan(config, cancel_event)
 
-    def default_account_run(self, config):
+    @check("A05-03", "기본 계정 침투 테스트", inputs=("config", "cancel_event"), cost="heavy", kind="network")
+    def default_account_run(self, config, cancel_event=None):
         """A05-03: 기본 계정 침투 테스트"""
-        return start_brute_force_scan(config)
+        return start_brute_force_scan(config, cancel_event)
 
     def run_all(self, obj_list, config):
         """모든 A05 검사 실행"""
@@ -6,6 +6,7 @@ import sys
 import os
 
 from A06.A06_vulnerabilityLibrary import vulnerabilityLibrary
+from add_in.check_registry import register_checks, check
 
 
 # 프로젝트 루트 경로 설정
@@ -18,12 +19,14 @@ sys.path.append(PROJECT_ROOT)
 #        return json.load(f)
 
 
+@register_checks()
 class VulnerableComponents:
     """A06 취약하고 지원되지 않는 구성 요소 통합 검사 클래스"""
 
     def __init__(self):
         pass
 
+    @check("A06-01", "취약한 라이브러리 검사", inputs=("dependency_files",), cost="medium", kind="network", priority="high")
     def vulnerability_library_run(self, dependencyfiles):
         """A06-01: 취약한 라이브러리 검사"""
         vuln_lib = vulnerabilityLibrary()
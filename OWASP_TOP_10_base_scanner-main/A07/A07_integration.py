@@ -6,12 +6,15 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(PROJECT_ROOT)
 
 from A07.A07_session_check import Session_Hijacking
+from add_in.check_registry import register_checks, check
 
+@register_checks()
 class IDAuthFail():
   
   def _init_(self):
     pass
   
+  @check("A07-01", "세션 고정 취약점 검사", inputs=("config",), cost="medium", kind="network")
   def session_management_run(self, config):
     """A07-01: 세션 관리 취약점 검사"""
     sh = Session_Hijacking()
@@ -0,0 +1,126 @@
+# 검사 플러그인 레지스트리
+# 각 Axx_integration 클래스가 검사 메서드를 메타데이터(입력, 비용, 종류)와 함께 등록하면
+# main_test는 등록된 검사 목록으로 실행 단계를 만듦 (검사를 추가해도 main_test 수정 불필요)
+#
+#     @register_checks(options=("index", "workers"))
+#     class Injection:
+#         @check("A03-01", "XSS 취약점 검사", inputs=("source_files",), cost="medium", kind="static", priority="high")
+#         def xss_run(self, source_files): ...
+
+# 검사 비용 등급 (실행 시간 기준), 큰 값일수록 오래 걸림
+COSTS = {"light": 0, "medium": 1, "heavy": 2}
+KINDS = ("static", "network")  # static: 소스/파일만 검사, network: 대상 서버에 요청
+# 검사 우선순위 (발견 가치 기준), 시간 예산이 있으면 높은 검사부터 실행
+PRIORITIES = {"low": 0, "normal": 1, "high": 2}
+
+CHECKS = {}  # test_id → CheckInfo
+
+
+class CheckInfo:
+    """
+    등록된 검사 1개
+    - inputs: 메서드에 순서대로 전달할 값 이름 (config, web_url, web_directory, obj_list, source_files, dependency_files)
+      cancel_event는 검사 실행기가 단계마다 만들어 넘기는 threading.Event (시간 초과/예산 초과 시 set())
+      on_progress는 검사 실행기가 단계마다 만들어 넘기는 진행 상황 콜백 (dict를 받아 GUI 이벤트로 전달)
+    - cost: light / medium / heavy
+    - kind: static / network
+    - priority: low / normal / high
+    """
+
+    def __init__(self, test_id, label, cls, method, inputs, cost, kind, priority="normal"):
+        self.test_id = test_id
+        self.category_id = test_id.split("-")[0]
+        self.label = label
+        self.cls = cls
+        self.method = method
+        self.inputs = tuple(inputs)
+        self.cost = cost
+        self.kind = kind
+        self.priority = priority
+
+    def run(self, instance, **values):
+        return getattr(instance, self.method)(*[values[key] for key in self.inputs])
+
+
+def check(test_id, label, inputs=(), cost="medium", kind="network", priority="normal"):
+    """Axx_integration 클래스의 검사 메서드에 메타데이터 표시 (등록은 register_checks에서)"""
+    if cost not in COSTS:
+        raise ValueError(f"알 수 없는 검사 비용 등급: {cost}")
+    if kind not in KINDS:
+        raise ValueError(f"알 수 없는 검사 종류: {kind}")
+    if priority not in PRIORITIES:
+        raise ValueError(f"알 수 없는 검사 우선순위: {priority}")
+
+    def decorator(func):
+        func.check_info = (test_id, label, tuple(inputs), cost, kind, priority)
+        return func
+
+    return decorator
+
+
+def register_checks(options=()):
+    """
+    클래스의 @check 메서드를 레지스트리에 등록
+    options: 생성자가 받는 실행 옵션 이름 (index, workers 등), 실행할 때 있는 값만 전달
+    """
+
+    def decorator(cls):
+        cls.check_options = tuple(options)
+        for name, member in vars(cls).items():
+            info = getattr(member, "check_info", None)
+            if info is None:
+                continue
+            CHECKS[info[0]] = CheckInfo(info[0], info[1], cls, name, *info[2:])
+        return cls
+
+    return decorator
+
+
+def parse_check_ids(text):
+    """'A03,A05-02' 같은 문자열 또는 목록 → ['A03', 'A05-02']"""
+    if not text:
+        return []
+    if isinstance(text, str):
+        text = text.split(",")
+    return [item.strip().upper() for item in text if item.strip()]
+
+
+def matches(test_id, selectors):
+    """test_id가 선택 목록(카테고리 A03 또는 검사 A03-01)에 포함되는지"""
+    return any(test_id == selector or test_id.startswith(selector + "-") for selector in selectors)
+
+
+def select_checks(only=None, skip=None, max_cost=None, kinds=None):
+    """
+    실행할 검사 목록 (test_id 순)
+    - only: 이 카테고리/검사만 실행 (없으면 전체)
+    - skip: 제외할 카테고리/검사
+    - max_cost: 이 등급보다 비싼 검사 제외 (예: "medium"이면 heavy 제외)
+    - kinds: 실행할 검사 종류 (예: ("static",))
+    """
+    only = parse_check_ids(only)
+    skip = parse_check_ids(skip)
+
+    selected = []
+    for test_id in sorted(CHECKS):
+        info = CHECKS[test_id]
+        if only and not matches(test_id, only):
+            continue
+        if skip and matches(test_id, skip):
+            continue
+        if max_cost and COSTS[info.cost] > COSTS[max_cost]:
+            continue
+        if kinds and info.kind not in kinds:
+            continue
+        selected.append(info)
+    return selected
+
+
+def create_instances(checks, **options):
+    """검사 클래스마다 인스턴스 1개 생성 (클래스가 선언한 옵션만 전달)"""
+    instances = {}
+    for info in checks:
+        if info.cls not in instances:
+            kwargs = {key: value for key, value in options.items() if key in info.cls.check_options}
+            instances[info.cls] = info.cls(**kwargs)
+    return instances
@@ -1,9 +1,18 @@
-from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 from urllib.parse import urlparse, urljoin, unquote, parse_qs, urlencode
+import aiohttp
+import asyncio
 import json
+import re
 import time
 
+from add_in.crawl_frontier import CrawlFrontier, MAX_PAGES, MAX_DEPTH
+from add_in.crawl_store import CrawlStore, login_identity
+from add_in.html_document import (
+    ParsedDocument, parse_document, cache_document, get_cached_document, clear_document_cache
+)
+
 INPUT_FILE = "/home/ruqos/Desktop/project/etc/crawl_input_type.json"
 
 def read_file():
@@ -33,6 +42,7 @@ class FrontCode():
         return getattr(self, key, default)
 
     def is_input_field(self, input_tag):
+        """input_tag: input 태그의 속성 dict (ParsedDocument.forms의 inputs 항목)"""
         non_input_types = self.types['non_input_types'] 
         input_types = self.types['input_types']
         
@@ -42,7 +52,7 @@ class FrontCode():
         if input_type not in input_types:
             input_type = 'text'
 
-        if input_tag.has_attr('disabled') or input_tag.has_attr('readonly'):
+        if 'disabled' in input_tag or 'readonly' in input_tag:
             return False
 
         value = input_tag.get('value', '').strip()
@@ -51,20 +61,20 @@ class FrontCode():
         likely_placeholder_value = {name, input_id}
 
         value_condition = value == '' or value in likely_placeholder_value
-        has_placeholder = input_tag.has_attr('placeholder')
+        has_placeholder = 'placeholder' in input_tag
         autocomplete_off = input_tag.get('autocomplete', '').lower() == 'off'
 
         return value_condition or has_placeholder or autocomplete_off
 
     def getFormData(self, html, url=""):
-        soup = BeautifulSoup(html, "html.parser")
-        forms = soup.find_all("form")
-
-        for form in forms:
-            form_action = form.get("action", "")
-            form_method = form.get("method", "get").lower()
-            inputs = form.find_all("input")
-            textarea = form.find_all("textarea")
+        """html: HTML 문자열 또는 크롤러가 이미 파싱한 ParsedDocument"""
+        document = html if isinstance(html, ParsedDocument) else parse_document(html)
+
+        for form in document.forms:
+            form_action = form["attrs"].get("action", "")
+            form_method = form["attrs"].get("method", "get").lower()
+            inputs = form["inputs"]
+            textarea = form["textareas"]
             input_data = {}
 
             if form_action == "" or form_action == "#":
@@ -149,27 +159,126 @@ def normalize_url(url):
 
     return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
 
-def crawl2(page, url, base_domain, depth=3, start_url=""):
-
-    # URL 정규화
-    normalized_url = normalize_url(url)
-    clean_url = unquote(normalized_url)
-
-    if depth > 3 or clean_url in visited or len(visited) > 100:
-        return
+SKIP_PATTERNS = ['.css', '.js', '.jpg', '.jpeg', '.png', '.gif', '.pdf',
+                 '/images/', '/css/', '/js/', '/modules/', '/pdf/', '/redirect']
+BLOCKED_RESOURCES = ["image", "font", "stylesheet", "media"]
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+CRAWL_WORKERS = 4  # 동시 크롤링 페이지 수 기본값 (user_info.json의 crawl_workers로 변경)
+
+# user_info.json 키 → 크롤링 설정 기본값
+CRAWL_SETTINGS = {
+    "crawl_workers": CRAWL_WORKERS,
+    "crawl_max_pages": MAX_PAGES,
+    "crawl_max_depth": MAX_DEPTH,
+    "crawl_priority": "attack_surface",
+    # "browser": 모든 페이지 브라우저 (JavaScript로 추가되는 폼까지 수집)
+    # "hybrid": HTTP 우선 + SPA로 판별된 페이지만 브라우저 (빠르지만 SPA 판별에서 빠진 페이지의 동적 폼은 놓침)
+    "crawl_mode": "browser",
+    # 이전 스캔의 크롤링 결과를 조건부 요청으로 재검증해서 재사용 (대상/로그인 계정별로 따로 저장)
+    # 304 응답 페이지는 다시 렌더링하지 않으므로 서버 응답이 같아도 스크립트 결과가 바뀌는 페이지는 이전 결과 사용
+    "crawl_cache": False,
+}
+
+# SPA 껍데기 판별용 패턴
+SPA_ROOT_PATTERN = re.compile(
+    r'<(div|main)\b[^>]*\bid=["\'](root|app|__nuxt|__next|main-app)["\'][^>]*>\s*</\1>'
+    r'|<app-root\b[^>]*>\s*</app-root>|\bng-app\b',
+    re.IGNORECASE,
+)
+SCRIPT_SRC_PATTERN = re.compile(r'<script\b[^>]*\bsrc=', re.IGNORECASE)
+INVISIBLE_PATTERN = re.compile(r'<(script|style|noscript|template)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+SPA_TEXT_THRESHOLD = 200  # 스크립트 번들이 있는 페이지의 최소 텍스트 길이
+
+crawl_stats = {}  # 마지막 크롤링 통계 (페이지 수, 소요 시간, pages/sec)
+fetch_counts = {"http": 0, "browser": 0, "cached": 0}  # 방식별 페이지 수 (하이브리드 모드/캐시 튜닝용)
+
+def normalize_domain(domain):
+    """localhost와 127.0.0.1을 같은 것으로 처리 (포트 포함하여 정규화)"""
+    if domain.startswith('localhost'):
+        return domain.replace('localhost', '127.0.0.1')
+    return domain
+
+def is_login_url(url):
+    lowered = url.lower()
+    return 'login' in lowered or 'auth' in lowered or 'connexion' in lowered
+
+def load_crawl_settings(config=None):
+    """user_info.json 설정에서 크롤링 관련 값만 뽑아 기본값과 병합"""
+    config = config or {}
+    return {key: config.get(key, default) for key, default in CRAWL_SETTINGS.items()}
+
+def claim_url(url):
+    """
+    방문 규칙(중복, 로그인 페이지 1회)을 검사하고 방문 예정으로 등록
+    방문 가능하면 정규화된 URL, 아니면 None 반환
+    (깊이와 페이지 수 제한은 CrawlFrontier가 담당)
+    """
+    clean_url = unquote(normalize_url(url))
+
+    if clean_url in visited:
+        return None
 
     # 로그인 페이지는 한 번만 크롤링
-    if 'login' in clean_url.lower() or 'auth' in clean_url.lower() or 'connexion' in clean_url.lower():
-        if any('login' in v.lower() or 'auth' in v.lower() or 'connexion' in v.lower() for v in visited):
-            print(f"[🚫] 로그인 페이지 중복 차단: {url}")
-            return
+    if is_login_url(clean_url) and any(is_login_url(v) for v in visited):
+        print(f"[🚫] 로그인 페이지 중복 차단: {url}")
+        return None
 
     visited.add(clean_url)
+    return clean_url
+
+def extract_links(document, url, base_domain, start_url):
+    """파싱된 페이지(ParsedDocument)에서 같은 도메인의 크롤링 대상 링크 추출"""
+    normalized_base = normalize_domain(base_domain)
+    links = []
+
+    for href in document.links:
+
+        # 외부 링크 필터링 (localhost와 127.0.0.1을 같은 것으로 처리)
+        if href.startswith('http'):
+            if normalize_domain(urlparse(href).netloc) != normalized_base:
+                continue
+
+        # 해시(#) 링크 처리 - SPA 라우팅
+        if href.startswith('#/'):
+            # 시작 URL에 해시 경로 추가
+            full_url = start_url.split('#')[0] + href
+        else:
+            full_url = urljoin(url, href)
+
+        # 같은 도메인만 크롤링 (localhost와 127.0.0.1 정규화)
+        netloc = urlparse(full_url).netloc
+        if netloc != '' and normalize_domain(netloc) != normalized_base:
+            continue
+
+        if any(pattern in full_url.lower() for pattern in SKIP_PATTERNS):
+            continue
+
+        if unquote(full_url) in visited:
+            continue
+        if '/login?back=' in full_url and full_url.count('login') > 1:
+            continue
+
+        links.append(full_url)
+
+    return links
+
+def crawl2(page, url, base_domain, depth=0, start_url=""):
+    """
+    단일 페이지 방문 후 다음에 방문할 링크 목록 반환
+    (재귀 호출 대신 crawl_sequential의 CrawlFrontier가 방문 순서를 결정)
+    """
+
+    # URL 정규화 및 방문 등록
+    clean_url = claim_url(url)
+    if clean_url is None:
+        return []
+
     print(f"[✔] 크롤링: {url} (깊이: {depth})")
 
     try:
-        # 해시(#) URL 처리 - SPA 라우팅
-        if '#' in url:
+        # 해시(#) URL 처리 - SPA 라우팅 (같은 문서에 있을 때만 해시 이동)
+        if '#' in url and page.url.split('#')[0] == url.split('#')[0]:
             # 해시가 있는 경우, JavaScript로 직접 navigate
             page.evaluate(f"window.location.hash = '{url.split('#')[1]}'")
             page.wait_for_timeout(500)  # 500ms로 단축
@@ -180,7 +289,7 @@ def crawl2(page, url, base_domain, depth=3, start_url=""):
 
             if not response:
                 print(f"[!] 응답 없음: {url}")
-                return
+                return []
 
             # 현재 URL 확인 (리다이렉트 체크)
             current_url = page.url
@@ -188,118 +297,359 @@ def crawl2(page, url, base_domain, depth=3, start_url=""):
             # 리다이렉션이 발생했는지 확인
             if current_url != url:
                 # 로그인 페이지로 리다이렉션되었는지 확인
-                if 'login' in current_url.lower() or 'auth' in current_url.lower() or 'connexion' in current_url.lower():
+                if is_login_url(current_url):
                     print(f"[🚫] 로그인 필요 페이지로 리다이렉션: {url} → {current_url}")
-                    return
+                    return []
 
                 # 이미 방문한 페이지로 리다이렉션된 경우
                 normalized_current = normalize_url(current_url)
                 if unquote(normalized_current) in visited:
                     print(f"[🚫] 이미 방문한 페이지로 리다이렉션: {url} → {current_url}")
-                    return
+                    return []
 
             # HTTP 에러 상태 확인
             if response.status >= 400:
                 print(f"[!] HTTP 에러: {url} (상태: {response.status})")
-                return
+                return []
 
             # JavaScript 렌더링 대기 (최소화)
             page.wait_for_timeout(300)  # 300ms로 단축 (1500ms → 300ms)
 
         # 현재 URL 재확인 (JavaScript 실행 후)
         current_url = page.url
-        current_domain = urlparse(current_url).netloc
-
-        # localhost와 127.0.0.1을 같은 것으로 처리
-        def normalize_domain(domain):
-            # 포트 포함하여 정규화
-            if domain.startswith('localhost'):
-                return domain.replace('localhost', '127.0.0.1')
-            return domain
-
-        normalized_current = normalize_domain(current_domain)
-        normalized_base = normalize_domain(base_domain)
 
         # 다른 도메인으로 리다이렉트된 경우 중단
-        if normalized_current != normalized_base:
+        if normalize_domain(urlparse(current_url).netloc) != normalize_domain(base_domain):
             print(f"[🚫] 외부 도메인으로 리다이렉트: {current_url}")
-            return
+            return []
 
         # 렌더링된 HTML 가져오기
         html_content = page.content()
         page_contents[clean_url] = html_content
+        document = cache_document(clean_url, html_content)
 
-        soup = BeautifulSoup(html_content, 'html.parser')
+        return extract_links(document, url, base_domain, start_url)
 
-        for link in soup.find_all('a'):
-            href = link.get('href')
-            if not href:
+    except Exception as e:
+        print(f"[에러] {url}: {e}")
+        return []
+
+
+def looks_like_spa(url, html_content):
+    """
+    HTTP 응답만으로는 내용을 알 수 없는 SPA 껍데기 페이지인지 판단
+    - 해시 라우팅(#/...) URL
+    - 비어 있는 루트 마운트 지점(<div id="root"></div>, <app-root> 등)
+    - 스크립트 번들만 있고 화면에 보일 텍스트가 거의 없는 페이지
+    """
+    fragment = urlparse(url).fragment
+    if fragment.startswith('/') or fragment.startswith('!'):
+        return True
+
+    if SPA_ROOT_PATTERN.search(html_content):
+        return True
+
+    if SCRIPT_SRC_PATTERN.search(html_content):
+        text = TAG_PATTERN.sub(' ', INVISIBLE_PATTERN.sub(' ', html_content))
+        if len(' '.join(text.split())) < SPA_TEXT_THRESHOLD:
+            return True
+
+    return False
+
+
+class AsyncCrawler:
+    """
+    공유 대기열 기반 비동기 크롤러 (crawl2와 같은 방문 규칙 적용)
+    - browser 모드: 모든 페이지를 BrowserPagePool의 페이지로 렌더링
+    - hybrid 모드: 커넥션 풀을 쓰는 HTTP 클라이언트로 먼저 가져오고 SPA 페이지만 렌더링
+    - store(CrawlStore)가 있으면 조건부 요청으로 재검증해서 바뀌지 않은 페이지는 캐시 사용
+    """
+
+    def __init__(self, pool, session, frontier, base_domain, start_url, mode="hybrid", store=None):
+        self.pool = pool
+        self.session = session
+        self.frontier = frontier
+        self.base_domain = base_domain
+        self.start_url = start_url
+        self.mode = mode
+        self.store = store
+        self.in_flight = 0
+
+    async def run(self, workers):
+        await asyncio.gather(*[self.worker(i + 1) for i in range(workers)])
+
+    async def worker(self, worker_id):
+        """대기열에서 URL을 꺼내 방문하고, 발견한 링크를 다시 대기열에 넣는 워커"""
+        while True:
+            item = self.frontier.pop()
+            if item is None:
+                # 다른 워커가 처리 중인 페이지에서 새 링크가 나올 수 있으므로 모두 끝날 때까지 대기
+                if self.in_flight == 0 or self.frontier.exhausted():
+                    return
+                await asyncio.sleep(0.05)
                 continue
 
-            # 외부 링크 필터링 (localhost와 127.0.0.1을 같은 것으로 처리)
-            if href.startswith('http'):
-                href_domain = urlparse(href).netloc
-                normalized_href_domain = normalize_domain(href_domain)
-                if normalized_href_domain != normalized_base:
-                    continue
-
-            # 해시(#) 링크 처리 - SPA 라우팅
-            if href.startswith('#/'):
-                # 시작 URL에 해시 경로 추가
-                full_url = start_url.split('#')[0] + href
-            else:
-                full_url = urljoin(url, href)
-
-            parsed_url = urlparse(full_url)
-
-            # 같은 도메인만 크롤링 (localhost와 127.0.0.1 정규화)
-            if parsed_url.netloc != '':
-                normalized_link_domain = normalize_domain(parsed_url.netloc)
-                if normalized_link_domain != normalized_base:
-                    continue
-
-            clean_full_url = unquote(full_url)
-
-            skip_patterns = ['.css', '.js', '.jpg', '.jpeg', '.png', '.gif', '.pdf',
-                            '/images/', '/css/', '/js/', '/modules/', '/pdf/', '/redirect']
-            if any(pattern in full_url.lower() for pattern in skip_patterns):
-                continue
+            url, depth = item
+            self.in_flight += 1
+            try:
+                links = await self.visit(url, depth, worker_id)
+                for link in links:
+                    self.frontier.push(link, depth + 1)
+            finally:
+                self.in_flight -= 1
+
+    async def visit(self, url, depth, worker_id):
+        """단일 페이지 방문 후 다음에 방문할 링크 목록 반환"""
+        clean_url = claim_url(url)
+        if clean_url is None:
+            return []
+
+        validators = self.store.validators(clean_url) if self.store else {}
+        hash_route = looks_like_spa(url, "")
+
+        if self.session is not None and not hash_route and (self.mode == "hybrid" or validators):
+            result, html_content, headers = await self.fetch_static(url, clean_url, validators)
+            if result == "skip":
+                return []
+            if result == "cached":
+                print(f"[✔] 크롤링[W{worker_id}/캐시]: {url} (깊이: {depth})")
+                fetch_counts["cached"] += 1
+                return self.finish(url, clean_url, self.store.load_html(clean_url))
+            if result == "ok" and self.mode == "hybrid":
+                print(f"[✔] 크롤링[W{worker_id}/HTTP]: {url} (깊이: {depth})")
+                fetch_counts["http"] += 1
+                if self.store:
+                    self.store.save_page(clean_url, html_content, headers)
+                return self.finish(url, clean_url, html_content)
+
+        print(f"[✔] 크롤링[W{worker_id}]: {url} (깊이: {depth})")
+        fetch_counts["browser"] += 1
+        page = await self.pool.acquire()
+        try:
+            return await self.render(page, url, clean_url)
+        finally:
+            self.pool.release(page)
+
+    def finish(self, url, clean_url, html_content):
+        """HTML 저장 및 파싱 후 링크 추출"""
+        page_contents[clean_url] = html_content
+        document = cache_document(clean_url, html_content)
+        return extract_links(document, url, self.base_domain, self.start_url)
+
+    async def fetch_static(self, url, clean_url, validators):
+        """
+        브라우저 없이 HTTP 요청으로 페이지를 가져옴 (validators가 있으면 조건부 요청)
+        반환: (결과, html, 응답 헤더)
+            결과 - "ok" / "cached"(304) / "skip" / "browser"(SPA이거나 요청 실패 → 렌더링 필요)
+        """
+        try:
+            async with self.session.get(url, allow_redirects=True, headers=validators) as response:
+                if response.status == 304 and validators:
+                    return "cached", None, None
+
+                current_url = str(response.url)
+
+                if current_url != url:
+                    if is_login_url(current_url):
+                        print(f"[🚫] 로그인 필요 페이지로 리다이렉션: {url} → {current_url}")
+                        return "skip", None, None
+
+                    normalized_current = unquote(normalize_url(current_url))
+                    if normalized_current != clean_url and normalized_current in visited:
+                        print(f"[🚫] 이미 방문한 페이지로 리다이렉션: {url} → {current_url}")
+                        return "skip", None, None
+
+                if response.status >= 400:
+                    print(f"[!] HTTP 에러: {url} (상태: {response.status})")
+                    return "skip", None, None
+
+                if normalize_domain(urlparse(current_url).netloc) != normalize_domain(self.base_domain):
+                    print(f"[🚫] 외부 도메인으로 리다이렉트: {current_url}")
+                    return "skip", None, None
+
+                if 'html' not in response.headers.get('Content-Type', 'text/html').lower():
+                    return "skip", None, None
+
+                html_content = await response.text(errors='ignore')
+                headers = dict(response.headers)
+        except Exception as e:
+            print(f"[!] HTTP 요청 실패, 브라우저로 재시도: {url} ({e})")
+            return "browser", None, None
+
+        if looks_like_spa(url, html_content):
+            return "browser", None, None
+
+        return "ok", html_content, headers
+
+    async def render(self, page, url, clean_url):
+        """브라우저 페이지로 렌더링 후 HTML을 저장하고 링크 목록 반환"""
+        try:
+            # 해시(#) URL은 같은 문서 내 이동이라 응답이 없을 수 있음
+            response = await page.goto(url, timeout=5000, wait_until='domcontentloaded')
+
+            if not response and '#' not in url:
+                print(f"[!] 응답 없음: {url}")
+                return []
 
-            if (clean_full_url not in visited and
-                not ('/login?back=' in full_url and full_url.count('login') > 1)):
-                crawl2(page, full_url, base_domain, depth + 1, start_url)
+            if response:
+                current_url = page.url
 
-    except Exception as e:
-        print(f"[에러] {url}: {e}")
+                if current_url != url:
+                    if is_login_url(current_url):
+                        print(f"[🚫] 로그인 필요 페이지로 리다이렉션: {url} → {current_url}")
+                        return []
 
+                    # 다른 워커가 이미 방문한 페이지로 리다이렉션된 경우
+                    normalized_current = unquote(normalize_url(current_url))
+                    if normalized_current != clean_url and normalized_current in visited:
+                        print(f"[🚫] 이미 방문한 페이지로 리다이렉션: {url} → {current_url}")
+                        return []
 
-def start_crawl2(url, login_path, login_data):
-    print("[✔] Playwright 기반 크롤링 시작...")
-    obj_list = list()
+                if response.status >= 400:
+                    print(f"[!] HTTP 에러: {url} (상태: {response.status})")
+                    return []
 
-    # visited와 page_contents 초기화
-    global visited, page_contents
-    visited = set()
-    page_contents = {}
+            # JavaScript 렌더링 대기 (최소화)
+            await page.wait_for_timeout(300)
 
-    start_url = url
-    base_domain = urlparse(start_url).netloc
-    print(f"[✔] Base Domain: {base_domain}")
+            current_url = page.url
+            if normalize_domain(urlparse(current_url).netloc) != normalize_domain(self.base_domain):
+                print(f"[🚫] 외부 도메인으로 리다이렉트: {current_url}")
+                return []
+
+            html_content = await page.content()
+            if self.store and response:
+                self.store.save_page(clean_url, html_content, response.headers, rendered=True)
+
+            return self.finish(url, clean_url, html_content)
+
+        except Exception as e:
+            print(f"[에러] {url}: {e}")
+            return []
+
+
+async def block_resources(route):
+    # 불필요한 리소스 차단으로 속도 향상 (이미지, 폰트, 스타일시트 등)
+    if route.request.resource_type in BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPagePool:
+    """
+    워커들이 나눠 쓰는 Playwright 페이지 풀
+    Chromium은 처음 페이지가 필요할 때 실행됨 (정적 사이트는 브라우저 없이 끝남)
+    """
+
+    def __init__(self, playwright, size):
+        self.playwright = playwright
+        self.size = size
+        self.browser = None
+        self.context = None
+        self.created = 0
+        self.idle_pages = asyncio.Queue()
+        self.lock = asyncio.Lock()
+
+    async def start(self):
+        async with self.lock:
+            if self.context is None:
+                self.browser = await self.playwright.chromium.launch(headless=True)
+                # 하나의 컨텍스트를 공유하므로 로그인 쿠키도 모든 페이지에 적용됨
+                self.context = await self.browser.new_context(user_agent=USER_AGENT)
+                await self.context.route("**/*", block_resources)
+
+    async def acquire(self):
+        await self.start()
+        if self.idle_pages.empty() and self.created < self.size:
+            self.created += 1
+            return await self.context.new_page()
+        return await self.idle_pages.get()
+
+    def release(self, page):
+        self.idle_pages.put_nowait(page)
+
+    async def cookie_header(self):
+        """브라우저 로그인 세션을 HTTP 클라이언트에서도 쓰기 위한 Cookie 헤더"""
+        if self.context is None:
+            return ""
+        cookies = await self.context.cookies()
+        return "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+
+    async def close(self):
+        if self.browser is not None:
+            await self.browser.close()
+
+
+async def login_async(page, url, login_path, login_data):
+    login_url = urljoin(url, login_path)
+    print(f"[✔] 로그인 시도: {login_url}")
+    try:
+        await page.goto(login_url, timeout=5000, wait_until='domcontentloaded')
+        await page.wait_for_timeout(500)
 
+        for key, value in login_data.items():
+            try:
+                await page.fill(f'input[name="{key}"]', value)
+            except Exception:
+                pass
+
+        try:
+            await page.click('button[type="submit"]')
+            await page.wait_for_timeout(1000)
+        except Exception:
+            print("[!] 로그인 버튼을 찾을 수 없음")
+    except Exception as e:
+        print(f"[!] 로그인 실패: {e}")
+
+
+async def crawl_concurrent(start_url, base_domain, login_path, login_data, frontier, workers, mode, store=None):
+    """
+    AsyncCrawler로 N개의 워커를 돌려 동시 크롤링
+    (HTTP 세션은 hybrid 모드이거나 캐시 재검증이 필요할 때 생성)
+    """
+    async with async_playwright() as p:
+        pool = BrowserPagePool(p, workers)
+        session = None
+        try:
+            if login_path and login_data:
+                page = await pool.acquire()
+                await login_async(page, start_url, login_path, login_data)
+                pool.release(page)
+
+            if mode == "hybrid" or store is not None:
+                headers = {"User-Agent": USER_AGENT}
+                cookie_header = await pool.cookie_header()
+                if cookie_header:
+                    headers["Cookie"] = cookie_header
+                session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=workers * 2, limit_per_host=workers),
+                    timeout=aiohttp.ClientTimeout(total=5),
+                    headers=headers,
+                )
+
+            crawler = AsyncCrawler(pool, session, frontier, base_domain, start_url, mode, store)
+            await crawler.run(workers)
+        finally:
+            if session is not None:
+                await session.close()
+            await pool.close()
+
+
+def crawl_sequential(start_url, base_domain, login_path, login_data, frontier):
+    """단일 페이지로 순차 크롤링 (기존 방식)"""
     with sync_playwright() as p:
         # Chromium 브라우저 실행 (헤드리스 모드)
         browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        )
+        context = browser.new_context(user_agent=USER_AGENT)
         page = context.new_page()
 
         # 불필요한 리소스 차단으로 속도 향상 (이미지, 폰트, 스타일시트 등)
-        page.route("**/*", lambda route: route.abort() if route.request.resource_type in ["image", "font", "stylesheet", "media"] else route.continue_())
+        page.route("**/*", lambda route: route.abort() if route.request.resource_type in BLOCKED_RESOURCES else route.continue_())
 
         # 로그인 처리 (login_data가 있는 경우)
         if login_path and login_data:
-            login_url = urljoin(url, login_path)
+            login_url = urljoin(start_url, login_path)
             print(f"[✔] 로그인 시도: {login_url}")
             try:
                 page.goto(login_url, timeout=5000, wait_until='domcontentloaded')
@@ -321,28 +671,99 @@ def start_crawl2(url, login_path, login_data):
             except Exception as e:
                 print(f"[!] 로그인 실패: {e}")
 
-        # 크롤링 시작
-        crawl2(page, start_url, base_domain, 0, start_url)
+        # 크롤링 시작 (우선순위 순서대로 대기열 처리)
+        while True:
+            item = frontier.pop()
+            if item is None:
+                break
+            url, depth = item
+            for link in crawl2(page, url, base_domain, depth, start_url):
+                frontier.push(link, depth + 1)
 
-        print(f"\n[✔] 크롤링 완료된 총 링크 수: {len(visited)}")
+        browser.close()
 
-        types = read_file()
 
-        # 저장된 HTML 콘텐츠로 폼 데이터 추출
-        for path in visited:
-            html_content = page_contents.get(path, "")
-            if not html_content:
-                continue
+def start_crawl2(url, login_path, login_data, settings=None):
+    """
+    크롤링 실행 후 폼이 있는 페이지의 FrontCode 목록 반환
 
-            # 헤더는 빈 딕셔너리로 설정 (Playwright에서는 response headers 접근이 다름)
-            header = {}
-            obj = FrontCode(path, header, types)
-            obj.getFormData(html_content, start_url)
+    Args:
+        settings: load_crawl_settings() 형식의 크롤링 설정
+            - crawl_workers: 동시에 사용할 브라우저 페이지 수 (1이면 순차 크롤링)
+            - crawl_max_pages / crawl_max_depth: 방문 페이지 수 / 링크 깊이 제한
+            - crawl_priority: 방문 우선순위 전략 ("attack_surface", "bfs")
+            - crawl_mode: "browser"(모든 페이지 브라우저, 기본값) / "hybrid"(HTTP 우선, SPA만 브라우저)
+            - crawl_cache: 디스크 크롤링 캐시(CrawlStore) 사용 여부 (기본값 사용 안 함)
+    """
+    print("[✔] Playwright 기반 크롤링 시작...")
+    obj_list = list()
+
+    # visited와 page_contents 초기화
+    global visited, page_contents
+    visited = set()
+    page_contents = {}
+    clear_document_cache()
 
-            if obj.formData != []:
-                obj_list.append(obj)
+    start_url = url
+    base_domain = urlparse(start_url).netloc
+    print(f"[✔] Base Domain: {base_domain}")
 
-        browser.close()
+    settings = load_crawl_settings(settings)
+    workers = max(1, int(settings["crawl_workers"] or 1))
+    frontier = CrawlFrontier(
+        max_pages=int(settings["crawl_max_pages"]),
+        max_depth=int(settings["crawl_max_depth"]),
+        priority=settings["crawl_priority"],
+        normalize=normalize_url,
+    )
+    frontier.push(start_url, 0)
+    mode = settings["crawl_mode"]
+    store = CrawlStore(identity=login_identity(start_url, login_path, login_data)) if settings["crawl_cache"] else None
+    fetch_counts.update({"http": 0, "browser": 0, "cached": 0})
+    started = time.time()
+
+    # 하이브리드 모드와 캐시 재검증은 워커 수와 관계없이 비동기 크롤러에서 동작
+    if workers > 1 or mode == "hybrid" or store is not None:
+        print(f"[✔] 동시 크롤링 모드: 워커 {workers}개 ({mode})")
+        asyncio.run(crawl_concurrent(start_url, base_domain, login_path, login_data, frontier, workers, mode, store))
+        if store is not None:
+            store.save()
+    else:
+        crawl_sequential(start_url, base_domain, login_path, login_data, frontier)
+
+    elapsed = time.time() - started
+    crawl_stats.clear()
+    crawl_stats.update({
+        "workers": workers,
+        "pages": len(page_contents),
+        "elapsed": round(elapsed, 2),
+        "pages_per_sec": round(len(page_contents) / elapsed, 2) if elapsed > 0 else 0.0,
+        "http_pages": fetch_counts["http"],
+        "browser_pages": fetch_counts["browser"],
+        "cached_pages": fetch_counts["cached"],
+    })
+
+    print(f"\n[✔] 크롤링 완료된 총 링크 수: {len(visited)}")
+    print(f"[✔] 크롤링 속도: {crawl_stats['pages']}페이지 / {crawl_stats['elapsed']}초 "
+          f"({crawl_stats['pages_per_sec']} pages/sec, 워커 {workers}개)")
+    print(f"[✔] HTTP {fetch_counts['http']}페이지 / 브라우저 {fetch_counts['browser']}페이지 "
+          f"/ 캐시 재사용 {fetch_counts['cached']}페이지")
+
+    types = read_file()
+
+    # 크롤링 중 파싱해 둔 문서로 폼 데이터 추출 (재파싱 없음)
+    for path in visited:
+        document = get_cached_document(path)
+        if document is None:
+            continue
+
+        # 헤더는 빈 딕셔너리로 설정 (Playwright에서는 response headers 접근이 다름)
+        header = {}
+        obj = FrontCode(path, header, types)
+        obj.getFormData(document, start_url)
+
+        if obj.formData != []:
+            obj_list.append(obj)
 
     return obj_list
 
@@ -355,7 +776,10 @@ if __name__ == "__main__":
     
     url = config["web_url"]
 
-    obj_list = start_crawl2(url, "", "")
+    obj_list = start_crawl2(url, "", "", settings=config)
+
+    from add_in.crawl_artifact import save_crawl_artifact
+    save_crawl_artifact(obj_list, "./crawl_artifact.jsonl", target=url)
 
     li = []
     print(f"    → 크롤링 완료: {len(obj_list)}개 페이지 발견")
@@ -0,0 +1,69 @@
+import json
+import os
+from datetime import datetime
+
+from add_in.crawl2 import FrontCode
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CRAWL_ARTIFACT = os.path.join(PROJECT_ROOT, "add_in", "crawl_artifact.jsonl")
+
+ARTIFACT_FORMAT = "owasp-crawl"
+ARTIFACT_VERSION = 1
+
+
+def save_crawl_artifact(obj_list, path=CRAWL_ARTIFACT, target=""):
+    """
+    크롤링 결과(FrontCode 목록)를 JSON Lines 파일로 저장
+    - 1번째 줄: 헤더 (형식, 버전, 대상 URL, 생성 시각, 입력 타입 설정)
+    - 2번째 줄부터: 페이지 1개당 1줄 (path, header, login_form, formData)
+    """
+    types = obj_list[0].types if obj_list else {}
+    header = {
+        "format": ARTIFACT_FORMAT,
+        "version": ARTIFACT_VERSION,
+        "target": target,
+        "created_at": datetime.now().isoformat(),
+        "types": types,
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(header, ensure_ascii=False) + "\n")
+        for obj in obj_list:
+            record = {
+                "path": obj.path,
+                "header": dict(obj.header),
+                "login_form": obj.login_form,
+                "formData": obj.formData,
+            }
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    return path
+
+
+def iter_crawl_artifact(path=CRAWL_ARTIFACT):
+    """저장된 크롤링 결과를 한 줄씩 읽어 FrontCode 객체로 반환 (generator)"""
+    with open(path, "r", encoding="utf-8") as f:
+        first_line = f.readline()
+        if not first_line.strip():
+            return
+        header = json.loads(first_line)
+
+        if header.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(f"크롤링 결과 파일이 아닙니다: {path}")
+        if header.get("version") != ARTIFACT_VERSION:
+            raise ValueError(f"지원하지 않는 크롤링 결과 버전: {header.get('version')} (지원: {ARTIFACT_VERSION})")
+
+        types = header.get("types", {})
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            obj = FrontCode(record["path"], record.get("header", {}), types)
+            obj.login_form = record.get("login_form", [])
+            obj.formData = record.get("formData", [])
+            yield obj
+
+
+def load_crawl_artifact(path=CRAWL_ARTIFACT):
+    return list(iter_crawl_artifact(path))
@@ -0,0 +1,131 @@
+import heapq
+import re
+from itertools import count
+from urllib.parse import urlparse, unquote, parse_qs
+
+
+MAX_PAGES = 100  # 크롤링할 최대 페이지 수 (user_info.json의 crawl_max_pages)
+MAX_DEPTH = 3    # 최대 링크 깊이 (user_info.json의 crawl_max_depth)
+MAX_PER_TEMPLATE = 3  # 같은 경로 템플릿(/product/1, /product/2 ...)당 최대 방문 수
+
+# 폼이 있을 가능성이 높은 경로 키워드 (공격 표면 우선 탐색)
+FORM_HINTS = ['login', 'signin', 'register', 'signup', 'account', 'search', 'contact',
+              'cart', 'order', 'checkout', 'comment', 'review', 'upload', 'password',
+              'profile', 'edit', 'admin', 'form', 'subscribe', 'authentication']
+
+_ID_SEGMENT = re.compile(r'^(\d+|[0-9a-f]{8,}|[0-9a-f-]{36})$', re.IGNORECASE)
+_NUMBERED_SLUG = re.compile(r'^\d+-')
+
+
+def is_id_like(value):
+    """숫자/해시/UUID 또는 숫자로 시작하는 슬러그 (같은 종류의 페이지마다 바뀌는 값)"""
+    return bool(_ID_SEGMENT.match(value) or _NUMBERED_SLUG.match(value))
+
+
+def path_template(url):
+    """
+    URL을 경로 템플릿으로 변환 (숫자/ID 세그먼트와 ID 같은 쿼리 값만 {id}로 바꿈)
+    쿼리 값이 페이지 종류를 정하는 앱(?controller=cart)은 값이 달라지면 다른 템플릿
+    예) /product/12-shirt?id=3&controller=product → /product/{id}?controller=product&id={id}
+    """
+    parsed = urlparse(unquote(url))
+    segments = []
+    for segment in parsed.path.split('/'):
+        if is_id_like(segment):
+            segments.append('{id}')
+        else:
+            segments.append(segment)
+
+    template = '/'.join(segments)
+    if parsed.query:
+        params = parse_qs(parsed.query, keep_blank_values=True)
+        template += '?' + '&'.join(
+            f"{key}={'{id}' if any(is_id_like(value) for value in params[key]) else ','.join(params[key])}"
+            for key in sorted(params)
+        )
+    if parsed.fragment.startswith('/'):
+        template += '#' + parsed.fragment
+    return template
+
+
+def breadth_first_priority(url, depth):
+    """깊이 순서대로 방문 (순수 BFS)"""
+    return depth
+
+
+def attack_surface_priority(url, depth):
+    """
+    공격 표면 우선 방문: 쿼리 파라미터가 있거나 폼이 있을 법한 페이지를 먼저 방문
+    같은 점수 안에서는 깊이가 얕은 페이지 우선 (값이 작을수록 먼저 방문)
+    """
+    lowered = url.lower()
+    score = depth
+    if urlparse(url).query:
+        score -= 1
+    if any(hint in lowered for hint in FORM_HINTS):
+        score -= 1
+    return score
+
+
+PRIORITY_STRATEGIES = {
+    "bfs": breadth_first_priority,
+    "attack_surface": attack_surface_priority,
+}
+
+
+class CrawlFrontier:
+    """
+    우선순위 기반 크롤링 대기열 (heap)
+    - 재귀 대신 명시적인 대기열로 방문 순서를 결정
+    - 페이지 수/깊이 제한과 경로 템플릿 중복 제거를 한 곳에서 처리
+    """
+
+    def __init__(self, max_pages=MAX_PAGES, max_depth=MAX_DEPTH, priority="attack_surface",
+                 max_per_template=MAX_PER_TEMPLATE, normalize=None):
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.max_per_template = max_per_template
+        self.normalize = normalize or (lambda url: url)
+
+        if callable(priority):
+            self.priority = priority
+        else:
+            self.priority = PRIORITY_STRATEGIES.get(priority, attack_surface_priority)
+
+        self._heap = []
+        self._order = count()  # 같은 우선순위는 발견 순서대로
+        self.seen = set()
+        self.template_counts = {}
+        self.dispatched = 0
+
+    def push(self, url, depth):
+        """URL을 대기열에 추가 (추가되면 True)"""
+        if depth > self.max_depth:
+            return False
+
+        key = unquote(self.normalize(url))
+        if key in self.seen:
+            return False
+
+        template = path_template(url)
+        if self.template_counts.get(template, 0) >= self.max_per_template:
+            return False
+
+        self.seen.add(key)
+        self.template_counts[template] = self.template_counts.get(template, 0) + 1
+        heapq.heappush(self._heap, (self.priority(url, depth), next(self._order), url, depth))
+        return True
+
+    def pop(self):
+        """다음 방문할 (url, depth) 반환, 비었거나 페이지 제한에 도달하면 None"""
+        if not self._heap or self.exhausted():
+            return None
+        _, _, url, depth = heapq.heappop(self._heap)
+        self.dispatched += 1
+        return url, depth
+
+    def exhausted(self):
+        return self.dispatched >= self.max_pages
+
+    def __len__(self):
+        return len(self._heap)
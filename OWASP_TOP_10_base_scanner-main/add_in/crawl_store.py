@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CRAWL_CACHE_DIR = os.path.join(PROJECT_ROOT, "add_in", "crawl_cache")
+
+# 저장하지 않을 응답 헤더 (세션 값/요청마다 바뀌는 값)
+SKIP_HEADERS = {"set-cookie", "date", "connection", "keep-alive", "transfer-encoding"}
+
+
+def login_identity(url, login_path="", login_data=None):
+    """
+    크롤링 캐시 구분 키 (대상 + 로그인 정보의 해시, 비밀번호는 저장하지 않음)
+    로그인 계정마다 보이는 페이지/폼이 다르므로 다른 계정으로 크롤링한 캐시는 재사용하지 않음
+    """
+    if not (login_path and login_data):
+        identity = {"url": url, "login": None}
+    else:
+        identity = {"url": url, "login": login_path, "data": sorted((login_data or {}).items())}
+    return hashlib.sha1(json.dumps(identity, ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
+
+
+class CrawlStore:
+    """
+    스캔 사이에 유지되는 크롤링 캐시 (대상/로그인 계정별 디렉토리: crawl_cache/<login_identity>)
+    - index.json: URL → ETag/Last-Modified, 응답 헤더, 렌더링 여부, 저장 시각
+    - pages/<sha1>.html: URL별 HTML
+    다음 스캔에서 If-None-Match / If-Modified-Since 조건부 요청으로 재검증하고,
+    304 응답이면 저장된 HTML을 그대로 사용 (브라우저 렌더링 생략)
+    """
+
+    def __init__(self, cache_dir=CRAWL_CACHE_DIR, identity=None):
+        self.cache_dir = os.path.join(cache_dir, identity) if identity else cache_dir
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self.pages_dir = os.path.join(self.cache_dir, "pages")
+        self.index = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _page_path(self, url):
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.pages_dir, f"{digest}.html")
+
+    def validators(self, url):
+        """저장된 페이지의 조건부 요청 헤더 (재검증할 수 없으면 빈 dict)"""
+        entry = self.index.get(url)
+        if not entry or not os.path.exists(self._page_path(url)):
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def load_html(self, url):
+        try:
+            with open(self._page_path(url), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def save_page(self, url, html, headers, rendered=False):
+        """페이지 HTML과 재검증용 헤더 저장 (headers: 응답 헤더 dict)"""
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+
+        os.makedirs(self.pages_dir, exist_ok=True)
+        with open(self._page_path(url), "w", encoding="utf-8") as f:
+            f.write(html)
+
+        self.index[url] = {
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "headers": {k: v for k, v in headers.items() if k not in SKIP_HEADERS},
+            "rendered": rendered,
+            "fetched_at": datetime.now().isoformat(),
+        }
+
+    def save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False)
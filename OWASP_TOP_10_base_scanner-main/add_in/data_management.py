@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 import json
+import os
 
 
 LANG_EXT = {
@@ -88,6 +90,23 @@ DEPENDENCY_FILES = [
     "Gemfile.lock"
 ] 
 
+# 수집하지 않을 디렉토리 (외부 라이브러리/빌드 결과/VCS)
+EXCLUDE_DIRS = [
+    "node_modules",
+    "vendor",
+    ".git",
+    ".svn",
+    ".hg",
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".idea",
+    ".vscode",
+    ".cache",
+]
+MAX_FILE_SIZE = 64 * 1024 * 1024  # 이보다 큰 파일은 수집하지 않음 (1MB 이상은 A02/A03에서 mmap으로 검사)
+COLLECT_WORKERS = 8  # 디렉토리 탐색/파일 읽기 스레드 수
+
 def data_processing(vulnerability_data, vuln_number, vulner_name):
     processed_data = {
         "categories": {
@@ -132,6 +151,117 @@ def data_processing(vulnerability_data, vuln_number, vulner_name):
 
 
 
+class SourceFile:
+    """
+    수집된 소스 파일 1개 (경로와 언어만 보관, 내용은 필요할 때 디스크에서 읽음)
+    기존 dict 형식({"path", "language", "content"})처럼 source["content"], source.get(...)으로 접근 가능
+    """
+    __slots__ = ("path", "language", "size")
+
+    def __init__(self, path, language, size=None):
+        self.path = path
+        self.language = language
+        self.size = size
+
+    @property
+    def content(self):
+        # 캐시하지 않음: 검사 중에도 메모리에는 지금 검사 중인 파일만 남음
+        try:
+            return Path(self.path).read_text(encoding="utf-8", errors="ignore")
+        except Exception as e:
+            print(f"⚠️ {self.path} 읽기 실패: {e}")
+            return ""
+
+    def __getitem__(self, key):
+        if key not in ("path", "language", "content", "size"):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_manifest(self):
+        """manage_data.json에 저장할 항목 (내용 제외)"""
+        return {"path": self.path, "language": self.language, "size": self.size}
+
+
+def load_source_files(entries):
+    """
+    manage_data.json의 source_files 항목을 검사용 목록으로 변환
+    - 내용이 없는 매니페스트 항목 → SourceFile (지연 로딩)
+    - 예전 형식(content 포함) 항목 → 그대로 사용
+    """
+    source_files = []
+    for entry in entries:
+        if "content" in entry:
+            source_files.append(entry)
+        else:
+            source_files.append(SourceFile(entry["path"], entry.get("language", ""), entry.get("size")))
+    return source_files
+
+
+def scan_directory(directory, exclude_dirs):
+    """디렉토리 한 단계만 탐색 → (하위 디렉토리 목록, (경로, 파일명, 크기) 파일 목록)"""
+    subdirs = []
+    files = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_dirs:
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        files.append((entry.path, entry.name, entry.stat().st_size))
+                except OSError as e:
+                    print(f"⚠️ {entry.path} 읽기 실패: {e}")
+    except OSError as e:
+        print(f"⚠️ {directory} 탐색 실패: {e}")
+    return subdirs, files
+
+
+def walk_project(path, exclude_dirs=EXCLUDE_DIRS, workers=COLLECT_WORKERS):
+    """
+    스레드 풀로 디렉토리들을 동시에 탐색해서 (경로, 파일명, 크기) 목록 반환 (경로 순 정렬)
+    기존 rglob("*/*")와 같이 최상위 폴더 바로 아래 파일은 제외하고 하위 디렉토리만 탐색
+    """
+    exclude_dirs = set(exclude_dirs)
+    files = []
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(scan_directory, path, exclude_dirs): True}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                is_root = pending.pop(future)
+                subdirs, entries = future.result()
+                if not is_root:
+                    files.extend(entries)
+                for subdir in subdirs:
+                    pending[executor.submit(scan_directory, subdir, exclude_dirs)] = False
+
+    files.sort()
+    return files
+
+
+def read_text_file(path):
+    try:
+        return Path(path).read_text(encoding="utf-8", errors="ignore")
+    except Exception as e:
+        print(f"⚠️ {path} 읽기 실패: {e}")
+        return None
+
+
+def source_language(name):
+    """검사 대상 소스 파일이면 언어 이름, 아니면 None"""
+    if name in DEPENDENCY_FILES:
+        return None
+    return LANG_EXT.get(os.path.splitext(name)[1].lower())
+
+
 def format_project_data(sources, dependency_files):
     data_list = {
         "project_id" : "",
@@ -150,12 +280,8 @@ def format_project_data(sources, dependency_files):
         ]
     }
 
-    for path, (content, language) in sources.items():
-        data_list["source_files"].append({
-            "path": path,
-            "language": language,
-            "content": content
-        })
+    # sources: SourceFile 목록 (내용은 검사할 때 읽음)
+    data_list["source_files"].extend(sources)
         
     for name, content in dependency_files.items():
         data_list["dependency_files"].append({
@@ -165,41 +291,59 @@ def format_project_data(sources, dependency_files):
         
     return data_list
 
-def file_collection(path):
-    base = Path(path)
+def file_collection(path, exclude_dirs=EXCLUDE_DIRS, max_file_size=MAX_FILE_SIZE, workers=COLLECT_WORKERS):
+    """
+    프로젝트 파일 수집 (스레드 풀로 디렉토리 탐색과 의존성 파일 읽기를 병렬 처리)
+    - source_files: SourceFile 목록 (내용은 A02/A03 검사 시 파일별로 읽음)
+    - dependency_files: 크기가 작으므로 내용까지 읽음
+    - exclude_dirs에 있는 디렉토리와 max_file_size보다 큰 파일은 건너뜀
+    """
+    sources = []
+    dependency_paths = []
+    skipped = 0
 
-    sources = {}
-    dependency_files = {}
-    
-    for f in base.rglob("*/*"):  # 모든 하위 디렉토리 탐색
-        
-        if f.is_file():
-            # context = f.read_text(encoding="utf-8", errors="ignore").replace("\n", "")
+    for file_path, name, size in walk_project(path, exclude_dirs, workers):
+        if size > max_file_size:
+            skipped += 1
+            continue
 
-            if f.name in DEPENDENCY_FILES:
-                try:
-                    context = "".join(f.read_text(encoding="utf-8", errors="ignore"))
-                    dependency_files[f.name] = context
-                except Exception as e:
-                    print(f"⚠️ {f} 읽기 실패: {e}")
-                    
-            elif f.suffix.lower() in list(LANG_EXT.keys()):
-                try:
-                    context = "".join(f.read_text(encoding="utf-8", errors="ignore"))
-                    language = LANG_EXT[f.suffix.lower()]
-                    sources[str(f.resolve())] = context, language
-                except Exception as e:
-                    print(f"⚠️ {f} 읽기 실패: {e}")
+        if name in DEPENDENCY_FILES:
+            dependency_paths.append((name, file_path))
+            continue
 
+        language = source_language(name)
+        if language is not None:
+            sources.append(SourceFile(os.path.realpath(file_path), language, size))
+
+    if skipped:
+        print(f"⚠️ 크기 제한({max_file_size} bytes)을 넘는 파일 {skipped}개 제외")
+
+    # 같은 이름의 의존성 파일은 경로 순으로 마지막 파일 사용
+    dependency_files = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        contents = executor.map(read_text_file, [file_path for _, file_path in dependency_paths])
+        for (name, _), content in zip(dependency_paths, contents):
+            if content is not None:
+                dependency_files[name] = content
 
     return format_project_data(sources, dependency_files)
 
+def project_manifest(project_data):
+    """manage_data.json 저장용: 소스 파일 내용을 제외한 매니페스트"""
+    manifest = dict(project_data)
+    manifest["source_files"] = [
+        source.to_manifest() if isinstance(source, SourceFile) else
+        {k: v for k, v in source.items() if k != "content"}
+        for source in project_data.get("source_files", [])
+    ]
+    return manifest
+
 if __name__ == "__main__":
     import json
     # PrestaShop 프로젝트 경로 수정 (올바른 경로)
     file_li = file_collection("/home/ruqos/Desktop/project/WEB/PrestaShop")
 
-    json_file_context = json.dumps(file_li, indent=2, ensure_ascii=False)
+    json_file_context = json.dumps(project_manifest(file_li), indent=2, ensure_ascii=False)
 
 
     with open("data.json", "w", encoding="utf-8") as f:
@@ -0,0 +1,129 @@
+import json
+import os
+from datetime import datetime
+
+from add_in.results_model import ScanResults
+
+FINDINGS_FORMAT = "owasp-findings"
+FINDINGS_VERSION = 1
+
+
+class FindingsWriter:
+    """
+    검사 결과를 검사가 끝날 때마다 JSON Lines 파일에 추가 (검사 도중 중단되어도 끝난 검사 결과는 남음)
+    - 1번째 줄: 헤더 (형식, 버전, 대상, 검사 프로필, 시작 시각)
+    - test: 검사 1개의 정보 (details 제외), 바로 뒤에 finding이 details 수만큼
+    - finding: 취약점 1개 (정규화된 detail)
+    - end: 검사 종료 시각과 단계별 상태 (이 줄이 없으면 중간에 중단된 검사)
+    """
+
+    def __init__(self, path, target="", profile=""):
+        self.path = path
+        self.count = 0  # 기록한 finding 수
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.file = open(path, "w", encoding="utf-8")
+        self._write({
+            "format": FINDINGS_FORMAT,
+            "version": FINDINGS_VERSION,
+            "target": target,
+            "profile": profile,
+            "started_at": datetime.now().isoformat(),
+        })
+        self._flush()
+
+    def _write(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def _flush(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def write_test(self, category_id, test):
+        """병합된 검사 1개(results.json의 test)와 그 details를 기록"""
+        details = test.get("details", [])
+        fields = {key: value for key, value in test.items() if key != "details"}
+        self._write({"type": "test", "category_id": category_id, "test_id": test.get("test_id"), "test": fields})
+        for detail in details:
+            self._write({"type": "finding", "test_id": test.get("test_id"), "detail": detail})
+        self.count += len(details)
+        self._flush()
+
+    def close(self, status=None):
+        """종료 줄을 쓰고 파일 닫기 (status: 단계 이름 → done / failed / timeout / skipped)"""
+        if self.file.closed:
+            return
+        self._write({"type": "end", "finished_at": datetime.now().isoformat(), "status": status or {}})
+        self.file.close()
+
+
+def iter_findings(path):
+    """JSON Lines 결과 파일의 (헤더, 기록 generator)"""
+    f = open(path, "r", encoding="utf-8")
+    header = json.loads(f.readline() or "{}")
+    if header.get("format") != FINDINGS_FORMAT:
+        f.close()
+        raise ValueError(f"검사 결과 파일이 아닙니다: {path}")
+    if header.get("version") != FINDINGS_VERSION:
+        f.close()
+        raise ValueError(f"지원하지 않는 검사 결과 버전: {header.get('version')} (지원: {FINDINGS_VERSION})")
+
+    def records():
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    break  # 중단된 검사의 마지막 줄이 잘린 경우
+
+    return header, records()
+
+
+def derive_results(path, template):
+    """
+    JSON Lines 결과 파일로 results.json 형식 결과(ScanResults) 생성
+    template: 깨끗한 results.json (categories/tests 구조)
+    """
+    results = ScanResults(template)
+    header, records = iter_findings(path)
+
+    current = None
+    complete = False
+    for record in records:
+        kind = record.get("type")
+        if kind == "test":
+            current = results.get_test(record["test_id"])
+            if current is not None:
+                current.update(record["test"])
+                current["details"] = []
+        elif kind == "finding":
+            if current is not None and current.get("test_id") == record["test_id"]:
+                current["details"].append(record["detail"])
+        elif kind == "end":
+            complete = True
+
+    if not complete:
+        print(f"⚠️ 중간에 중단된 검사 결과입니다: {path}")
+
+    summary = results.data.setdefault("summary", {})
+    if header.get("target"):
+        summary["target_url"] = header["target"]
+    return results
+
+
+if __name__ == "__main__":
+    # 중단된 검사의 JSON Lines 결과로 results/result_*.json 다시 만들기
+    import sys
+
+    PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    findings_path = sys.argv[1]
+    with open(os.path.join(PROJECT_ROOT, "etc", "results.json"), "r", encoding="utf-8") as f:
+        template = json.load(f)
+
+    results = derive_results(findings_path, template)
+    results.summarize()
+    output_path = findings_path.replace(".findings.jsonl", "") + ".json"
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(results.data, f, indent=2, ensure_ascii=False)
+    print(f"검사 결과가 {output_path}에 저장되었습니다.")
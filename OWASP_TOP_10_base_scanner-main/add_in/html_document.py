@@ -0,0 +1,63 @@
+from bs4 import BeautifulSoup
+
+# lxml이 설치되어 있으면 더 빠른 lxml 파서 사용 (requirements.txt), 없으면 내장 html.parser
+# (잘못 중첩된 폼 등은 파서마다 트리가 다를 수 있으므로 lxml 설치 권장)
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+class ParsedDocument:
+    """
+    HTML을 한 번만 파싱해서 검사에 필요한 요소(링크, 폼, 메타, 인라인 스크립트)를 추출
+    - BeautifulSoup 트리는 추출 후 해제하고 속성 dict만 보관 (페이지가 많아도 메모리 절약)
+    - 크롤러(링크), FrontCode(폼), A01 CSRF(폼/메타/스크립트)가 같은 결과를 재사용
+    """
+
+    def __init__(self, html):
+        soup = BeautifulSoup(html or "", HTML_PARSER)
+
+        self.links = [a.get('href') for a in soup.find_all('a') if a.get('href')]
+
+        self.forms = []
+        for form in soup.find_all('form'):
+            self.forms.append({
+                "attrs": dict(form.attrs),
+                "inputs": [dict(inp.attrs) for inp in form.find_all('input')],
+                "textareas": [dict(area.attrs) for area in form.find_all('textarea')],
+            })
+
+        self.metas = [dict(meta.attrs) for meta in soup.find_all('meta')]
+
+        self.scripts = []
+        for script in soup.find_all('script'):
+            text = script.string or script.get_text() or ''
+            if text.strip():
+                self.scripts.append(text)
+
+        soup.decompose()
+
+
+# 정규화된 URL → ParsedDocument
+document_cache = {}
+
+
+def parse_document(html):
+    return ParsedDocument(html)
+
+
+def cache_document(url, html):
+    """HTML을 파싱해서 캐시에 저장 후 반환 (url은 크롤러가 정규화한 URL)"""
+    document = ParsedDocument(html)
+    document_cache[url] = document
+    return document
+
+
+def get_cached_document(url):
+    return document_cache.get(url)
+
+
+def clear_document_cache():
+    document_cache.clear()
@@ -0,0 +1,93 @@
+import bisect
+import hashlib
+import mmap
+import re
+from contextlib import contextmanager
+
+MMAP_MIN_SIZE = 1 * 1024 * 1024  # 이보다 큰 파일은 읽지 않고 mmap 위에서 바로 검사
+
+# str.splitlines()와 같은 줄 구분 (UTF-8 바이트 기준, 작은 파일 검사와 줄 번호를 맞추기 위해)
+LINE_BREAK_BYTES = re.compile(rb"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+
+@contextmanager
+def map_file(path):
+    """파일을 읽기 전용으로 mmap (빈 파일/읽기 실패는 None)"""
+    try:
+        with open(path, "rb") as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                buffer = None  # 빈 파일은 mmap할 수 없음
+    except OSError as e:
+        print(f"⚠️ {path} 읽기 실패: {e}")
+        buffer = None
+
+    try:
+        yield buffer
+    finally:
+        if buffer is not None:
+            buffer.close()
+
+
+def file_digest(path):
+    """파일 내용 sha1 (mmap으로 계산해서 파일 전체를 메모리에 올리지 않음)"""
+    with map_file(path) as buffer:
+        return hashlib.sha1(buffer if buffer is not None else b"").hexdigest()
+
+
+class LineIndex:
+    """
+    mmap 위치 → 줄 번호
+    결과가 나온 위치까지만 앞으로 이동하면서 줄 구분 문자를 세므로 줄 목록을 만들지 않음
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.position = 0    # 여기까지 센 위치
+        self.line = 1        # position이 속한 줄 번호
+        self.line_start = 0  # position이 속한 줄의 시작 위치
+
+    def locate(self, position):
+        """position의 (줄 번호, 줄 시작 위치)"""
+        if position < self.position:
+            self.position, self.line, self.line_start = 0, 1, 0
+
+        for match in LINE_BREAK_BYTES.finditer(self.buffer, self.position, position):
+            self.line += 1
+            self.line_start = match.end()
+        self.position = position
+        return self.line, self.line_start
+
+    def line_end(self, position):
+        """position이 속한 줄의 (끝 위치(줄 구분 문자 앞), 다음 줄 시작 위치)"""
+        match = LINE_BREAK_BYTES.search(self.buffer, position)
+        if not match:
+            return len(self.buffer), len(self.buffer)
+        return match.start(), match.end()
+
+
+def in_spans(spans, starts, position):
+    """position이 spans [(시작, 끝)] 중 하나에 들어 있는지 (starts: 시작 위치 목록)"""
+    i = bisect.bisect_right(starts, position) - 1
+    return i >= 0 and position < spans[i][1]
+
+
+def cut_spans(buffer, start, end, spans, starts):
+    """
+    buffer[start:end] 한 줄에서 spans(주석) 부분을 지운 바이트 (source_lexer.strip_comments와 같은 결과)
+    줄 안에서 끝나는 주석은 공백 1개, 다른 줄로 이어지는 주석은 빈 문자열
+    """
+    parts = []
+    i = max(bisect.bisect_right(starts, start) - 1, 0)
+    position = start
+    while i < len(spans) and spans[i][0] < end:
+        span_start, span_end = spans[i]
+        if span_end > position:
+            parts.append(buffer[position:max(span_start, position)])
+            if span_start >= start and span_end <= end:
+                parts.append(b" ")
+            position = min(span_end, end)
+        i += 1
+    parts.append(buffer[position:end])
+    return b"".join(parts)
@@ -0,0 +1,147 @@
+import json
+from datetime import datetime
+
+RISK_LEVELS = ("CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO")
+
+
+def normalize_details(raw_details, timestamp=None):
+    """
+    검사 파일에서 온 details에 공통 필드를 병합 (검사 파일의 기존 데이터는 그대로 유지)
+    - timestamp가 없는 항목에는 배치 전체에 같은 시각 1개를 사용
+    - url/path/file → location, issue → description 으로 통일
+    """
+    if not raw_details:
+        return []
+
+    timestamp = timestamp or datetime.now().isoformat()
+    details = []
+
+    for item in raw_details:
+        # 검사 파일에서 온 데이터를 복사 (원본 유지)
+        detail = dict(item)
+
+        if "timestamp" not in detail:
+            detail["timestamp"] = timestamp
+
+        # location 필드 통일 (url, path, file 등을 location으로), 원본 필드는 제거
+        if "location" not in detail:
+            detail["location"] = (
+                detail.get("url") or
+                detail.get("path") or
+                detail.get("file") or
+                "N/A"
+            )
+            detail.pop("url", None)
+            detail.pop("path", None)
+            detail.pop("file", None)
+
+        # description 필드 통일 (issue → description), 원본 필드는 제거
+        if "description" not in detail:
+            detail["description"] = detail.get("issue") or "No description"
+            detail.pop("issue", None)
+
+        details.append(detail)
+
+    return details
+
+
+def is_vulnerable(test):
+    return test.get("vulnerable_items", 0) > 0 or bool(test.get("details"))
+
+
+class ScanResults:
+    """
+    results.json 형식 검사 결과 (test_id 인덱스로 병합/조회)
+    - 검사 결과 병합, 요약 계산, GUI 목록 조회를 모두 이 API로 처리
+    - data: results.json과 같은 dict (그대로 저장/전달 가능)
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.tests = {}  # test_id → (category_id, test dict)
+        for category_id, category_data in data.get("categories", {}).items():
+            for test in category_data.get("tests", []):
+                self.tests[test.get("test_id")] = (category_id, test)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def get_test(self, test_id):
+        entry = self.tests.get(test_id)
+        return entry[1] if entry else None
+
+    def set_details(self, test_id, raw_details, timestamp=None):
+        """검사 1개의 details(검사 파일 결과 목록)를 정규화해서 저장"""
+        test = self.get_test(test_id)
+        if test is None:
+            return None
+        test["details"] = normalize_details(raw_details, timestamp)
+        return test
+
+    def merge(self, module_result, category_id=None, test_id=None):
+        """
+        개별 모듈 결과를 병합
+        - details 목록이면 test_id 검사의 details로 저장
+        - results.json 형식 dict면 취약점이 있는 검사만 같은 test_id 검사에 덮어씀
+        반환: 변경된 검사 [(category_id, test dict)]
+        """
+        if not module_result:
+            return []
+
+        timestamp = datetime.now().isoformat()
+
+        if isinstance(module_result, list) and category_id and test_id:
+            test = self.set_details(test_id, module_result, timestamp)
+            return [self.tests[test_id]] if test is not None else []
+
+        merged = []
+
+        for category_data in module_result["categories"].values():
+            for test in category_data["tests"]:
+                if not is_vulnerable(test):
+                    continue
+                target = self.get_test(test["test_id"])
+                if target is None:
+                    continue
+                test["details"] = normalize_details(test.get("details", []), timestamp)
+                target.update(test)
+                merged.append(self.tests[test["test_id"]])
+        return merged
+
+    def vulnerable_tests(self):
+        """취약점이 발견된 검사 목록 (results.json 순서)"""
+        return [test for _, test in self.tests.values() if is_vulnerable(test)]
+
+    def findings(self):
+        """(검사, detail) 목록, GUI 취약점 표의 행 1개씩"""
+        for test in self.vulnerable_tests():
+            for detail in test.get("details", []):
+                yield test, detail
+
+    def summarize(self, web_url=None, project_path=None):
+        """summary(총 테스트/취약점 수, 위험도 분포, 검사 시각, 대상) 계산"""
+        total_tests = 0
+        total_vulnerabilities = 0
+        risk_counts = {level: 0 for level in RISK_LEVELS}
+
+        for test in self.vulnerable_tests():
+            total_tests += 1
+            total_vulnerabilities += test.get("vulnerable_items", 0)
+            risk_level = test.get("risk_level", "")
+            if risk_level in risk_counts:
+                risk_counts[risk_level] += 1
+
+        summary = self.data.setdefault("summary", {})
+        summary["total_tests"] = total_tests
+        summary["total_vulnerabilities"] = total_vulnerabilities
+        summary["risk_distribution"] = risk_counts
+        summary["scan_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # 검사 대상 추가 (URL 또는 폴더)
+        if web_url:
+            summary["target_url"] = web_url
+        if project_path:
+            summary["target_folder"] = project_path
+        return summary
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import threading
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAST_INDEX = os.path.join(PROJECT_ROOT, "add_in", "sast_index.json")
+
+# 인덱스 구조나 검사 로직이 바뀌면 올려서 기존 인덱스를 모두 무효화
+INDEX_VERSION = 2
+
+
+def content_digest(code):
+    return hashlib.sha1(code.encode("utf-8")).hexdigest()
+
+
+def ruleset_version(rules):
+    """규칙(패턴 목록/dict)으로 만든 버전 문자열, 규칙이 하나라도 바뀌면 값이 달라짐"""
+    data = json.dumps(rules, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()[:12]
+
+
+class SastIndex:
+    """
+    스캔 사이에 유지되는 정적 분석(A02/A03) 결과 인덱스
+    - 검사기(namespace) → 파일 경로 → 크기, mtime, 내용 sha1, 규칙 버전별 결과
+    - 크기/mtime이 같으면 파일을 읽지 않고 저장된 결과 사용
+    - 크기/mtime만 바뀌고 내용(sha1)이 같으면 다시 검사하지 않음
+    - 규칙이 바뀌면 규칙 버전이 달라지므로 자동으로 다시 검사
+    - A02/A03 검사 스레드가 동시에 사용하므로 모든 조회/저장은 lock 안에서 처리
+    """
+
+    def __init__(self, path=SAST_INDEX):
+        self.path = path
+        self.index = self._load_index()
+        self.used = {}  # namespace → 이번 스캔에서 사용한 (경로 set, 규칙 버전 set)
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+
+    def _load_index(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+        if data.get("version") != INDEX_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def lookup(self, namespace, ruleset, source):
+        """크기/mtime이 같고 같은 규칙으로 검사한 결과가 있으면 반환 (파일을 읽지 않음), 없으면 None"""
+        path = source.get("path")
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError):
+            return None
+
+        with self.lock:
+            paths, rulesets = self.used.setdefault(namespace, (set(), set()))
+            paths.add(path)
+            rulesets.add(ruleset)
+
+            entry = self.index.get(namespace, {}).get(path)
+            if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime_ns:
+                if ruleset in entry["results"]:
+                    self.hits += 1
+                    return entry["results"][ruleset]
+        return None
+
+    def has_result(self, namespace, ruleset, source):
+        """이 파일을 같은 규칙으로 검사한 결과가 있는지 (내용 sha1 비교가 의미 있는지)"""
+        with self.lock:
+            entry = self.index.get(namespace, {}).get(source.get("path"))
+            return bool(entry) and ruleset in entry["results"]
+
+    def match_digest(self, namespace, ruleset, source, digest):
+        """크기/mtime만 바뀌고 내용(sha1)이 같으면 저장된 결과 반환 (mtime 갱신), 아니면 None"""
+        with self.lock:
+            entry = self.index.get(namespace, {}).get(source.get("path"))
+            if not entry or entry["sha1"] != digest or ruleset not in entry["results"]:
+                return None
+
+            self.hits += 1
+            findings = entry["results"][ruleset]
+            self.store(namespace, ruleset, source, digest, findings)
+            return findings
+
+    def count_miss(self):
+        """새로 검사한 파일 수 (인덱스 밖에서 검사한 경우)"""
+        with self.lock:
+            self.misses += 1
+
+    def store(self, namespace, ruleset, source, digest, findings):
+        """검사 결과 저장 (digest: 검사한 내용의 sha1), 같은 내용이면 다른 규칙 결과는 유지"""
+        path = source.get("path")
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError):
+            return  # 디스크에 없는 파일(내용만 전달된 경우)은 인덱스에 저장하지 않음
+
+        with self.lock:
+            files = self.index.setdefault(namespace, {})
+            entry = files.get(path)
+            if not entry or entry["sha1"] != digest:
+                entry = {"sha1": digest, "results": {}}
+                files[path] = entry
+            entry["size"] = stat.st_size
+            entry["mtime"] = stat.st_mtime_ns
+            entry["results"][ruleset] = findings
+
+    def scan(self, namespace, ruleset, source, analyze):
+        """
+        source(SourceFile/dict) 1개의 검사 결과 반환
+        변경되지 않은 파일이면 저장된 결과, 아니면 analyze(code)를 실행해서 결과 저장
+        """
+        findings = self.lookup(namespace, ruleset, source)
+        if findings is not None:
+            return findings
+
+        code = source.get("content", "")
+        digest = content_digest(code)
+
+        # 크기/mtime만 바뀌고 내용이 같으면 다시 검사하지 않음
+        findings = self.match_digest(namespace, ruleset, source, digest)
+        if findings is not None:
+            return findings
+
+        self.count_miss()
+        findings = analyze(code)
+        self.store(namespace, ruleset, source, digest, findings)
+        return findings
+
+    def save(self):
+        """
+        이번 스캔에서 검사한 파일/규칙만 남기고 저장 (삭제된 파일, 이전 규칙 결과 정리)
+        lock 안에서 정리하고 JSON 문자열로 만든 뒤 파일 쓰기 (쓰는 동안 다른 스레드가 저장해도 영향 없음)
+        """
+        with self.lock:
+            for namespace, (paths, rulesets) in self.used.items():
+                files = self.index.get(namespace, {})
+                for path in list(files):
+                    if path not in paths:
+                        del files[path]
+                        continue
+                    results = files[path]["results"]
+                    for ruleset in list(results):
+                        if ruleset not in rulesets:
+                            del results[ruleset]
+
+            data = json.dumps({"version": INDEX_VERSION, "files": self.index}, ensure_ascii=False)
+            hits, misses = self.hits, self.misses
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(data)
+
+        print(f"🗂️ 정적 분석 인덱스: 재사용 {hits}개, 새로 검사 {misses}개")
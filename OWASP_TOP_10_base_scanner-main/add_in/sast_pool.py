@@ -0,0 +1,168 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from add_in.data_management import SourceFile
+from add_in.mmap_scan import MMAP_MIN_SIZE, file_digest
+from add_in.sast_index import content_digest
+
+SAST_WORKERS = os.cpu_count() or 1  # 정적 분석 프로세스 수 (user_info.json의 sast_workers, 0이면 CPU 수)
+PARALLEL_MIN_FILES = 200  # 검사할 파일이 이보다 적으면 프로세스를 띄우지 않고 현재 프로세스에서 검사
+SHARDS_PER_WORKER = 4  # 파일 크기 편차를 고르게 나누기 위해 작업자 1개당 여러 묶음으로 분할
+
+# A02/A03 검사가 동시에 실행되어도 프로세스는 workers개만 쓰도록 검사들이 함께 쓰는 프로세스 풀
+process_pool = None
+process_pool_lock = threading.Lock()
+
+
+def is_large(source, analyze_large):
+    """mmap으로 검사할 큰 파일인지 (디스크에 있는 SourceFile만)"""
+    return analyze_large is not None and isinstance(source, SourceFile) and (source.size or 0) >= MMAP_MIN_SIZE
+
+
+def scan_shard(analyze, analyze_large, shard):
+    """
+    작업 프로세스에서 실행: 묶음의 파일을 직접 읽어서 검사 (큰 파일은 mmap)
+    shard: [(번호, 경로, 큰 파일 여부)] → [(번호, 내용 sha1, 검사 결과)]
+    """
+    results = []
+    for number, path, large in shard:
+        if large:
+            results.append((number, file_digest(path), analyze_large(path)))
+        else:
+            code = SourceFile(path, None).content
+            results.append((number, content_digest(code), analyze(code, path)))
+    return results
+
+
+def make_shards(sources, numbers, count, analyze_large=None):
+    """큰 파일부터 묶음에 번갈아 배정 (묶음마다 검사량이 비슷하도록)"""
+    ordered = sorted(numbers, key=lambda number: sources[number].size or 0, reverse=True)
+    shards = [ordered[i::count] for i in range(count)]
+    return [
+        [(number, sources[number].path, is_large(sources[number], analyze_large)) for number in shard]
+        for shard in shards if shard
+    ]
+
+
+def get_process_pool(workers):
+    """공유 프로세스 풀 (처음 호출할 때 생성, 이후 호출은 같은 풀 재사용)"""
+    global process_pool
+    with process_pool_lock:
+        if process_pool is None:
+            # GUI/크롤러 스레드가 살아 있는 상태에서 fork하지 않도록 spawn 사용
+            context = multiprocessing.get_context("spawn")
+            process_pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        return process_pool
+
+
+def close_process_pool():
+    """공유 프로세스 풀 종료 (검사가 모두 끝난 뒤 호출)"""
+    global process_pool
+    with process_pool_lock:
+        if process_pool is not None:
+            process_pool.shutdown(cancel_futures=True)
+            process_pool = None
+
+
+def run_process_pool(analyze, analyze_large, shards, workers):
+    executor = get_process_pool(workers)
+    futures = [executor.submit(scan_shard, analyze, analyze_large, shard) for shard in shards]
+    for future in futures:
+        yield from future.result()
+
+
+def match_changed_sources(sources, numbers, index, namespace, ruleset, analyze_large=None):
+    """
+    크기/mtime만 바뀐 파일은 내용 sha1을 계산해서 저장된 결과와 비교 (작업 프로세스로 보내기 전에)
+    반환: {번호: 저장된 결과} (같은 내용이 아니거나 저장된 결과가 없는 파일은 제외)
+    """
+    matched = {}
+    for number in numbers:
+        source = sources[number]
+        if not index.has_result(namespace, ruleset, source):
+            continue  # 처음 검사하는 파일은 읽지 않음
+        if is_large(source, analyze_large):
+            digest = file_digest(source.path)
+        else:
+            digest = content_digest(source.get("content", ""))
+        findings = index.match_digest(namespace, ruleset, source, digest)
+        if findings is not None:
+            matched[number] = findings
+    return matched
+
+
+def analyze_large_source(source, analyze_large, index, namespace, ruleset):
+    """큰 파일 1개를 mmap으로 검사 (인덱스가 있으면 내용 sha1이 같을 때 저장된 결과 사용)"""
+    digest = file_digest(source.path)
+    if index is not None:
+        findings = index.match_digest(namespace, ruleset, source, digest)
+        if findings is not None:
+            return findings
+        index.count_miss()
+
+    findings = analyze_large(source.path)
+    if index is not None:
+        index.store(namespace, ruleset, source, digest, findings)
+    return findings
+
+
+def analyze_sources(sources, analyze, index=None, namespace="", ruleset="", workers=SAST_WORKERS,
+                    analyze_large=None):
+    """
+    소스 파일별 검사 결과 목록 반환 (sources와 같은 순서, 실행 방식과 관계없이 결과 동일)
+    - analyze(code, path): 파일 1개 검사 함수 (프로세스로 보내므로 모듈 함수/피클 가능한 객체)
+    - analyze_large(path): MMAP_MIN_SIZE 이상인 파일을 읽지 않고 mmap으로 검사하는 함수 (선택)
+    - index가 있으면 변경되지 않은 파일은 저장된 결과 사용
+    - 남은 파일이 PARALLEL_MIN_FILES개 이상이면 프로세스 풀로 나눠서 검사 (내용 대신 경로 전달)
+    """
+    results = [None] * len(sources)
+    pending = []
+
+    for number, source in enumerate(sources):
+        if index is not None:
+            found = index.lookup(namespace, ruleset, source)
+            if found is not None:
+                results[number] = found
+                continue
+        pending.append(number)
+
+    # 디스크에서 다시 읽을 수 있는 파일만 작업 프로세스로 보냄
+    remote = [number for number in pending if isinstance(sources[number], SourceFile)]
+    local = pending
+
+    if workers > 1 and len(remote) >= PARALLEL_MIN_FILES and index is not None:
+        # mtime만 바뀐 파일은 다시 검사하지 않도록 나누기 전에 내용 sha1 비교 (현재 프로세스 경로와 동일)
+        matched = match_changed_sources(sources, remote, index, namespace, ruleset, analyze_large)
+        for number, findings in matched.items():
+            results[number] = findings
+        remote = [number for number in remote if number not in matched]
+        pending = [number for number in pending if number not in matched]
+        local = pending
+
+    if workers > 1 and len(remote) >= PARALLEL_MIN_FILES:
+        shards = make_shards(sources, remote, min(len(remote), workers * SHARDS_PER_WORKER), analyze_large)
+        print(f"⚙️ 정적 분석 병렬 실행: 파일 {len(remote)}개, 프로세스 {workers}개")
+        try:
+            for number, digest, findings in run_process_pool(analyze, analyze_large, shards, workers):
+                results[number] = findings
+                if index is not None:
+                    index.store(namespace, ruleset, sources[number], digest, findings)
+                    index.count_miss()
+        except Exception as e:
+            print(f"⚠️ 병렬 실행 실패, 현재 프로세스에서 검사: {e}")
+            close_process_pool()  # 깨진 풀은 버리고 다음 검사에서 새로 생성
+        local = [number for number in pending if results[number] is None]
+
+    for number in local:
+        source = sources[number]
+        path = source.get("path")
+        if is_large(source, analyze_large):
+            results[number] = analyze_large_source(source, analyze_large, index, namespace, ruleset)
+        elif index is not None:
+            results[number] = index.scan(namespace, ruleset, source, lambda code: analyze(code, path))
+        else:
+            results[number] = analyze(source.get("content", ""), path)
+
+    return results
@@ -0,0 +1,99 @@
+import copy
+
+DEFAULT_PROFILE = "full"  # 프로필을 지정하지 않으면 작업량 제한/시간 예산 없이 기존과 같은 범위로 검사
+
+# 검사 프로필
+# - time_budget: 전체 검사 시간 예산(초), 넘으면 스케줄러가 남은 검사를 건너뛰고 실행 중인 검사의 결과를 버림
+#                실행 중인 검사에는 cancel_event로 중단 신호를 보냄 (신호를 확인하는 검사만 멈춤: A04-03, A05-02, A05-03)
+#                (None이면 제한 없음, 우선순위가 높은 검사부터 시작하므로 예산 안에서 중요한 검사가 먼저 끝남)
+# - config: user_info.json 값 대신 사용할 설정 (크롤링 범위 등)
+# - limits: 검사별 작업량 제한, 각 검사가 config["scan_limits"]에서 읽음 (None이면 제한 없음)
+SCAN_PROFILES = {
+    # 배포마다 실행하는 빠른 검사 (약 5분)
+    "quick": {
+        "time_budget": 300,
+        "config": {
+            "crawl_max_pages": 30,
+            "crawl_max_depth": 2,
+        },
+        "limits": {
+            "permission_bypass_urls": 300,    # A04-03: A04_common.txt / A04_general.txt에서 사용할 URL 수
+            "permission_bypass_user_ids": 3,  # A04-03: 사용자 ID 조작 검사 ID 수 (1~N)
+            "rate_limit_requests": 3,         # A04-01: 엔드포인트당 연속 요청 수
+            "port_scope": "known",            # A05-02: A05_port_config.json에 있는 포트만 검사
+            "default_accounts": 10,           # A05-03: 시도할 기본 계정 수
+            "default_account_delay": 0.2,     # A05-03: 로그인 시도 간격(초)
+        },
+    },
+    # 일반 검사 (약 30분)
+    "standard": {
+        "time_budget": 1800,
+        "config": {},
+        "limits": {
+            "permission_bypass_urls": 5000,
+            "permission_bypass_user_ids": 10,
+            "rate_limit_requests": 3,
+            "port_range": [1, 1024],
+            "default_accounts": 100,
+            "default_account_delay": 0.5,
+        },
+    },
+    # 전체 검사 (야간 실행, 제한 없음)
+    "deep": {
+        "time_budget": None,
+        "config": {},
+        "limits": {
+            "permission_bypass_urls": None,
+            "permission_bypass_user_ids": 10,
+            "rate_limit_requests": 5,
+            "port_range": [1, 1024],
+            "default_accounts": None,
+            "default_account_delay": 1.0,
+        },
+    },
+    # 기존 검사와 같은 범위 (기본값, 작업량 제한/시간 예산 없음)
+    "full": {
+        "time_budget": None,
+        "config": {},
+        "limits": {
+            "permission_bypass_urls": None,
+            "permission_bypass_user_ids": 10,
+            "rate_limit_requests": 3,
+            "port_range": [1, 1024],
+            "default_accounts": None,
+            "default_account_delay": 1.0,
+        },
+    },
+}
+
+
+def apply_scan_profile(config, name=None):
+    """
+    config에 검사 프로필을 적용한 새 config 반환
+    - 프로필 이름: 인자 → user_info.json의 scan_profile → DEFAULT_PROFILE
+    - user_info.json의 scan_limits / scan_time_budget이 있으면 프로필 값보다 우선
+    """
+    name = name or config.get("scan_profile") or DEFAULT_PROFILE
+    if name not in SCAN_PROFILES:
+        raise ValueError(f"알 수 없는 검사 프로필: {name} (사용 가능: {', '.join(SCAN_PROFILES)})")
+    profile = SCAN_PROFILES[name]
+
+    config = copy.deepcopy(config)
+    config.update(profile["config"])
+    config["scan_profile"] = name
+    config["scan_limits"] = dict(profile["limits"], **config.get("scan_limits", {}))
+    if "scan_time_budget" not in config:
+        config["scan_time_budget"] = profile["time_budget"]
+    return config
+
+
+def describe_limits(config):
+    """적용된 작업량 제한을 배너용 문자열로 (제한이 없으면 '없음')"""
+    limits = [f"{key}={value}" for key, value in config.get("scan_limits", {}).items() if value is not None]
+    return ", ".join(limits) if limits else "없음"
+
+
+def scan_limit(config, key, default=None):
+    """검사 작업량 제한 값 (프로필을 적용하지 않은 config면 default)"""
+    value = (config or {}).get("scan_limits", {}).get(key)
+    return default if value is None else value
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from add_in.data_management import LANG_EXT
+
+# 문자열 리터럴: 안에 있는 //, #, /* 는 주석이 아님 (내용은 검사 대상이므로 지우지 않음)
+DOUBLE_QUOTE = r'"(?:\\.|[^"\\\r\n])*"'
+SINGLE_QUOTE = r"'(?:\\.|[^'\\\r\n])*'"
+BACKTICK = r"`(?:\\.|[^`\\])*`"  # JS 템플릿 리터럴, Go raw string (여러 줄)
+TRIPLE_QUOTE = r'"""(?:\\.|[^\\])*?"""|' + r"'''(?:\\.|[^\\])*?'''"
+CHAR_LITERAL = r"'(?:\\.|[^'\\\r\n])'"  # Rust 문자 1개 ('a, 'static 같은 lifetime은 문자열 아님)
+
+# 주석 (끝나지 않은 블록 주석은 파일 끝까지)
+BLOCK_COMMENT = r"/\*.*?(?:\*/|\Z)"
+HTML_COMMENT = r"<!--.*?(?:-->|\Z)"
+SLASH_COMMENT = r"//[^\r\n]*"
+HASH_COMMENT = r"#[^\r\n]*"
+PHP_HASH_COMMENT = r"#(?!\[)[^\r\n]*"  # PHP 8 attribute #[...]는 주석 아님
+DASH_COMMENT = r"--\[\[.*?(?:\]\]|\Z)|--[^\r\n]*"
+TEMPLATE_COMMENT = r"\{\{!--.*?(?:--\}\}|\Z)|\{\{![^}]*\}\}|\{#.*?(?:#\}|\Z)|<%#.*?(?:%>|\Z)"
+PASCAL_COMMENT = r"\{[^}]*\}|\(\*.*?(?:\*\)|\Z)"
+# 줄 처음에 있을 때만 주석으로 보는 경우 (HTML 본문의 http:// 같은 문자열 보호)
+LEADING_SLASH_COMMENT = r"^[ \t]*//[^\r\n]*"
+LEADING_HASH_COMMENT = r"^[ \t]*#[^\r\n]*"
+
+# 언어 계열별 (문자열 패턴, 주석 패턴)
+STYLES = {
+    "c": ([DOUBLE_QUOTE, SINGLE_QUOTE, BACKTICK], [BLOCK_COMMENT, SLASH_COMMENT]),
+    "php": ([DOUBLE_QUOTE, SINGLE_QUOTE, BACKTICK], [BLOCK_COMMENT, SLASH_COMMENT, PHP_HASH_COMMENT]),
+    "rust": ([DOUBLE_QUOTE, CHAR_LITERAL], [BLOCK_COMMENT, SLASH_COMMENT]),
+    "python": ([TRIPLE_QUOTE, DOUBLE_QUOTE, SINGLE_QUOTE], [HASH_COMMENT]),
+    "hash": ([DOUBLE_QUOTE, SINGLE_QUOTE], [HASH_COMMENT]),
+    "css": ([DOUBLE_QUOTE, SINGLE_QUOTE], [BLOCK_COMMENT]),
+    "dash": ([DOUBLE_QUOTE, SINGLE_QUOTE], [DASH_COMMENT]),
+    "pascal": ([SINGLE_QUOTE], [PASCAL_COMMENT, SLASH_COMMENT]),
+    # 본문의 아포스트로피(don't 등)가 문자열로 잡히지 않도록 작은따옴표 문자열 없음
+    "markup": ([DOUBLE_QUOTE], [HTML_COMMENT, TEMPLATE_COMMENT, BLOCK_COMMENT, LEADING_SLASH_COMMENT]),
+    # 언어를 모를 때: 기존 검사와 같이 줄 처음의 //, # 와 블록 주석
+    "default": ([DOUBLE_QUOTE, SINGLE_QUOTE],
+                [BLOCK_COMMENT, HTML_COMMENT, LEADING_SLASH_COMMENT, LEADING_HASH_COMMENT]),
+}
+
+# LANG_EXT 언어 이름 → 언어 계열
+LANGUAGE_STYLES = {
+    "C": "c",
+    "C/C++ Header": "c",
+    "C++": "c",
+    "C++ Header": "c",
+    "C#": "c",
+    "Java": "c",
+    "Kotlin": "c",
+    "Kotlin Script": "c",
+    "Go": "c",
+    "Rust": "rust",
+    "Swift": "c",
+    "Objective-C / MATLAB": "c",
+    "Objective-C++": "c",
+    "Zig": "c",
+    "JavaScript": "c",
+    "JavaScript (CommonJS)": "c",
+    "JavaScript (ES Module)": "c",
+    "TypeScript": "c",
+    "TypeScript + JSX": "c",
+    "JavaScript + JSX": "c",
+    "Sass": "c",
+    "SCSS": "c",
+    "Less": "c",
+    "PHP": "php",
+    "PHP (HTML Embedded)": "php",
+    "PHP Archive": "php",
+    "Python": "python",
+    "Python (Windows GUI)": "python",
+    "Ruby": "hash",
+    "Perl": "hash",
+    "Perl Module": "hash",
+    "R": "hash",
+    "Elixir": "hash",
+    "CSS": "css",
+    "Lua": "dash",
+    "Ada": "dash",
+    "Pascal/Delphi": "pascal",
+    "Delphi": "pascal",
+    "HTML": "markup",
+    "XHTML": "markup",
+    "Vue.js": "markup",
+    "Svelte": "markup",
+    "Handlebars": "markup",
+    "Mustache": "markup",
+    "Ruby ERB Template": "markup",
+    "Twig Template": "markup",
+    "EJS Template": "markup",
+    "Pug Template": "markup",
+    "Jinja2 Template": "markup",
+}
+
+# 주석 판별 규칙 버전 (SastIndex 규칙 버전에 포함, 규칙이 바뀌면 저장된 결과를 다시 검사)
+LEXER_VERSION = hashlib.sha1(json.dumps([STYLES, LANGUAGE_STYLES], sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+LEXERS = {
+    style: re.compile(
+        "|".join(f"(?:{pattern})" for pattern in strings) + "|(?P<comment>" + "|".join(comments) + ")",
+        re.DOTALL | re.MULTILINE,
+    )
+    for style, (strings, comments) in STYLES.items()
+}
+
+# 큰 파일(mmap) 검사용 바이트 정규식 (패턴이 모두 ASCII라서 그대로 변환)
+BYTES_LEXERS = {
+    style: re.compile(lexer.pattern.encode(), lexer.flags & ~re.UNICODE)
+    for style, lexer in LEXERS.items()
+}
+
+# 줄 구분 문자 (str.splitlines() 기준, 주석을 지워도 줄 번호 유지)
+LINE_BREAK = re.compile(r"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# (언어 계열, 내용 sha1) → 주석 위치 목록, 같은 파일을 A02/A03가 다시 분석하지 않도록 보관
+# 최근 COMMENT_CACHE_SIZE개 파일만 유지 (clear_comment_cache를 부르지 않는 작업 프로세스에서도 커지지 않도록)
+COMMENT_CACHE_SIZE = 256
+comment_cache = OrderedDict()
+comment_cache_lock = threading.Lock()
+
+
+def source_style(path):
+    """파일 확장자(LANG_EXT)로 언어 계열 결정"""
+    language = LANG_EXT.get(os.path.splitext(path or "")[1].lower())
+    return LANGUAGE_STYLES.get(language, "default")
+
+
+def comment_spans(code, path=None):
+    """코드 안의 주석 위치 [(시작, 끝)] (문자열 안의 주석 기호는 제외)"""
+    style = source_style(path)
+    key = (style, hashlib.sha1(code.encode("utf-8", "surrogatepass")).digest())
+    with comment_cache_lock:
+        spans = comment_cache.get(key)
+        if spans is not None:
+            comment_cache.move_to_end(key)
+            return spans
+
+    spans = [match.span() for match in LEXERS[style].finditer(code) if match.lastgroup == "comment"]
+    with comment_cache_lock:
+        comment_cache[key] = spans
+        if len(comment_cache) > COMMENT_CACHE_SIZE:
+            comment_cache.popitem(last=False)
+    return spans
+
+
+def comment_spans_bytes(buffer, path=None):
+    """mmap/바이트 버퍼의 주석 위치 [(시작, 끝)] (파일이 크므로 캐시하지 않음)"""
+    lexer = BYTES_LEXERS[source_style(path)]
+    return [match.span() for match in lexer.finditer(buffer) if match.lastgroup == "comment"]
+
+
+def strip_comments(code, path=None):
+    """
+    주석을 지운 코드 (주석 안의 줄 구분 문자는 남기므로 줄 번호가 바뀌지 않음)
+    주석을 공백으로 채우면 .* 패턴이 긴 공백에서 역추적하므로 줄 구분 문자만 남기고,
+    줄바꿈이 없는 주석은 앞뒤 코드가 붙지 않도록 공백 1개로 바꿈
+    """
+    spans = comment_spans(code, path)
+    if not spans:
+        return code
+
+    parts = []
+    last = 0
+    for start, end in spans:
+        parts.append(code[last:start])
+        parts.append("".join(LINE_BREAK.findall(code, start, end)) or " ")
+        last = end
+    parts.append(code[last:])
+    return "".join(parts)
+
+
+def clear_comment_cache():
+    with comment_cache_lock:
+        comment_cache.clear()
@@ -0,0 +1,232 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+STAGE_WORKERS = 6     # 동시에 실행할 검사 수 (user_info.json의 stage_workers)
+STAGE_TIMEOUT = None  # 검사 1개 최대 실행 시간(초), None이면 제한 없음 (user_info.json의 stage_timeout / stage_timeouts)
+ABANDON_WAIT = 60     # 시간 초과된 단계의 스레드가 끝나기를 기다리는 최대 시간(초), 그 안에 끝나면 중단 전까지의 결과 저장
+CANCEL_INPUT = "cancel_event"  # 단계마다 스케줄러가 만들어 넘기는 중단 신호 (values에 없어도 됨)
+PROGRESS_INPUT = "on_progress"  # 단계마다 스케줄러가 만들어 넘기는 진행 상황 콜백 (values에 없어도 됨)
+
+
+class Stage:
+    """
+    검사 단계 1개
+    - inputs: 실행에 필요한 값 이름 (config, obj_list, source_files ...), 모두 준비되면 실행
+    - outputs: 결과 dict에서 다음 단계로 넘겨줄 값 이름 (크롤링/소스 수집 단계)
+    - after: 값은 필요 없지만 먼저 끝나야 하는 단계 이름 (성공/실패 상관없음)
+    - cancel_event: 시간 초과/예산 초과 시 스케줄러가 set()하는 신호, inputs에 cancel_event가 있으면 검사에 전달
+      (검사는 작업 단위 사이마다 확인하고 스스로 멈춰야 함, 스레드를 강제로 멈출 수는 없음)
+    - category_id/test_id: 결과를 results.json 어디에 병합할지 (없으면 병합하지 않음)
+    """
+
+    def __init__(self, name, func, inputs=(), outputs=(), after=(), timeout=None,
+                 label=None, category_id=None, test_id=None):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.after = tuple(after)
+        self.timeout = timeout
+        self.label = label or name
+        self.category_id = category_id
+        self.test_id = test_id
+        self.cancel_event = threading.Event()
+
+
+class StageScheduler:
+    """
+    입력 값 의존 관계(DAG)에 따라 검사 단계를 스레드 풀에서 동시에 실행
+    - 입력이 모두 준비된 단계부터 바로 시작 (정적 검사는 크롤링을 기다리지 않음)
+    - 단계에 제한 시간이 있으면(기본 없음) 시간이 지났을 때 timeout으로 처리하고 단계의 cancel_event를 set()
+      (cancel_event를 입력으로 받아 확인하는 검사만 실제로 멈춤, 나머지는 스레드가 끝날 때까지 계속 실행)
+    - 시간 초과된 단계의 스레드가 ABANDON_WAIT초 안에 끝나면 그때까지 찾은 결과를 on_result로 전달
+      (상태는 timeout 유지, 그 안에 끝나지 않으면 결과를 버림)
+    - 결과 처리(on_result)는 스케줄러 스레드에서만 호출되므로 결과 병합/GUI 갱신이 겹치지 않음
+    - 입력을 만드는 단계가 실패하면 그 입력이 필요한 단계는 건너뜀
+    - 시간 초과된 단계의 스레드가 아직 실행 중이면 그 단계를 after로 기다리는 단계는 스레드가 끝날 때까지
+      (최대 ABANDON_WAIT초) 시작하지 않고, 그래도 끝나지 않으면 건너뜀
+      (예: 정적 분석 인덱스 저장이 검사 중인 인덱스를 읽지 않도록)
+    - on_status(stage, status, elapsed): 단계 상태가 바뀔 때마다 호출 (running / done / failed / timeout / skipped)
+    - on_progress(stage, progress): inputs에 on_progress가 있는 검사가 진행 상황 dict를 보낼 때 호출
+      (검사 스레드에서 호출되므로 받는 쪽에서 스레드 안전하게 처리)
+    - budget(초): 전체 시간 예산, 넘으면 남은 단계는 시작하지 않고 실행 중인 단계는 시간 초과와 같이 처리
+      (stages 순서대로 시작하므로 중요한 검사를 앞에 두면 예산 안에서 먼저 끝남)
+    """
+
+    def __init__(self, stages, workers=STAGE_WORKERS, timeout=STAGE_TIMEOUT, on_result=None, budget=None,
+                 on_status=None, on_progress=None):
+        self.stages = list(stages)
+        self.workers = workers
+        self.timeout = timeout
+        self.on_result = on_result
+        self.on_status = on_status
+        self.on_progress = on_progress
+        self.budget = budget
+        self.budget_end = None
+        self.status = {}   # 단계 이름 → done / failed / timeout / skipped
+        self.elapsed = {}  # 단계 이름 → 실행 시간(초)
+        self.abandoned = {}  # 시간 초과됐지만 스레드가 실행 중인 future → (단계, 기다림 마감 시각)
+        self.given_up = set()  # ABANDON_WAIT초 안에 스레드가 끝나지 않은 단계 이름
+
+        self.producers = {}  # 값 이름 → 그 값을 만드는 단계 이름 목록
+        for stage in self.stages:
+            for key in stage.outputs:
+                self.producers.setdefault(key, []).append(stage.name)
+
+    def can_produce(self, key):
+        return any(name not in self.status for name in self.producers.get(key, []))
+
+    def run(self, values):
+        """values: 처음부터 준비된 값 (config 등), 실행 중 단계 출력이 추가됨"""
+        values = dict(values)
+        pending = {stage.name: stage for stage in self.stages}
+        self.budget_end = time.time() + self.budget if self.budget else None
+        running = {}  # future → (단계, 시작 시각, 마감 시각 또는 None)
+        self.abandoned = {}
+        self.given_up = set()
+
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            while pending or running or self.abandoned:
+                self._start_ready(executor, pending, running, values)
+
+                if not running and not self.abandoned:
+                    # 남은 단계는 입력을 만들 단계가 없어서 실행할 수 없음
+                    for name in list(pending):
+                        self._skip(pending.pop(name), "실행 순서를 결정할 수 없음")
+                    break
+
+                now = time.time()
+                deadlines = [deadline for _, _, deadline in running.values() if deadline is not None]
+                deadlines += [give_up for _, give_up in self.abandoned.values()]
+                timeout = max(min(deadlines) - now, 0) if deadlines else None
+                done, _ = wait(list(running) + list(self.abandoned), timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    if future in self.abandoned:
+                        stage, _ = self.abandoned.pop(future)
+                        self._finish_abandoned(stage, future)
+                        continue
+                    stage, started, _ = running.pop(future)
+                    self._finish(stage, future, started, values)
+
+                now = time.time()
+                for future, (stage, started, deadline) in list(running.items()):
+                    if deadline is not None and now >= deadline:
+                        # 스레드는 강제로 멈출 수 없으므로 중단 신호만 보내고, 끝나면 그때까지의 결과를 저장
+                        running.pop(future)
+                        stage.cancel_event.set()
+                        self.status[stage.name] = "timeout"
+                        self.elapsed[stage.name] = now - started
+                        reason = "시간 예산 초과로 중단" if self.over_budget(now) else "시간 초과"
+                        print(f"    → {stage.label} {reason} ({now - started:.1f}초)")
+                        self._notify(stage, "timeout")
+                        if future.done():
+                            self._finish_abandoned(stage, future)
+                        else:
+                            self.abandoned[future] = (stage, now + ABANDON_WAIT)
+
+                for future, (stage, give_up) in list(self.abandoned.items()):
+                    if now >= give_up and not future.done():
+                        self.abandoned.pop(future)
+                        self.given_up.add(stage.name)
+                        print(f"    → {stage.label} 시간 초과 후 {ABANDON_WAIT}초 안에 끝나지 않아 결과를 버림")
+        finally:
+            # 예외로 빠져나와도 실행 중인 검사는 멈추도록 신호
+            for stage, _, _ in running.values():
+                stage.cancel_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return values
+
+    def over_budget(self, now=None):
+        return self.budget_end is not None and (now or time.time()) >= self.budget_end
+
+    def _start_ready(self, executor, pending, running, values):
+        if self.over_budget():
+            for name in list(pending):
+                self._skip(pending.pop(name), f"시간 예산 {self.budget}초 초과")
+            return
+
+        unfinished = set(pending) | {stage.name for stage, _, _ in running.values()}
+        abandoned = {stage.name for stage, _ in self.abandoned.values()}
+        for name, stage in list(pending.items()):
+            if any(dep in unfinished or dep in abandoned for dep in stage.after):
+                continue
+            stuck = [dep for dep in stage.after if dep in self.given_up]
+            if stuck:
+                pending.pop(name)
+                self._skip(stage, f"시간 초과된 단계가 아직 실행 중: {', '.join(stuck)}")
+                continue
+
+            missing = [key for key in stage.inputs if key not in (CANCEL_INPUT, PROGRESS_INPUT) and key not in values]
+            if missing:
+                if not any(self.can_produce(key) for key in missing):
+                    pending.pop(name)
+                    self._skip(stage, f"입력 없음: {', '.join(missing)}")
+                continue
+
+            pending.pop(name)
+            print(f"    {stage.label} 시작...")
+            self._notify(stage, "running")
+            kwargs = {key: self._stage_input(stage, key, values) for key in stage.inputs}
+            started = time.time()
+            timeout = stage.timeout or self.timeout
+            deadline = started + timeout if timeout else None
+            if self.budget_end is not None:
+                deadline = min(deadline, self.budget_end) if deadline is not None else self.budget_end
+            running[executor.submit(stage.func, **kwargs)] = (stage, started, deadline)
+
+    def _stage_input(self, stage, key, values):
+        """단계에 넘길 입력 값 (중단 신호/진행 콜백은 단계마다 따로 만듦)"""
+        if key == CANCEL_INPUT:
+            return stage.cancel_event
+        if key == PROGRESS_INPUT:
+            return lambda progress: self._report_progress(stage, progress)
+        return values[key]
+
+    def _report_progress(self, stage, progress):
+        if self.on_progress:
+            self.on_progress(stage, progress)
+
+    def _finish(self, stage, future, started, values):
+        elapsed = time.time() - started
+        self.elapsed[stage.name] = elapsed
+        try:
+            result = future.result()
+        except Exception as e:
+            self.status[stage.name] = "failed"
+            print(f"    → {stage.label} 실패: {e}")
+            self._notify(stage, "failed")
+            return
+
+        self.status[stage.name] = "done"
+        if stage.outputs:
+            for key in stage.outputs:
+                values[key] = result[key]
+
+        print(f"    → {stage.label} 완료 ({elapsed:.1f}초)")
+        if self.on_result:
+            self.on_result(stage, result)
+        self._notify(stage, "done")
+
+    def _finish_abandoned(self, stage, future):
+        """시간 초과 후 끝난 단계의 결과 (cancel_event로 멈춘 검사가 그때까지 찾은 결과)를 저장"""
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"    → {stage.label} 시간 초과 후 스레드 종료 (실패: {e})")
+            return
+        print(f"    → {stage.label} 시간 초과 후 스레드 종료, 중단 전까지의 결과 저장")
+        if self.on_result and result is not None:
+            self.on_result(stage, result)
+
+    def _skip(self, stage, reason):
+        self.status[stage.name] = "skipped"
+        print(f"    → {stage.label} 건너뜀 ({reason})")
+        self._notify(stage, "skipped")
+
+    def _notify(self, stage, status):
+        if self.on_status:
+            self.on_status(stage, status, self.elapsed.get(stage.name, 0.0))
@@ -7,6 +7,8 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+from add_in.results_model import ScanResults
+
 
 class ResultsController:
     """검사 결과 관리 클래스"""
@@ -120,35 +122,29 @@ class ResultsController:
             return vulnerabilities
 
         try:
-            categories = result_data.get("categories", {})
-
-            for category_id, category_data in categories.items():
-                tests = category_data.get("tests", [])
-
-                for test in tests:
-                    # 취약점이 있는 테스트만 추가
-                    if test.get("vulnerable_items", 0) > 0 or test.get("details"):
-                        details_list = test.get("details", [])
-
-                        # 각 상세 취약점별로 항목 생성
-                        if details_list:
-                            for detail in details_list:
-                                vulnerabilities.append({
-                                    "test_id": test.get("test_id", ""),
-                                    "test_name": test.get("test_name", ""),
-                                    "risk_level": test.get("risk_level", ""),
-                                    "location": detail.get("location", ""),
-                                    "details": detail  # 전체 상세 정보
-                                })
-                        else:
-                            # details가 없으면 테스트 정보만 추가
-                            vulnerabilities.append({
-                                "test_id": test.get("test_id", ""),
-                                "test_name": test.get("test_name", ""),
-                                "risk_level": test.get("risk_level", ""),
-                                "location": "N/A",
-                                "details": {}
-                            })
+            # 취약점이 있는 테스트만 추가
+            for test in ScanResults(result_data).vulnerable_tests():
+                details_list = test.get("details", [])
+
+                # 각 상세 취약점별로 항목 생성
+                if details_list:
+                    for detail in details_list:
+                        vulnerabilities.append({
+                            "test_id": test.get("test_id", ""),
+                            "test_name": test.get("test_name", ""),
+                            "risk_level": test.get("risk_level", ""),
+                            "location": detail.get("location", ""),
+                            "details": detail  # 전체 상세 정보
+                        })
+                else:
+                    # details가 없으면 테스트 정보만 추가
+                    vulnerabilities.append({
+                        "test_id": test.get("test_id", ""),
+                        "test_name": test.get("test_name", ""),
+                        "risk_level": test.get("risk_level", ""),
+                        "location": "N/A",
+                        "details": {}
+                    })
 
             print(f"✅ 취약점 {len(vulnerabilities)}개 추출 완료")
             return vulnerabilities
@@ -19,13 +19,14 @@ class ScanController:
         self.is_scanning = False
         self.scan_thread = None
 
-    def start_scan(self, url, gui_callback=None):
+    def start_scan(self, url, gui_callback=None, event_callback=None):
         """
         보안 검사 시작
 
         Args:
             url: 검사 대상 URL
-            gui_callback: GUI 업데이트용 콜백 함수
+            gui_callback: GUI 업데이트용 콜백 함수 (검사마다 전체 결과 전달)
+            event_callback: 진행 이벤트 콜백 함수 (새로 발견된 취약점/진행 상황만 전달)
 
         Returns:
             bool: 검사 시작 성공 여부
@@ -39,14 +40,14 @@ class ScanController:
         # 별도 스레드에서 검사 실행
         self.scan_thread = threading.Thread(
             target=self._run_scan_thread,
-            args=(url, gui_callback)
+            args=(url, gui_callback, event_callback)
         )
         self.scan_thread.daemon = True
         self.scan_thread.start()
 
         return True
 
-    def _run_scan_thread(self, url, gui_callback):
+    def _run_scan_thread(self, url, gui_callback, event_callback=None):
         """별도 스레드에서 검사 실행"""
         try:
             print(f"🚀 검사 시작: {url}")
@@ -57,7 +58,7 @@ class ScanController:
             os.chdir(project_path)
 
             # main_test.py import 및 실행
-            result = self._execute_main_test(project_path, gui_callback)
+            result = self._execute_main_test(project_path, gui_callback, event_callback)
 
             # 원래 경로로 복원
             os.chdir(original_path)
@@ -83,7 +84,7 @@ class ScanController:
         project_path = os.path.dirname(gui_dir)
         return project_path
 
-    def _execute_main_test(self, project_path, gui_callback):
+    def _execute_main_test(self, project_path, gui_callback, event_callback=None):
         """main_test.py 실행"""
         import importlib
 
@@ -97,7 +98,7 @@ class ScanController:
             from main_test import main_security_test
 
         # main_test 실행
-        result = main_security_test(gui_callback=gui_callback)
+        result = main_security_test(gui_callback=gui_callback, event_callback=event_callback)
         return result
 
     def is_running(self):
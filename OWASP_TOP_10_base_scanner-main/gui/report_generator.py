@@ -31,6 +31,8 @@ class SecurityReportGenerator:
         "A03-01": "SQL Injection",
         "A03-02": "Command Injection",
         "A03-03": "XSS (Cross-Site Scripting)",
+        "A03-04": "XSS 동적 검사 (브라우저 실행 확인)",
+        "A03-05": "SQL Injection 동적 검사",
         "A04": "Insecure Design",
         "A04-01": "Rate Limiting 부재",
         "A04-02": "파일 시스템 접근 제어 취약점",
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from add_in.results_model import ScanResults
+
 try:
     from ..controllers import ScanController, ConfigManager
 except ImportError:
@@ -436,13 +438,13 @@ class DastView:
                 self.tree_view.delete(item)
             self.vulnerability_data.clear()
 
-            # GUI 콜백 함수 정의
-            def gui_update_callback(results_json):
+            # 진행 이벤트 콜백 (새로 발견된 취약점만 받아서 표에 추가)
+            def gui_event_callback(event):
                 # 메인 스레드에서 GUI 업데이트
-                self.main_window.root.after(0, lambda: self.update_vulnerability_list(results_json))
+                self.main_window.root.after(0, lambda: self.handle_scan_event(event))
 
             # ScanController로 검사 시작
-            success = self.scan_controller.start_scan(url, gui_update_callback)
+            success = self.scan_controller.start_scan(url, event_callback=gui_event_callback)
 
             if not success:
                 messagebox.showwarning("경고", "이미 검사가 진행 중입니다.")
@@ -481,41 +483,18 @@ class DastView:
 
             vulnerability_count = 0
 
-            for category_id, category_data in scan_results['categories'].items():
-                for test in category_data.get('tests', []):
-                    details = test.get('details', [])
-                    if details:  # 취약점이 발견된 경우만
-                        test_id = test.get('test_id', '')
-                        test_name = test.get('test_name', '알 수 없음')
-                        risk_level = test.get('risk_level', '미분류')
-
-                        # details 배열의 각 개별 취약점마다 테이블 행 생성
-                        for detail in details:
-                            vulnerability_count += 1
-
-                            # 테이블에 개별 취약점 추가 (텍스트 길이 제한)
-                            location = detail.get('location', 'N/A')
-                            
-                            # 동적 텍스트 길이 제한 (컬럼 크기에 따라)
-                            truncated_test_id = self._truncate_text(test_id, self._get_dynamic_truncate_length("test_id"))
-                            truncated_test_name = self._truncate_text(test_name, self._get_dynamic_truncate_length("test_name"))
-                            truncated_risk_level = self._truncate_text(risk_level, self._get_dynamic_truncate_length("risk_level"))
-                            truncated_location = self._truncate_text(location, self._get_dynamic_truncate_length("location"))
-                            
-                            self.tree_view.insert("", "end", values=(
-                                truncated_test_id, 
-                                truncated_test_name, 
-                                truncated_risk_level, 
-                                truncated_location
-                            ))
-
-                            # 상세 데이터 저장 (개별 취약점 정보)
-                            self.vulnerability_data.append({
-                                'test_id': test_id,
-                                'test_name': test_name,
-                                'risk_level': risk_level,
-                                'detail': detail  # 개별 취약점 하나만 저장
-                            })
+            # details 배열의 각 개별 취약점마다 테이블 행 생성
+            for test, detail in ScanResults(scan_results).findings():
+                vulnerability_count += 1
+                vuln = {
+                    'test_id': test.get('test_id', ''),
+                    'test_name': test.get('test_name', '알 수 없음'),
+                    'risk_level': test.get('risk_level', '미분류'),
+                    'detail': detail  # 개별 취약점 하나만 저장
+                }
+                self.vulnerability_data.append(vuln)
+                if self._matches_filter(vuln):
+                    self._insert_vulnerability_row(vuln)
 
             if vulnerability_count == 0:
                 self.update_detail_text("취약점이 발견되지 않았습니다.")
@@ -525,19 +504,71 @@ class DastView:
         except Exception as e:
             print(f"❌ 취약점 목록 업데이트 실패: {e}")
 
+    def handle_scan_event(self, event):
+        """
+        검사 진행 이벤트 처리 (main_test.main_security_test의 event_callback)
+        새 취약점은 표에 행만 추가하므로 갱신 비용이 전체 결과 크기와 무관함
+        """
+        try:
+            event_type = event.get("type")
+
+            if event_type == "findings":
+                for detail in event.get("details", []):
+                    vuln = {
+                        'test_id': event.get('test_id', ''),
+                        'test_name': event.get('test_name') or '알 수 없음',
+                        'risk_level': event.get('risk_level') or '미분류',
+                        'detail': detail  # 개별 취약점 하나만 저장
+                    }
+                    self.vulnerability_data.append(vuln)
+                    if self._matches_filter(vuln):
+                        self._insert_vulnerability_row(vuln)
+
+            elif event_type == "progress":
+                self.update_detail_text(
+                    f"검사 진행 중: {event['done']}/{event['total']}개 검사 완료, "
+                    f"{event['findings']}개의 취약점이 발견되었습니다."
+                )
+
+            elif event_type == "test_progress":
+                total = event.get("candidates", event.get("forms", 0))
+                self.update_detail_text(
+                    f"{event['label']} 진행 중: {event['done']}/{total}개 확인, "
+                    f"{event['found']}개 발견"
+                )
+
+            elif event_type == "scan_finished":
+                vulnerability_count = len(self.vulnerability_data)
+                if vulnerability_count == 0:
+                    self.update_detail_text("취약점이 발견되지 않았습니다.")
+                else:
+                    self.update_detail_text(f"총 {vulnerability_count}개의 취약점이 발견되었습니다.\n취약점을 선택하면 상세 정보가 표시됩니다.")
+
+        except Exception as e:
+            print(f"❌ 검사 이벤트 처리 실패: {e}")
+
+    def _matches_filter(self, vuln):
+        return self.current_filter == "All" or vuln.get("test_id", "").startswith(self.current_filter)
+
+    def _insert_vulnerability_row(self, vuln):
+        """취약점 1개를 표 끝에 추가 (텍스트 길이 제한)"""
+        location = vuln.get('detail', {}).get('location', 'N/A')
+
+        # 동적 텍스트 길이 제한 (컬럼 크기에 따라)
+        self.tree_view.insert("", "end", values=(
+            self._truncate_text(vuln.get('test_id', ''), self._get_dynamic_truncate_length("test_id")),
+            self._truncate_text(vuln.get('test_name', '알 수 없음'), self._get_dynamic_truncate_length("test_name")),
+            self._truncate_text(vuln.get('risk_level', '미분류'), self._get_dynamic_truncate_length("risk_level")),
+            self._truncate_text(location, self._get_dynamic_truncate_length("location"))
+        ))
+
     def get_filtered_vulnerabilities(self):
         """현재 필터에 따라 취약점 데이터 필터링"""
         if self.current_filter == "All":
             return self.vulnerability_data
-        
+
         # A01-A10 필터 적용
-        filtered_data = []
-        for vuln in self.vulnerability_data:
-            test_id = vuln.get("test_id", "")
-            if test_id.startswith(self.current_filter):
-                filtered_data.append(vuln)
-        
-        return filtered_data
+        return [vuln for vuln in self.vulnerability_data if self._matches_filter(vuln)]
 
     def on_filter_change(self, event=None):
         """필터 변경 이벤트"""
@@ -564,25 +595,7 @@ class DastView:
 
         # 필터링된 데이터로 테이블 업데이트
         for vuln in display_data:
-            test_id = vuln.get('test_id', '')
-            test_name = vuln.get('test_name', '알 수 없음')
-            risk_level = vuln.get('risk_level', '미분류')
-            
-            detail = vuln.get('detail', {})
-            location = detail.get('location', 'N/A')
-            
-            # 동적 텍스트 길이 제한 (컬럼 크기에 따라)
-            truncated_test_id = self._truncate_text(test_id, self._get_dynamic_truncate_length("test_id"))
-            truncated_test_name = self._truncate_text(test_name, self._get_dynamic_truncate_length("test_name"))
-            truncated_risk_level = self._truncate_text(risk_level, self._get_dynamic_truncate_length("risk_level"))
-            truncated_location = self._truncate_text(location, self._get_dynamic_truncate_length("location"))
-            
-            self.tree_view.insert("", "end", values=(
-                truncated_test_id, 
-                truncated_test_name, 
-                truncated_risk_level, 
-                truncated_location
-            ))
+            self._insert_vulnerability_row(vuln)
 
         # 상세 정보 업데이트
         filtered_count = len(display_data)
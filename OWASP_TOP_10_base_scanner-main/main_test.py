@@ -1,4 +1,5 @@
-from add_in.crawl2 import start_crawl2
+from add_in.crawl2 import start_crawl2, load_crawl_settings
+# 검사 클래스는 import될 때 check_registry에 검사를 등록함
 from A01.A01_integration import BrokenAccessControl
 from A02.A02_integration import CryptographicFailures
 from A03.A03_integration import Injection
@@ -6,8 +7,21 @@ from A04.A04_integration import InsecureDesign
 from A05.A05_integration import SecurityMisconfiguration
 from A06.A06_integration import VulnerableComponents
 from A07.A07_integration import IDAuthFail
-from add_in.data_management import file_collection
+from add_in.data_management import (
+    file_collection, load_source_files, project_manifest, EXCLUDE_DIRS, MAX_FILE_SIZE, COLLECT_WORKERS
+)
+from add_in.sast_index import SastIndex
+from add_in.sast_pool import SAST_WORKERS, close_process_pool
+from add_in.source_lexer import clear_comment_cache
+from add_in.crawl_artifact import save_crawl_artifact, load_crawl_artifact, CRAWL_ARTIFACT
+from add_in.stage_scheduler import Stage, StageScheduler, STAGE_WORKERS, STAGE_TIMEOUT
+from add_in.check_registry import select_checks, create_instances, COSTS, PRIORITIES
+from add_in.scan_profiles import apply_scan_profile, describe_limits, SCAN_PROFILES
+from add_in import results_model
+from add_in.results_model import ScanResults
+from add_in.findings_stream import FindingsWriter, derive_results
 import asyncio
+import functools
 import json
 import os
 
@@ -36,24 +50,27 @@ def sample_path():
 #     except FileNotFoundError:
 #         return {"source_files": [], "dependency_files": []}
 
-def collect_and_save_project_files(project_path=None):
+def collect_and_save_project_files(project_path=None, save_manifest=True):
     """
-    프로젝트 폴더 스캔 및 manage_data.json 생성
+    프로젝트 폴더 스캔 및 manage_data.json(파일 목록 매니페스트) 생성
+    source_files는 SourceFile 목록이며, 내용은 각 검사가 파일별로 읽음
 
     경로 우선순위:
     1. CLI 인자로 전달된 project_path
     2. user_info.json의 Web_Dir (GUI에서 폴더 선택 시 자동 업데이트됨)
     """
+    try:
+        config = read_config()
+    except Exception as e:
+        print(f"⚠️ user_info.json 읽기 실패: {e}")
+        config = {}
+
     # 프로젝트 경로 결정
     if project_path is None:
         # user_info.json의 Web_Dir 사용
-        try:
-            config = read_config()
-            project_path = config.get("Web_Dir")
-            if project_path:
-                print(f"📁 user_info.json Web_Dir 사용: {project_path}")
-        except Exception as e:
-            print(f"⚠️ user_info.json 읽기 실패: {e}")
+        project_path = config.get("Web_Dir")
+        if project_path:
+            print(f"📁 user_info.json Web_Dir 사용: {project_path}")
 
     # 프로젝트 경로가 결정되지 않은 경우
     if not project_path:
@@ -70,12 +87,18 @@ def collect_and_save_project_files(project_path=None):
 
     print(f"🔍 프로젝트 폴더 스캔 중: {project_path}")
 
-    # data_management.py의 file_collection 함수 사용
-    collected_data = file_collection(project_path)
+    # data_management.py의 file_collection 함수 사용 (제외 디렉토리/크기 제한은 user_info.json에서 변경)
+    collected_data = file_collection(
+        project_path,
+        exclude_dirs=config.get("collect_exclude_dirs", EXCLUDE_DIRS),
+        max_file_size=config.get("collect_max_file_size", MAX_FILE_SIZE),
+        workers=config.get("collect_workers", COLLECT_WORKERS),
+    )
 
-    # manage_data.json에 저장
-    with open(MANAGE_DATA, "w", encoding="utf-8") as f:
-        json.dump(collected_data, f, indent=2, ensure_ascii=False)
+    # manage_data.json에 매니페스트 저장 (소스 파일 내용은 저장하지 않음)
+    if save_manifest:
+        with open(MANAGE_DATA, "w", encoding="utf-8") as f:
+            json.dump(project_manifest(collected_data), f, ensure_ascii=False)
 
     file_count = len(collected_data.get("source_files", []))
     dep_count = len(collected_data.get("dependency_files", []))
@@ -89,7 +112,9 @@ def load_manage_data():
     """manage_data.json에서 프로젝트 파일들 로드"""
     try:
         with open(MANAGE_DATA, "r", encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
+        data["source_files"] = load_source_files(data.get("source_files", []))
+        return data
     except FileNotFoundError:
         print("⚠️ manage_data.json이 없습니다. 프로젝트 스캔을 먼저 수행합니다.")
         return collect_and_save_project_files()
@@ -100,87 +125,13 @@ def load_clean_results_template():
         return json.load(f)
 
 def normalize_details(category_id, test_id, raw_details):
-    """
-    검사 파일에서 온 details에 추가 필드를 병합
-    - 검사 파일의 기존 데이터는 그대로 유지
-    - 공통 필드(timestamp 등)를 추가
-    """
-    if not raw_details:
-        return []
-
-    from datetime import datetime
-
-    details = []
-
-    for item in raw_details:
-        # 검사 파일에서 온 데이터를 복사 (원본 유지)
-        detail = dict(item)
-
-        # timestamp가 없으면 현재 시간 추가
-        if 'timestamp' not in detail:
-            detail['timestamp'] = datetime.now().isoformat()
-
-        # 공통 필드 정규화
-        # location 필드 통일 (url, path, file 등을 location으로)
-        if 'location' not in detail:
-            detail['location'] = (
-                detail.get('url') or
-                detail.get('path') or
-                detail.get('file') or
-                'N/A'
-            )
-            # 원본 필드 제거 (중복 방지)
-            detail.pop('url', None)
-            detail.pop('path', None)
-            detail.pop('file', None)
-
-        # description 필드 통일 (issue, description 등을 description으로)
-        if 'description' not in detail:
-            detail['description'] = (
-                detail.get('issue') or
-                'No description'
-            )
-            # 원본 필드 제거 (중복 방지)
-            detail.pop('issue', None)
-
-        details.append(detail)
-
-    return details
+    """검사 파일에서 온 details에 공통 필드(timestamp, location, description)를 병합"""
+    return results_model.normalize_details(raw_details)
 
 
 def merge_results(results_json, module_result, category_id=None, test_id=None):
-    """개별 모듈 결과를 통합 results에 병합 (표준화 적용)"""
-
-    if not module_result:
-        return results_json
-
-    # module_result가 details 배열인 경우
-    if isinstance(module_result, list) and category_id and test_id:
-        # 표준화 적용
-        normalized_details = normalize_details(category_id, test_id, module_result)
-
-        for final_test in results_json["categories"][category_id]["tests"]:
-            if final_test["test_id"] == test_id:
-                final_test["details"] = normalized_details
-                break
-    else:
-        # 기존 전체 JSON 구조인 경우 (다른 모듈들)
-        for cat_id, category_data in module_result["categories"].items():
-            for test in category_data["tests"]:
-                if test.get("vulnerable_items", 0) > 0 or test.get("details"):
-                    # 표준화 적용
-                    test["details"] = normalize_details(
-                        cat_id,
-                        test["test_id"],
-                        test.get("details", [])
-                    )
-
-                    # results_json에서 같은 test_id 찾아서 업데이트
-                    for final_test in results_json["categories"][cat_id]["tests"]:
-                        if final_test["test_id"] == test["test_id"]:
-                            final_test.update(test)
-                            break
-
+    """개별 모듈 결과를 통합 results에 병합 (dict를 직접 다룰 때, 여러 번 병합하면 ScanResults 사용)"""
+    ScanResults(results_json).merge(module_result, category_id, test_id)
     return results_json
 
 def calculate_final_summary(results, web_url=None, project_path=None):
@@ -192,293 +143,207 @@ def calculate_final_summary(results, web_url=None, project_path=None):
         web_url: 검사 대상 URL (선택)
         project_path: 검사 대상 프로젝트 폴더 경로 (선택)
     """
-    from datetime import datetime
-
-    total_tests = 0
-    total_vulnerabilities = 0
-    risk_counts = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0, "INFO": 0}
-
-    for category in results["categories"].values():
-        for test in category["tests"]:
-            if test.get("vulnerable_items", 0) > 0 or test.get("details"):
-                total_tests += 1
-                total_vulnerabilities += test.get("vulnerable_items", 0)
-                risk_level = test.get("risk_level", "")
-                if risk_level and risk_level in risk_counts:
-                    risk_counts[risk_level] += 1
-
-    results["summary"]["total_tests"] = total_tests
-    results["summary"]["total_vulnerabilities"] = total_vulnerabilities
-    results["summary"]["risk_distribution"] = risk_counts
+    ScanResults(results).summarize(web_url=web_url, project_path=project_path)
 
-    # 검사 시간 추가 (타임스탬프)
-    results["summary"]["scan_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    # 검사 대상 추가 (URL 또는 폴더)
-    if web_url:
-        results["summary"]["target_url"] = web_url
-    if project_path:
-        results["summary"]["target_folder"] = project_path
-
-
-def main_security_test(gui_callback=None):
+def build_security_stages(config, checks, crawl_artifact=None, sast_index=None, sast_workers=SAST_WORKERS,
+                          login_path="", login_data=None):
+    """
+    main_security_test의 검사 단계 목록
+    - checks: 실행할 검사 (check_registry.select_checks), 각 검사는 필요한 입력만 선언
+    - 선택된 검사가 필요로 하는 경우에만 크롤링/소스 수집 단계 추가
+    - 우선순위가 높은 검사부터, 같은 우선순위에서는 비싼 검사부터 시작하도록 정렬
+      (시간 예산이 부족하면 중요한 검사가 먼저 끝나고, 동시 실행 수가 제한되어도 전체 시간이 짧아짐)
+    - 검사별 제한 시간은 user_info.json의 stage_timeouts {test_id: 초}로 변경
+    """
+    web_url = config["web_url"]
+    timeouts = config.get("stage_timeouts", {})
+    needed = {key for info in checks for key in info.inputs}
+
+    def crawl(config):
+        if crawl_artifact:
+            print(f"📦 저장된 크롤링 결과 사용: {crawl_artifact}")
+            obj_list = load_crawl_artifact(crawl_artifact)
+        else:
+            obj_list = start_crawl2(web_url, login_path, login_data or {}, settings=load_crawl_settings(config))
+            save_crawl_artifact(obj_list, CRAWL_ARTIFACT, target=web_url)
+        print(f"✅ 크롤링 완료: {len(obj_list)}개 페이지 발견")
+        return {"obj_list": obj_list}
+
+    def collect():
+        # GUI에서 추가한 폴더 또는 기본 경로(WEB/PrestaShop) 스캔
+        manage_data = collect_and_save_project_files()
+        source_files = manage_data.get("source_files", [])
+        print(f"✅ 소스 코드 수집 완료: {len(source_files)}개 파일")
+        return {
+            "source_files": source_files,
+            "dependency_files": manage_data.get("dependency_files", []),
+            "project_path": manage_data.get("_project_path"),  # 사용된 프로젝트 경로
+        }
+
+    def save_sast_index():
+        if sast_index is not None:
+            try:
+                sast_index.save()
+            except Exception as e:
+                print(f"⚠️ 정적 분석 인덱스 저장 실패: {e}")
+        clear_comment_cache()
+
+    stages = []
+    if "obj_list" in needed:
+        stages.append(Stage("crawl", crawl, inputs=("config",), outputs=("obj_list",), label="🌐 웹 크롤링"))
+    if needed & {"source_files", "dependency_files"}:
+        stages.append(Stage("collect", collect, outputs=("source_files", "dependency_files", "project_path"),
+                            label="📁 프로젝트 소스 코드 수집"))
+
+    instances = create_instances(checks, index=sast_index, workers=sast_workers)
+    for info in sorted(checks, key=lambda info: (-PRIORITIES[info.priority], -COSTS[info.cost])):
+        func = functools.partial(info.run, instances[info.cls])
+        stages.append(Stage(info.test_id, func, inputs=info.inputs, timeout=timeouts.get(info.test_id),
+                            label=f"{info.test_id} {info.label}",
+                            category_id=info.category_id, test_id=info.test_id))
+
+    source_checks = [info.test_id for info in checks if "source_files" in info.inputs]
+    if source_checks:
+        stages.append(Stage("sast_save", save_sast_index, after=source_checks, label="🗂️ 정적 분석 인덱스 저장"))
+
+    return stages
+
+
+def main_security_test(gui_callback=None, crawl_artifact=None, only=None, skip=None, skip_expensive=False,
+                       profile=None, time_budget=None, event_callback=None):
     """
     통합 보안 테스트 실행 함수
     1. 크롤링 (웹 페이지 수집)
     2. data_management 실행 (소스 코드 수집)
-    3. 모든 A01~A05 테스트 수행
+    3. 모든 A01~A07 테스트 수행
+    각 검사는 필요한 입력(크롤링 결과, 소스 파일 등)이 준비되는 대로 동시에 실행되며,
+    검사가 끝날 때마다 결과를 병합해서 gui_callback으로 전달
     results.json 형식으로 통합된 결과 반환
+
+    Args:
+        gui_callback: 검사가 끝날 때마다 전체 결과(results.json 형식)를 받는 함수
+        event_callback: 진행 이벤트(dict)를 받는 함수, 새로 발견된 취약점만 전달하므로 GUI 표에 행을 추가만 하면 됨
+            - {"type": "scan_started", "total": 검사 수}
+            - {"type": "test_started" / "test_finished", "test_id", "label", "status", "elapsed"}
+            - {"type": "test_progress", "test_id", "label", ...검사별 진행 카운터} (A03-04 XSS: candidates / done / probes /
+              found / cancelled, A03-05 SQLi: forms / done / probes / found / cancelled)
+            - {"type": "findings", "test_id", "test_name", "risk_level", "details": [새 취약점]}
+            - {"type": "progress", "done": 끝난 검사 수, "total": 검사 수, "findings": 누적 취약점 수}
+            - {"type": "scan_finished", "summary": 최종 summary, "path": 결과 파일 경로}
+        crawl_artifact: 저장된 크롤링 결과 파일 경로 (지정하면 크롤링 없이 재사용)
+        only: 실행할 카테고리/검사 (예: "A03,A05-01"), 없으면 전체
+        skip: 제외할 카테고리/검사
+        skip_expensive: 비용이 큰(heavy) 검사 제외
+        profile: 검사 프로필 quick / standard / deep / full (없으면 user_info.json의 scan_profile, 기본 full)
+        time_budget: 전체 검사 시간 예산(초), 없으면 프로필 값
     """
     # 테스트 대상 URL 설정
     login_path = ""  # 필요시 로그인 경로 설정
     login_data = {}  # 필요시 로그인 데이터 설정
 
-    config = read_config()
+    config = apply_scan_profile(read_config(), profile)
     web_url = config["web_url"]
+    time_budget = time_budget or config.get("scan_time_budget")
 
     print(f"\n{'='*60}")
     print(f"통합 보안 취약점 검사 시작")
     print(f"대상 URL: {web_url}")
+    print(f"검사 프로필: {config['scan_profile']} (시간 예산: {f'{time_budget}초' if time_budget else '없음'})")
+    print(f"작업량 제한: {describe_limits(config)}")
     print(f"{'='*60}")
 
-    # 1. 깨끗한 results.json 템플릿 로드
-    results_json = load_clean_results_template()
-
-    # 2. 크롤링 수행 (웹 페이지 수집)
-    print(f"\n{'='*60}")
-    print(f"🌐 1단계: 웹 크롤링")
-    print(f"{'='*60}")
-    obj_list = start_crawl2(web_url, login_path, login_data)
-    print(f"✅ 크롤링 완료: {len(obj_list)}개 페이지 발견")
+    # 1. 깨끗한 results.json 템플릿 로드 (test_id 인덱스로 결과 병합)
+    results = ScanResults(load_clean_results_template())
+    results_json = results.data
 
-    # 3. 프로젝트 폴더 스캔 (data_management 실행)
-    print(f"\n{'='*60}")
-    print(f"📁 2단계: 프로젝트 소스 코드 수집")
-    print(f"{'='*60}")
-
-    # GUI에서 추가한 폴더 또는 기본 경로(WEB/PrestaShop) 스캔
-    manage_data = collect_and_save_project_files()
-    source_files = manage_data.get("source_files", [])
-    dependency_files = manage_data.get("dependency_files", [])
-
-    project_path = manage_data.get("_project_path")  # 사용된 프로젝트 경로 추출
-
-    print(f"✅ 소스 코드 수집 완료: {len(source_files)}개 파일")
+    # 검사 결과 파일 (검사가 끝날 때마다 findings.jsonl에 추가, 마지막에 result_*.json 생성)
+    from datetime import datetime
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_dir = os.path.join(PROJECT_ROOT, "results")
+    timestamped_results_path = os.path.join(results_dir, f"result_{timestamp}.json")
+    findings_path = os.path.join(results_dir, f"result_{timestamp}.findings.jsonl")
+    writer = FindingsWriter(findings_path, target=web_url, profile=config["scan_profile"])
+    print(f"검사 결과 기록: {findings_path}")
 
-    # 4. 보안 취약점 검사 시작
+    # 2. 검사 단계 구성 (크롤링/소스 수집 → 각 검사, 입력이 준비된 검사부터 동시에 실행)
     print(f"\n{'='*60}")
-    print(f"🔍 3단계: 보안 취약점 검사")
+    print(f"🔍 웹 크롤링 / 소스 코드 수집 / 보안 취약점 검사")
     print(f"{'='*60}")
 
-    # A01 - CSRF 취약점 검사
-    print(f"\n[A01] Broken Access Control 검사...")
-    try:
-        a01_checker = BrokenAccessControl()
-
-        print(f"    A01-1: CSRF 검사...")
-        a01_csrf = a01_checker.csrf_run(obj_list, config)
-        print(a01_csrf)
-        # exit(-1)
-        results_json = merge_results(results_json, a01_csrf, "A01", "A01-01")
-
-        
-        if gui_callback:
-            gui_callback(results_json)
-
-        print(f"    → A01 CSRF 검사 완료")
-    except Exception as e:
-        print(f"    → A01 취약점 검사 실패: {e}")
-    
-    # 4. A02 - 암호화 취약점 검사
-    print(f"\nA02 - Cryptographic Failures 검사...")
-    a02_checker = CryptographicFailures()
-
-    # A02-1: 암호화 알고리즘 검사
-    try:
-        print(f"    A02-1: 취약한 암호화 알고리즘 검사...")
-        a02_crypto = a02_checker.check_cryptographic_run(source_files)
-        results_json = merge_results(results_json, a02_crypto, "A02", "A02-01")
-
-        if gui_callback:
-            gui_callback(results_json)
-
-        print(f"    → A02-1 암호화 알고리즘 검사 완료")
-    except Exception as e:
-        print(f"    → A02-1 암호화 알고리즘 검사 실패: {e}")
-
-    # A02-2: HTTPS 보안 검사
-    try:
-        print(f"    A02-2: HTTPS 보안 검사...")
-        a02_https = a02_checker.check_https_run(web_url)
-        results_json = merge_results(results_json, a02_https, "A02", "A02-02")
-
+    # A02/A03 정적 분석 인덱스 (변경되지 않은 파일은 이전 스캔 결과 재사용)
+    sast_index = SastIndex() if config.get("sast_cache", True) else None
+    sast_workers = config.get("sast_workers") or SAST_WORKERS  # 0이면 CPU 수
+
+    checks = select_checks(only=only, skip=skip, max_cost="medium" if skip_expensive else None)
+    print(f"실행할 검사: {', '.join(info.test_id for info in checks) or '없음'}")
+    stages = build_security_stages(config, checks, crawl_artifact, sast_index, sast_workers, login_path, login_data)
+
+    def emit(event):
+        if event_callback:
+            event_callback(event)
+
+    progress = {"done": 0, "total": len(checks), "findings": 0}
+    emit({"type": "scan_started", "total": len(checks)})
+
+    def on_status(stage, status, elapsed):
+        """검사 시작/종료 이벤트와 진행 카운터 전달 (크롤링 등 검사가 아닌 단계는 제외)"""
+        if not stage.test_id:
+            return
+        if status == "running":
+            emit({"type": "test_started", "test_id": stage.test_id, "label": stage.label})
+            return
+        progress["done"] += 1
+        emit({"type": "test_finished", "test_id": stage.test_id, "label": stage.label,
+              "status": status, "elapsed": elapsed})
+        emit(dict(progress, type="progress"))
+
+    def on_progress(stage, counters):
+        """검사 내부 진행 카운터 전달 (검사 스레드에서 호출, GUI는 event_callback에서 메인 스레드로 넘김)"""
+        if stage.test_id:
+            emit(dict(counters, type="test_progress", test_id=stage.test_id, label=stage.label))
+
+    def on_result(stage, result):
+        """단계가 끝날 때마다 결과를 병합해서 파일에 기록하고 GUI에 바로 전달"""
+        if not stage.test_id:
+            return
+        for category_id, test in results.merge(result, stage.category_id, stage.test_id):
+            writer.write_test(category_id, test)
+            details = test.get("details", [])
+            if details:
+                progress["findings"] += len(details)
+                emit({"type": "findings", "test_id": test.get("test_id"), "test_name": test.get("test_name"),
+                      "risk_level": test.get("risk_level"), "details": details})
+            if not gui_callback:
+                test["details"] = []  # 파일에 기록했으므로 메모리에서 해제 (최종 결과는 파일로 다시 만듦)
         if gui_callback:
             gui_callback(results_json)
 
-        print(f"    → A02-2 HTTPS 보안 검사 완료")
-    except Exception as e:
-        print(f"    → A02-2 HTTPS 보안 검사 실패: {e}")
-    
-    #5. A03 - 인젝션 취약점 검사
-    print(f"\n A03 - Injection 검사...")
-    a03_checker = Injection()
-
-    # A03-1: XSS 검사
-    try:
-        print(f"    A03-1: XSS 취약점 검사...")
-        a03_xss = a03_checker.xss_run(source_files)
-        results_json = merge_results(results_json, a03_xss, "A03", "A03-01")
-
-        if gui_callback:
-            gui_callback(results_json)
-
-        print(f"    → A03-1 XSS 검사 완료")
-    except Exception as e:
-        print(f"    → A03-1 XSS 검사 실패: {e}")
-
-    # A03-2: SQL Injection 검사
-    try:
-        print(f"    A03-2: SQL Injection 취약점 검사...")
-        a03_sqli = a03_checker.sqli_run(source_files)
-        results_json = merge_results(results_json, a03_sqli, "A03", "A03-02")
-
-        if gui_callback:
-            gui_callback(results_json)
-
-        print(f"    → A03-2 SQL Injection 검사 완료")
-    except Exception as e:
-        print(f"    → A03-2 SQL Injection 검사 실패: {e}")
-
-    # A03-3: Command Injection 검사
-    try:
-        print(f"    A03-3: Command Injection 취약점 검사...")
-        a03_command = a03_checker.command_injection_run(source_files)
-        results_json = merge_results(results_json, a03_command, "A03", "A03-03")
-
-        if gui_callback:
-            gui_callback(results_json)
-
-        print(f"    → A03-3 Command Injection 검사 완료")
-    except Exception as e:
-        print(f"    → A03-3 Command Injection 검사 실패: {e}")
-
-    # 6. A04 - 접근 제어 취약점 검사
-    print(f"\n A04 - 접근 제어 취약점 검사...")
-    a04_checker = InsecureDesign()
-
-    # A04-1: Rate Limiting 검사
-    try:
-        print(f"    A04-1: Rate Limiting 검사...")
-        a04_rate = a04_checker.rate_limit_run(obj_list, config)
-        results_json = merge_results(results_json, a04_rate, "A04", "A04-01")
-
-        if gui_callback:
-            gui_callback(results_json)
-
-        print(f"    → A04-1 Rate Limiting 검사 완료")
-    except Exception as e:
-        print(f"    → A04-1 Rate Limiting 검사 실패: {e}")
-
-    # A04-2: 접근 제어 검사
-    try:
-        print(f"    A04-2: 접근 제어 취약점 검사...")
-        web_directory = config.get("Web_Dir", config.get("web_directory", ""))
-        a04_access = a04_checker.access_control_run(web_directory)
-        results_json = merge_results(results_json, a04_access, "A04", "A04-02")
-
-        if gui_callback:
-            gui_callback(results_json)
-
-        print(f"    → A04-2 접근 제어 검사 완료")
-    except Exception as e:
-        print(f"    → A04-2 접근 제어 검사 실패: {e}")
-
-    # A04-3: 권한 우회 검사
-    try:
-        print(f"    A04-3: 권한 우회 취약점 검사...")
-        a04_permission = a04_checker.permission_bypass_run(config)
-        results_json = merge_results(results_json, a04_permission, "A04", "A04-03")
-
-        if gui_callback:
-            gui_callback(results_json)
-
-        print(f"    → A04-3 권한 우회 검사 완료")
-    except Exception as e:
-        print(f"    → A04-3 권한 우회 검사 실패: {e}")
-    
-    # 7. A05 - 보안 설정 오류 검사
-    print(f"\n A05 - 보안 설정 오류 검사...")
-    a05_checker = SecurityMisconfiguration()
-
-    # A05-1: 취약한 헤더 검사
-    try:
-        print(f"    A05-1: 취약한 HTTP 헤더 검사...")
-        a05_header = a05_checker.check_vulnerable_run(obj_list)
-        results_json = merge_results(results_json, a05_header, "A05", "A05-01")
-
-        if gui_callback:
-            gui_callback(results_json)
-
-        print(f"    → A05-1 HTTP 헤더 검사 완료")
-    except Exception as e:
-        print(f"    → A05-1 HTTP 헤더 검사 실패: {e}")
-
-    # A05-2: 포트 스캔
-    try:
-        print("    A05-2: 포트 보안 스캔...")
-        a05_port = a05_checker.port_security_run(config)
-        results_json = merge_results(results_json, a05_port, "A05", "A05-02")
-
-        if gui_callback:
-            gui_callback(results_json)
-
-        print(f"    → A05-2 포트 보안 스캔 완료")
-    except Exception as e:
-        print(f"    → A05-2 포트 보안 스캔 실패: {e}")
-
-    # A05-3: 기본 계정 침투 테스트
-    try:
-        print(f"    A05-3: 기본 계정 침투 테스트...")
-        a05_brute = a05_checker.default_account_run(config)
-        results_json = merge_results(results_json, a05_brute, "A05", "A05-03")
-
-        if gui_callback:
-            gui_callback(results_json)
-
-        print(f"    → A05-3 기본 계정 침투 테스트 완료")
-    except Exception as e:
-        print(f"    → A05-3 기본 계정 침투 테스트 실패: {e}")
-    
-    # 8. A06 - 취약하고 지원되지 않는 구성 요소 검사
-    print(f"\n A06 - 취약하고 지원되지 않는 구성 요소 검사...")
-    try:
-        a06_checker = VulnerableComponents()
-        # sample_data = sample_path()
-        # dependency_files = sample_data
-
-        # A06-1: 취약한 라이브러리 검사
-        print(f"    A06-1: 취약한 라이브러리 검사...")
-        a06_vuln = a06_checker.vulnerability_library_run(dependency_files)
-        results_json = merge_results(results_json, a06_vuln, "A06", "A06-01")
-    except Exception as e:
-        print(f"    → A06 취약하고 지원되지 않는 구성 요소 검사 실패: {e}")
-        
-    # 8. A07 - 세션 관리 취약점 검사
-    print(f"\n A07 - 세션 관리 취약점 검사...")
+    scheduler = StageScheduler(
+        stages,
+        workers=config.get("stage_workers") or STAGE_WORKERS,
+        timeout=config.get("stage_timeout") or STAGE_TIMEOUT,
+        on_result=on_result,
+        budget=time_budget,
+        on_status=on_status,
+        on_progress=on_progress,
+    )
     try:
-        a07_checker = IDAuthFail()
-        # A07-1: 세션 고정 검사
-        print(f"    A07-1: 세션 고정 취약점 검사...")
-        a07_session = a07_checker.session_management_run(config)
-        results_json = merge_results(results_json, a07_session, "A07", "A07-01")
-    except Exception as e:
-        print(f"    → A07 세션 관리 취약점 검사 실패: {e}")
+        values = scheduler.run({
+            "config": config,
+            "web_url": web_url,
+            "web_directory": config.get("Web_Dir", config.get("web_directory", "")),
+        })
+    finally:
+        writer.close(scheduler.status)
+        close_process_pool()
+    project_path = values.get("project_path")
+
+    # 8. 최종 요약 정보 계산 (기록된 findings.jsonl에서 최종 결과 생성)
+    results = derive_results(findings_path, load_clean_results_template())
+    results_json = results.data
+    results.summarize(web_url=web_url, project_path=project_path)
 
-    # 8. 최종 요약 정보 계산
-    calculate_final_summary(results_json, web_url=web_url, project_path=project_path)
-    
-    print(json.dumps(results_json, indent=2, ensure_ascii=False))
-    
     # 9. 통합된 최종 결과 출력
     print(f"\n{'='*60}")
     print(f"통합 보안 검사 결과")
@@ -489,13 +354,6 @@ def main_security_test(gui_callback=None):
     print(f"{'='*60}")
     
     # 최종 결과를 파일로 저장 (타임스탬프 포함)
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    results_dir = os.path.join(PROJECT_ROOT, "results")
-
-    # 타임스탬프가 포함된 파일명
-    timestamped_results_path = os.path.join(results_dir, f"result_{timestamp}.json")
-
     # 최신 결과를 가리키는 파일 (호환성 유지)
     final_results_path = os.path.join(results_dir, "final_results.json")
 
@@ -510,7 +368,8 @@ def main_security_test(gui_callback=None):
 
     except Exception as e:
         print(f"결과 파일 저장 중 오류 발생: {e}")
-    
+
+    emit({"type": "scan_finished", "summary": results_json["summary"], "path": timestamped_results_path})
     return results_json
 
 
@@ -523,6 +382,36 @@ if __name__ == "__main__":
         type=str,
         help="검사할 프로젝트 폴더 경로 (지정하지 않으면 GUI 선택 경로 또는 기본 경로 사용)"
     )
+    parser.add_argument(
+        "--crawl-artifact",
+        type=str,
+        help=f"저장된 크롤링 결과(JSON Lines)로 검사 (크롤링 생략, 매 크롤링 결과는 {CRAWL_ARTIFACT}에 저장됨)"
+    )
+    parser.add_argument(
+        "--only",
+        type=str,
+        help="실행할 카테고리/검사 (쉼표로 구분, 예: A03,A05-01)"
+    )
+    parser.add_argument(
+        "--skip",
+        type=str,
+        help="제외할 카테고리/검사 (쉼표로 구분)"
+    )
+    parser.add_argument(
+        "--skip-expensive",
+        action="store_true",
+        help="오래 걸리는 검사(권한 우회, 포트 스캔, 기본 계정 등) 제외"
+    )
+    parser.add_argument(
+        "--profile",
+        choices=list(SCAN_PROFILES),
+        help="검사 프로필 (quick: 약 5분, standard: 약 30분, deep: 제한 없음, full: 기존과 같은 범위, 기본값)"
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=int,
+        help="전체 검사 시간 예산(초), 넘으면 남은 검사는 건너뜀"
+    )
     args = parser.parse_args()
 
     # CLI에서 경로를 지정한 경우 먼저 스캔 수행
@@ -530,5 +419,12 @@ if __name__ == "__main__":
         print(f"📁 CLI 인자 경로 사용: {args.project_path}")
         collect_and_save_project_files(project_path=args.project_path)
 
-    main_security_test()
+    main_security_test(
+        crawl_artifact=args.crawl_artifact,
+        only=args.only,
+        skip=args.skip,
+        skip_expensive=args.skip_expensive,
+        profile=args.profile,
+        time_budget=args.time_budget,
+    )
 